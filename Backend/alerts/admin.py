@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import WatchlistItem, DrugAlert
+
+
+@admin.register(WatchlistItem)
+class WatchlistItemAdmin(admin.ModelAdmin):
+    list_display = ('drug_name', 'normalized_name', 'user', 'created_at')
+    search_fields = ('drug_name', 'normalized_name', 'user__email')
+    readonly_fields = ('normalized_name', 'created_at')
+
+
+@admin.register(DrugAlert)
+class DrugAlertAdmin(admin.ModelAdmin):
+    list_display = ('user', 'event', 'is_read', 'created_at')
+    list_filter = ('is_read', 'created_at')
+    search_fields = ('user__email', 'event__drug_name')
+    raw_id_fields = ('user', 'event', 'watchlist_item')
+    readonly_fields = ('created_at',)
@@ -0,0 +1,97 @@
+"""
+Recall alert engine
+
+Matches newly inserted DrugEvent rows against user watchlists and creates
+DrugAlert rows. Only the new events are looked at: their names are turned
+into match keys and a single indexed query on WatchlistItem.normalized_name
+builds an inverted index (key -> subscribers) restricted to those keys.
+The cost therefore grows with the number of new events and the number of
+matching subscriptions, never with users x events.
+"""
+import logging
+from collections import defaultdict
+
+from .models import DrugAlert, WatchlistItem
+from .normalization import match_keys
+
+logger = logging.getLogger(__name__)
+
+
+def build_subscriber_index(keys):
+    """
+    Build an inverted index from normalized drug name to subscribers
+
+    Args:
+        keys: iterable of normalized drug names
+
+    Returns:
+        dict: normalized name -> list of (user_id, watchlist_item_id)
+    """
+    index = defaultdict(list)
+    keys = list(keys)
+    if not keys:
+        return index
+
+    rows = WatchlistItem.objects.filter(
+        normalized_name__in=keys,
+        user__is_active=True,
+    ).values_list('normalized_name', 'user_id', 'id')
+
+    for normalized_name, user_id, item_id in rows:
+        index[normalized_name].append((user_id, item_id))
+    return index
+
+
+def dispatch_alerts(events):
+    """
+    Create alerts for freshly inserted drug events
+
+    Args:
+        events: iterable of saved DrugEvent instances (only pk and
+            drug_name are used)
+
+    Returns:
+        int: number of matches found (alerts that already exist are
+            skipped by the unique constraint)
+    """
+    keys_by_event = {}
+    for event in events:
+        if event.pk is None:
+            continue
+        keys = match_keys(event.drug_name)
+        if keys:
+            keys_by_event[event.pk] = keys
+
+    if not keys_by_event:
+        return 0
+
+    index = build_subscriber_index(set().union(*keys_by_event.values()))
+    if not index:
+        return 0
+
+    alerts = []
+    seen = set()
+    for event_id, keys in keys_by_event.items():
+        for key in keys:
+            for user_id, item_id in index.get(key, ()):
+                if (user_id, event_id) in seen:
+                    continue
+                seen.add((user_id, event_id))
+                alerts.append(DrugAlert(
+                    user_id=user_id,
+                    event_id=event_id,
+                    watchlist_item_id=item_id,
+                ))
+
+    DrugAlert.objects.bulk_create(alerts, batch_size=1000, ignore_conflicts=True)
+    logger.info(f"Created {len(alerts)} drug alerts for {len(keys_by_event)} new events")
+    return len(alerts)
+
+
+def dispatch_alerts_safely(events):
+    """Run dispatch_alerts without letting alert failures break a scrape"""
+    try:
+        return dispatch_alerts(events)
+    except Exception as e:
+        logger.error(f"Error dispatching drug alerts: {str(e)}")
+        return 0
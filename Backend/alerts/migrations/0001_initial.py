@@ -0,0 +1,61 @@
+# Generated by Django 4.2.11 on 2026-10-19 12:45
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('scraper', '0002_drugevent_description_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WatchlistItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('drug_name', models.CharField(help_text='Drug name as entered by the user', max_length=255)),
+                ('normalized_name', models.CharField(db_index=True, editable=False, help_text='Lowercase, accent-free drug name used as the inverted index key', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='watchlist', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Watchlist Item',
+                'verbose_name_plural': 'Watchlist Items',
+                'ordering': ['drug_name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DrugAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_read', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alerts', to='scraper.drugevent')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='drug_alerts', to=settings.AUTH_USER_MODEL)),
+                ('watchlist_item', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='alerts', to='alerts.watchlistitem')),
+            ],
+            options={
+                'verbose_name': 'Drug Alert',
+                'verbose_name_plural': 'Drug Alerts',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='watchlistitem',
+            constraint=models.UniqueConstraint(fields=('user', 'normalized_name'), name='unique_user_watched_drug'),
+        ),
+        migrations.AddIndex(
+            model_name='drugalert',
+            index=models.Index(fields=['user', 'is_read', '-created_at'], name='alerts_drug_user_id_6ba985_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='drugalert',
+            constraint=models.UniqueConstraint(fields=('user', 'event'), name='unique_user_event_alert'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.db import models
+
+from .normalization import normalize_drug_name
+
+
+class WatchlistItem(models.Model):
+    """A drug name a user (usually a pharmacy) wants to be alerted about"""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='watchlist',
+    )
+    drug_name = models.CharField(
+        max_length=255,
+        help_text="Drug name as entered by the user"
+    )
+    normalized_name = models.CharField(
+        max_length=255,
+        db_index=True,
+        editable=False,
+        help_text="Lowercase, accent-free drug name used as the inverted index key"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['drug_name']
+        verbose_name = 'Watchlist Item'
+        verbose_name_plural = 'Watchlist Items'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'normalized_name'],
+                name='unique_user_watched_drug'
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        self.normalized_name = normalize_drug_name(self.drug_name)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.user} -> {self.drug_name}"
+
+
+class DrugAlert(models.Model):
+    """Notification that a new DrugEvent matched an item on a user's watchlist"""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='drug_alerts',
+    )
+    event = models.ForeignKey(
+        'scraper.DrugEvent',
+        on_delete=models.CASCADE,
+        related_name='alerts',
+    )
+    watchlist_item = models.ForeignKey(
+        WatchlistItem,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='alerts',
+    )
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Drug Alert'
+        verbose_name_plural = 'Drug Alerts'
+        indexes = [
+            models.Index(fields=['user', 'is_read', '-created_at']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'event'],
+                name='unique_user_event_alert'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user}: {self.event}"
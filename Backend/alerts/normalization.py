@@ -0,0 +1,50 @@
+"""
+Drug name normalization shared by watchlists and the alert engine
+"""
+import re
+import unicodedata
+
+# Tokens shorter than this are ignored when matching single words
+# (strength units, "mg", "ml" etc. would otherwise match everything)
+MIN_TOKEN_LENGTH = 3
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_drug_name(name):
+    """
+    Normalize a drug name to a stable matching key
+
+    Lowercases, strips Polish/Latin diacritics and collapses punctuation
+    and whitespace, so "Paracetamol  Polpharma®" -> "paracetamol polpharma".
+    """
+    if not name:
+        return ''
+
+    # "ł" has no decomposition in NFKD, handle it explicitly
+    name = name.replace('ł', 'l').replace('Ł', 'L')
+    decomposed = unicodedata.normalize('NFKD', name)
+    ascii_name = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(' ', ascii_name.lower()).strip()
+
+
+def match_keys(drug_name):
+    """
+    Return all watchlist keys a drug event name can match
+
+    A watchlist entry matches the whole normalized name, any run of
+    consecutive words of it or any single word of it, e.g.
+    "Kwas acetylosalicylowy Polfa" is matched by "kwas acetylosalicylowy",
+    "acetylosalicylowy polfa", "polfa" and the whole name.
+    """
+    normalized = normalize_drug_name(drug_name)
+    if not normalized:
+        return set()
+
+    tokens = normalized.split()
+    keys = {normalized}
+    keys.update(token for token in tokens if len(token) >= MIN_TOKEN_LENGTH)
+    for start in range(len(tokens)):
+        for end in range(start + 2, len(tokens) + 1):
+            keys.add(' '.join(tokens[start:end]))
+    return keys
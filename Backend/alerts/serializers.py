@@ -0,0 +1,41 @@
+from rest_framework import serializers
+
+from scraper.serializers import DrugEventListSerializer
+from .models import WatchlistItem, DrugAlert
+from .normalization import normalize_drug_name
+
+
+class WatchlistItemSerializer(serializers.ModelSerializer):
+    """Serializer for WatchlistItem model"""
+
+    class Meta:
+        model = WatchlistItem
+        fields = ['id', 'drug_name', 'normalized_name', 'created_at']
+        read_only_fields = ['id', 'normalized_name', 'created_at']
+
+    def validate_drug_name(self, value):
+        """Validate that the name is usable and not already watched"""
+        normalized = normalize_drug_name(value)
+        if not normalized:
+            raise serializers.ValidationError("Nazwa leku jest wymagana.")
+
+        user = self.context['request'].user
+        if WatchlistItem.objects.filter(user=user, normalized_name=normalized).exists():
+            raise serializers.ValidationError("Ten lek jest już na liście obserwowanych.")
+        return value.strip()
+
+
+class DrugAlertSerializer(serializers.ModelSerializer):
+    """Serializer for DrugAlert model with the matched event embedded"""
+
+    event = DrugEventListSerializer(read_only=True)
+    watched_drug_name = serializers.CharField(
+        source='watchlist_item.drug_name',
+        read_only=True,
+        default=None
+    )
+
+    class Meta:
+        model = DrugAlert
+        fields = ['id', 'event', 'watched_drug_name', 'is_read', 'created_at']
+        read_only_fields = ['id', 'event', 'watched_drug_name', 'created_at']
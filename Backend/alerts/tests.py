@@ -0,0 +1,106 @@
+from datetime import date
+
+from django.test import SimpleTestCase, TestCase
+
+from scraper.models import DrugEvent
+from security.models import User
+from .engine import dispatch_alerts
+from .models import DrugAlert, WatchlistItem
+from .normalization import match_keys, normalize_drug_name
+
+
+class NormalizationTests(SimpleTestCase):
+
+    def test_normalize_strips_case_diacritics_and_punctuation(self):
+        self.assertEqual(normalize_drug_name('Paracetamol  Polpharma®'), 'paracetamol polpharma')
+        self.assertEqual(normalize_drug_name('Żółć Łódź-Kraków'), 'zolc lodz krakow')
+        self.assertEqual(normalize_drug_name(''), '')
+        self.assertEqual(normalize_drug_name(None), '')
+
+    def test_match_keys_contains_whole_name_and_tokens(self):
+        keys = match_keys('Paracetamol Teva 500 mg')
+        self.assertIn('paracetamol teva 500 mg', keys)
+        self.assertIn('paracetamol', keys)
+        self.assertIn('teva', keys)
+        self.assertIn('500', keys)
+
+    def test_match_keys_skips_short_single_tokens(self):
+        self.assertNotIn('mg', match_keys('Paracetamol Teva 500 mg'))
+
+    def test_match_keys_contains_phrases_inside_longer_name(self):
+        keys = match_keys('Kwas acetylosalicylowy Polfa 75 mg')
+        self.assertIn('kwas acetylosalicylowy', keys)
+        self.assertIn('acetylosalicylowy polfa', keys)
+        self.assertIn('polfa 75 mg', keys)
+        self.assertNotIn('kwas polfa', keys)
+
+    def test_match_keys_of_empty_name(self):
+        self.assertEqual(match_keys(''), set())
+
+
+class DispatchAlertsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.pharmacy = User.objects.create_user(
+            'apteka@example.com', first_name='Anna', last_name='Nowak', account_type='pharmacy'
+        )
+        cls.doctor = User.objects.create_user(
+            'lekarz@example.com', first_name='Jan', last_name='Kowalski', account_type='doctor'
+        )
+
+    def watch(self, user, drug_name):
+        return WatchlistItem.objects.create(user=user, drug_name=drug_name)
+
+    def event(self, drug_name, number):
+        return DrugEvent.objects.create(
+            event_type=DrugEvent.EventType.WITHDRAWAL,
+            source=DrugEvent.DataSource.GIF,
+            publication_date=date(2026, 1, 15),
+            decision_number=f"GIF-R/{number}/2026",
+            drug_name=drug_name,
+            marketing_authorisation_holder='Polfa S.A.',
+        )
+
+    def test_token_match_creates_alert(self):
+        item = self.watch(self.pharmacy, 'Paracetamol')
+        event = self.event('Paracetamol Teva 500 mg', 1)
+
+        self.assertEqual(dispatch_alerts([event]), 1)
+        alert = DrugAlert.objects.get()
+        self.assertEqual((alert.user, alert.event, alert.watchlist_item), (self.pharmacy, event, item))
+
+    def test_phrase_match_inside_longer_name(self):
+        self.watch(self.pharmacy, 'Kwas acetylosalicylowy')
+        event = self.event('Kwas acetylosalicylowy Polfa 75 mg', 2)
+
+        self.assertEqual(dispatch_alerts([event]), 1)
+        self.assertTrue(DrugAlert.objects.filter(user=self.pharmacy, event=event).exists())
+
+    def test_no_alert_without_match(self):
+        self.watch(self.pharmacy, 'Ibuprofen')
+        self.assertEqual(dispatch_alerts([self.event('Paracetamol Teva', 3)]), 0)
+        self.assertFalse(DrugAlert.objects.exists())
+
+    def test_inactive_users_are_skipped(self):
+        self.watch(self.doctor, 'Paracetamol')
+        self.doctor.is_active = False
+        self.doctor.save(update_fields=['is_active'])
+
+        self.assertEqual(dispatch_alerts([self.event('Paracetamol Teva', 4)]), 0)
+
+    def test_one_alert_per_user_and_event(self):
+        self.watch(self.pharmacy, 'Paracetamol')
+        self.watch(self.pharmacy, 'Paracetamol Teva')
+        self.watch(self.doctor, 'Teva')
+        event = self.event('Paracetamol Teva', 5)
+
+        self.assertEqual(dispatch_alerts([event]), 2)
+        # Dispatching the same event again does not duplicate alerts
+        dispatch_alerts([event])
+        self.assertEqual(DrugAlert.objects.filter(user=self.pharmacy, event=event).count(), 1)
+        self.assertEqual(DrugAlert.objects.filter(user=self.doctor, event=event).count(), 1)
+
+    def test_unsaved_events_are_ignored(self):
+        self.watch(self.pharmacy, 'Paracetamol')
+        self.assertEqual(dispatch_alerts([DrugEvent(drug_name='Paracetamol')]), 0)
@@ -0,0 +1,15 @@
+from django.urls import path
+from . import views
+
+app_name = 'alerts'
+
+urlpatterns = [
+    # Watched drugs of the current user
+    path('watchlist', views.WatchlistView.as_view(), name='watchlist'),
+    path('watchlist/<int:pk>', views.WatchlistItemDeleteView.as_view(), name='watchlist-item-delete'),
+
+    # Alerts created by the recall alert engine
+    path('', views.DrugAlertListView.as_view(), name='alert-list'),
+    path('read', views.DrugAlertMarkReadView.as_view(), name='alert-mark-all-read'),
+    path('<int:pk>/read', views.DrugAlertMarkReadView.as_view(), name='alert-mark-read'),
+]
@@ -0,0 +1,93 @@
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+
+from core.query_budget import QueryBudgetMixin
+from .models import WatchlistItem, DrugAlert
+from .serializers import WatchlistItemSerializer, DrugAlertSerializer
+
+
+@extend_schema(tags=['Alerts'])
+class WatchlistView(generics.ListCreateAPIView):
+    """
+    API endpoint to list and add drugs on the current user's watchlist.
+
+    New drug events (withdrawals, suspensions, registrations) whose name
+    matches a watched drug create an alert for the user.
+    """
+    serializer_class = WatchlistItemSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return WatchlistItem.objects.filter(user_id=self.request.user.id)
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+@extend_schema(tags=['Alerts'])
+class WatchlistItemDeleteView(generics.DestroyAPIView):
+    """API endpoint to remove a drug from the current user's watchlist"""
+
+    serializer_class = WatchlistItemSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return WatchlistItem.objects.filter(user_id=self.request.user.id)
+
+
+@extend_schema(
+    tags=['Alerts'],
+    parameters=[
+        OpenApiParameter(
+            name='unread',
+            description='Return only unread alerts (true/false)',
+            required=False,
+            type=str
+        ),
+    ]
+)
+class DrugAlertListView(QueryBudgetMixin, generics.ListAPIView):
+    """API endpoint to list alerts of the current user, newest first"""
+
+    serializer_class = DrugAlertSerializer
+    permission_classes = [IsAuthenticated]
+    cursor_ordering = '-created_at'
+
+    def get_queryset(self):
+        queryset = DrugAlert.objects.filter(
+            user_id=self.request.user.id
+        ).select_related('event', 'watchlist_item')
+
+        unread = self.request.query_params.get('unread')
+        if unread and unread.lower() == 'true':
+            queryset = queryset.filter(is_read=False)
+
+        return queryset
+
+
+@extend_schema(
+    tags=['Alerts'],
+    request=None,
+    responses={
+        200: OpenApiResponse(description='Alerts marked as read'),
+    }
+)
+class DrugAlertMarkReadView(APIView):
+    """
+    API endpoint to mark alerts as read.
+
+    With a primary key marks a single alert, without it marks all alerts
+    of the current user.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk=None):
+        queryset = DrugAlert.objects.filter(user_id=request.user.id, is_read=False)
+        if pk is not None:
+            queryset = queryset.filter(pk=pk)
+
+        updated = queryset.update(is_read=True)
+        return Response({'updated': updated}, status=status.HTTP_200_OK)
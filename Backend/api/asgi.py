@@ -3,6 +3,9 @@ ASGI config for api project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The live feed (``/stream/events``, Server-Sent Events) needs an ASGI server,
+e.g. ``uvicorn api.asgi:application``; under WSGI the stream is never flushed.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
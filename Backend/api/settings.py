@@ -27,13 +27,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = os.getenv('BACKEND_SECRET_KEY')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# With DEBUG on Django also keeps every executed SQL query in memory
+DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
 
-ALLOWED_HOSTS = ['*']
+ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '*').split(',')
 
 # CORS Configuration - Development mode (allow all)
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['X-Result-Truncated', 'X-Result-Limit', 'Server-Timing']
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -42,6 +44,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'rest_framework',
     'rest_framework_simplejwt',
@@ -52,10 +55,16 @@ INSTALLED_APPS = [
     'regulations',
     'drf_spectacular',
     'news',
+    'alerts',
+    'stream',
+    'core',
 ]
 
 MIDDLEWARE = [
+    # First, so its timings cover the other middleware (core/instrumentation.py)
+    'core.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -65,14 +74,75 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Request instrumentation: Server-Timing header and /internal/metrics (Prometheus)
+INSTRUMENTATION_ENABLED = os.getenv('INSTRUMENTATION_ENABLED', 'True').lower() == 'true'
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'True').lower() == 'true'
+# /internal/metrics is served to these client IPs, or with "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_ALLOWED_IPS = os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'security.authentication.StatelessJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'core.throttling.TokenBucketThrottle',
+    ],
+    # Number of reverse proxies in front of the API (for X-Forwarded-For)
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES')) if os.getenv('NUM_PROXIES') else None,
+}
+
+# Rate limiting (core/throttling.py) - token buckets per client and scope
+THROTTLE_ENABLED = os.getenv('THROTTLE_ENABLED', 'True').lower() == 'true'
+TOKEN_BUCKETS = {
+    'anon': {'capacity': 60, 'refill_per_second': 1},
+    'user': {'capacity': 240, 'refill_per_second': 4},
+    'search': {'capacity': 60, 'refill_per_second': 2},
+}
+
+# Shared cache (throttle buckets); in-process cache when REDIS_URL is not set
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Query budget for read endpoints (core/query_budget.py)
+QUERY_BUDGET = {
+    'DEFAULT_LIMIT': 10,
+    'MAX_LIMIT': int(os.getenv('QUERY_MAX_LIMIT', 100)),
+    'PAGE_SIZE': 50,
+    'MAX_PAGE_SIZE': 200,
+    'MAX_UNPAGINATED_RESULTS': int(os.getenv('QUERY_MAX_UNPAGINATED_RESULTS', 5000)),
+    'MAX_PARAMS': 20,
+    'MAX_PARAM_LENGTH': 200,
+}
+
+# Unified search across apps (core/search.py); per-source budgets in ms
+UNIFIED_SEARCH = {
+    'SOURCE_LIMIT': 50,
+    'PAGE_SIZE': 20,
+    'MAX_PAGE_SIZE': 50,
+    'TIMEOUTS_MS': {
+        'drugs': int(os.getenv('SEARCH_TIMEOUT_DRUGS_MS', 800)),
+        'drug_events': int(os.getenv('SEARCH_TIMEOUT_DRUG_EVENTS_MS', 800)),
+        'regulations': int(os.getenv('SEARCH_TIMEOUT_REGULATIONS_MS', 800)),
+        'news': int(os.getenv('SEARCH_TIMEOUT_NEWS_MS', 800)),
+    },
+    'MAX_WORKERS': int(os.getenv('SEARCH_MAX_WORKERS', 16)),
 }
 
 SPECTACULAR_SETTINGS = {
@@ -117,10 +187,25 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': 'db_hackathon',  
         'PORT': '5432',     
+        # Persistent connections (seconds, 0 = close after each request).
+        # Keep 0 for the ASGI server, where requests do not reuse threads.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 0)),
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True').lower() == 'true',
     }
 }
 
 
+# Password hashing (security/hashers.py) - the first hasher encodes new
+# passwords, the others verify old hashes which are upgraded on login
+PASSWORD_HASHERS = [
+    'security.hashers.TunableArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', 2))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', 19456))  # KiB
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', 1))
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -156,6 +241,17 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/4.2/howto/static-files/
 
 STATIC_URL = 'static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# Static files (admin, Swagger UI) are served by WhiteNoise, also with DEBUG off
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedStaticFilesStorage',
+    },
+}
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -190,4 +286,47 @@ SIMPLE_JWT = {
     'JTI_CLAIM': 'jti',
 }
 
+# Serve safe requests from verified token claims without a user query
+# (security/authentication.py); False always loads the user from the DB.
+# Revocations live in the cache, so this needs the shared (Redis) cache -
+# with the in-process cache it is ignored
+JWT_STATELESS_AUTH = os.getenv('JWT_STATELESS_AUTH', 'True' if REDIS_URL else 'False').lower() == 'true'
+
 SCALEWAY_API_KEY = os.getenv('SCALEWAY_API_KEY', 'a2019bca-2084-4823-a7b4-9944b044ac07')
+SCALEWAY_BASE_URL = os.getenv('SCALEWAY_BASE_URL', 'https://9921ae86-3cf5-4e5c-8151-e1d274ceb539.ifr.fr-par.scaleway.com/v1')
+SCALEWAY_MODEL = os.getenv('SCALEWAY_MODEL', 'qwen/qwen3-235b-a22b-instruct-2507:awq')
+
+# PubMed (NCBI E-utilities) - klucz API podnosi limit z 3 do 10 zapytań/s
+NCBI_API_KEY = os.getenv('NCBI_API_KEY', '')
+
+# External sources of the ingestion paths - point them at the local stand-in
+# (manage.py run_standin) to run the scrapers offline
+RDG_BASE_URL = os.getenv('RDG_BASE_URL', 'https://rdg.ezdrowie.gov.pl/')
+URPL_API_URL = os.getenv('URPL_API_URL', 'https://rejestry.ezdrowie.gov.pl/api/rpl/medicinal-products/search/public')
+GOVPL_REGISTER_URL = os.getenv('GOVPL_REGISTER_URL', 'https://www.gov.pl/api/data/registers/search?pageId=21034488')
+NCBI_EUTILS_URL = os.getenv('NCBI_EUTILS_URL', 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils')
+
+# Ingestion progress (core.ingestion.log_event) and run summaries on the console
+INGESTION_LOG_LEVEL = os.getenv('INGESTION_LOG_LEVEL', 'INFO')
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        name: {'handlers': ['console'], 'level': INGESTION_LOG_LEVEL, 'propagate': False}
+        for name in ('core.ingestion', 'scraper', 'regulations', 'news')
+    },
+}
+
+# Newsy starsze niż tyle dni prune_medical_news przenosi do archiwum
+NEWS_RETENTION_DAYS = int(os.getenv('NEWS_RETENTION_DAYS', 180))
+
+# Live feed (Server-Sent Events)
+# LocalBroker only reaches clients of the same process (tests / dev),
+# PostgresBroker uses LISTEN/NOTIFY so scrapers can publish across processes
+STREAM_BACKEND = os.getenv('STREAM_BACKEND', 'stream.brokers.PostgresBroker')
+STREAM_CHANNEL = os.getenv('STREAM_CHANNEL', 'pharmaradar_feed')
+STREAM_HEARTBEAT_SECONDS = int(os.getenv('STREAM_HEARTBEAT_SECONDS', 15))
+STREAM_MAX_QUEUE = int(os.getenv('STREAM_MAX_QUEUE', 1000))
@@ -2,6 +2,8 @@ from django.contrib import admin
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from core.views import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('auth/', include('security.urls')),
@@ -11,4 +13,8 @@ urlpatterns = [
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('news/', include('news.urls')),
+    path('alerts/', include('alerts.urls')),
+    path('stream/', include('stream.urls')),
+    path('search/', include('core.urls')),
+    path('internal/metrics', metrics_view, name='metrics'),
 ]
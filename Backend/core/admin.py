@@ -0,0 +1,17 @@
+from django.contrib import admin
+from .models import IngestionRun
+
+
+@admin.register(IngestionRun)
+class IngestionRunAdmin(admin.ModelAdmin):
+    list_display = ('source', 'status', 'started_at', 'duration_seconds', 'rows', 'rows_per_second', 'error_count')
+    list_filter = ('source', 'status', 'started_at')
+    date_hierarchy = 'started_at'
+    readonly_fields = (
+        'source', 'status', 'started_at', 'finished_at', 'duration_seconds', 'rows', 'rows_per_second',
+        'phases', 'counters', 'llm', 'caches', 'error_count', 'errors',
+    )
+
+    def has_add_permission(self, request):
+        # Runs are recorded by the ingestion commands only
+        return False
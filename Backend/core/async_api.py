@@ -0,0 +1,145 @@
+"""
+Helpers for the async (ASGI) variants of the read and search endpoints
+
+DRF 3.14 views are synchronous, so the async endpoints are plain Django
+async views that reuse the DRF serializers and return JsonResponse.
+"""
+import json
+import math
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from security.authentication import ClaimsUser, StatelessJWTAuthentication, can_trust_claims
+
+from .instrumentation import timed
+from .query_budget import budget, mark_truncated, validate_query_params
+from .throttling import check_request
+
+
+async def authenticate_jwt(request, allow_query_token=False, requires_db_user=False):
+    """
+    Authenticate a request with a JWT access token
+
+    Safe requests get a ClaimsUser built from the token, like
+    StatelessJWTAuthentication does for the DRF views.
+
+    Args:
+        request: Django HttpRequest
+        allow_query_token: also accept the token as the "token" query
+            parameter (needed by EventSource, which cannot set headers)
+        requires_db_user: always load security.User from the DB
+
+    Returns:
+        User, ClaimsUser or None if no valid token was supplied
+    """
+    auth = StatelessJWTAuthentication()
+    header = auth.get_header(request)
+    raw_token = auth.get_raw_token(header) if header else None
+    if raw_token is None and allow_query_token:
+        raw_token = request.GET.get('token')
+    if not raw_token:
+        return None
+
+    try:
+        validated_token = auth.get_validated_token(raw_token)
+        if await sync_to_async(can_trust_claims)(request.method, validated_token, requires_db_user):
+            return ClaimsUser(validated_token)
+        user = await sync_to_async(auth.get_user)(validated_token)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+    return user if user.is_active else None
+
+
+def async_api_view(methods, auth_required=False, throttle_cost=1, throttle_bucket=None, requires_db_user=False):
+    """
+    Decorator for async API endpoints
+
+    Checks the HTTP method, authenticates JWT users (sets request.user),
+    charges the token buckets (429 when empty), applies the query budget
+    checks (ValidationError becomes a 400) and exempts the view from CSRF
+    checks like DRF's APIView does.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in methods:
+                return JsonResponse(
+                    {'detail': f'Method "{request.method}" not allowed.'},
+                    status=405
+                )
+
+            user = await authenticate_jwt(request, requires_db_user=requires_db_user)
+            if user is not None:
+                request.user = user
+            elif auth_required:
+                return JsonResponse(
+                    {'detail': 'Authentication credentials were not provided.'},
+                    status=401
+                )
+
+            wait = await sync_to_async(check_request)(request, throttle_cost, throttle_bucket)
+            if wait:
+                return throttled(wait)
+
+            try:
+                validate_query_params(request.GET)
+                return await view_func(request, *args, **kwargs)
+            except ValidationError as e:
+                return JsonResponse(e.detail, status=400, safe=False)
+
+        wrapper.csrf_exempt = True
+        return wrapper
+    return decorator
+
+
+def request_json(request):
+    """Return the parsed JSON body of a request (form data as a fallback)"""
+    if request.content_type == 'application/json':
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+    return request.POST
+
+
+async def capped_json_response(serializer_class, queryset):
+    """
+    Serialize at most MAX_UNPAGINATED_RESULTS rows of a queryset
+
+    Async counterpart of QueryBudgetMixin.capped_response
+    """
+    max_results = budget('MAX_UNPAGINATED_RESULTS')
+    rows = [obj async for obj in queryset[:max_results + 1]]
+    truncated = len(rows) > max_results
+    with timed('serialize'):
+        data = serializer_class(rows[:max_results], many=True).data
+    return mark_truncated(JsonResponse(data, safe=False), truncated)
+
+
+async def serialize_object(serializer_class, queryset, pk):
+    """Fetch a single object with the async ORM, returns None if missing"""
+    try:
+        obj = await queryset.aget(pk=pk)
+    except queryset.model.DoesNotExist:
+        return None
+    with timed('serialize'):
+        return serializer_class(obj).data
+
+
+def throttled(wait):
+    """429 response matching DRF's Throttled exception"""
+    response = JsonResponse(
+        {'detail': f'Request was throttled. Expected available in {math.ceil(wait)} seconds.'},
+        status=429
+    )
+    response['Retry-After'] = str(math.ceil(wait))
+    return response
+
+
+def not_found():
+    return JsonResponse({'detail': 'Not found.'}, status=404)
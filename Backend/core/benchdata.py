@@ -0,0 +1,228 @@
+"""
+Synthetic data for the benchmark command
+
+Seeds Drug, DrugEvent, LegalRegulation and MedicalNews with deterministic
+(seeded random) rows that look like the real data closely enough for the
+indexes and search to behave realistically: Polish words, repeated
+substances and companies, dates spread over recent years.
+
+Rows are generated lazily and written with bulk_create in batches, one
+transaction per batch, so seeding 1M rows per table keeps memory flat.
+"""
+import hashlib
+import random
+import time
+from datetime import date, timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+SCALES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+SUBSTANCES = [
+    'paracetamolum', 'ibuprofenum', 'metforminum', 'amoxicillinum', 'atorvastatinum',
+    'omeprazolum', 'ramiprilum', 'bisoprololum', 'levothyroxinum', 'salbutamolum',
+    'insulinum glargine', 'heparinum', 'diclofenacum', 'clopidogrelum', 'losartanum',
+]
+FORMS = ['tabletki', 'tabletki powlekane', 'kapsułki', 'roztwór do wstrzykiwań', 'syrop', 'maść', 'zawiesina']
+STRENGTHS = ['5 mg', '10 mg', '20 mg', '50 mg', '100 mg', '250 mg', '500 mg', '1 g', '40 mg/ml']
+COMPANIES = [
+    'Polpharma S.A.', 'Adamed Pharma S.A.', 'Teva Pharmaceuticals Polska', 'Sandoz GmbH',
+    'Krka d.d.', 'Gedeon Richter Plc.', 'Pfizer Europe MA EEIG', 'Zentiva k.s.', 'Aflofarm Farmacja Polska',
+]
+TOPICS = [
+    'refundacji leków', 'świadczeń gwarantowanych', 'dokumentacji medycznej', 'ratownictwa medycznego',
+    'szczepień ochronnych', 'wyrobów medycznych', 'badań laboratoryjnych', 'opieki onkologicznej',
+    'praktyki pielęgniarek i położnych', 'leczenia szpitalnego', 'aptek ogólnodostępnych', 'żywności specjalnej',
+]
+NEWS_WORDS = [
+    'clinical', 'trial', 'patients', 'therapy', 'cancer', 'diabetes', 'vaccine', 'cardiovascular',
+    'outcomes', 'randomized', 'cohort', 'treatment', 'risk', 'infection', 'children', 'hospital',
+]
+JOURNALS = ['The Lancet', 'BMJ', 'JAMA', 'Nature Medicine', 'PLoS One', 'NEJM']
+
+
+def parse_scale(value):
+    """'10k'/'100k'/'1m' or a plain number of rows per table"""
+    value = str(value).lower().replace('_', '')
+    if value in SCALES:
+        return SCALES[value]
+    return int(value)
+
+
+def product_name(rng, index):
+    return f"{rng.choice(SUBSTANCES).split()[0].capitalize()} {rng.choice(['Teva', 'Krka', 'Polpharma', 'Adamed', 'Aurovitas'])} {index}"
+
+
+def iter_drugs(rng, count):
+    from pharmac.models import Drug
+
+    for index in range(count):
+        substance = rng.choice(SUBSTANCES)
+        yield Drug(
+            nazwa_produktu_leczniczego=product_name(rng, index),
+            nazwa_powszechnie_stosowana=substance.capitalize(),
+            substancja_czynna=substance,
+            droga_podania_gatunek_tkanka_okres_karencji=rng.choice(['doustna', 'dożylna', 'na skórę']),
+            moc=rng.choice(STRENGTHS),
+            numer_pozwolenia=str(10000 + index),
+            podmiot_odpowiedzialny=rng.choice(COMPANIES),
+            nazwa_wytw_rcy=rng.choice(COMPANIES),
+            cena=round(rng.uniform(3, 400), 2),
+            ilosc=rng.choice([10, 20, 28, 30, 56, 60]),
+        )
+
+
+def iter_drug_events(rng, count):
+    from scraper.models import DrugEvent
+
+    today = date.today()
+    for index in range(count):
+        source = DrugEvent.DataSource.GIF if index % 3 else DrugEvent.DataSource.URPL
+        event_type = (
+            rng.choice([DrugEvent.EventType.WITHDRAWAL, DrugEvent.EventType.SUSPENSION])
+            if source == DrugEvent.DataSource.GIF else DrugEvent.EventType.REGISTRATION
+        )
+        yield DrugEvent(
+            event_type=event_type,
+            source=source,
+            publication_date=today - timedelta(days=rng.randint(0, 1500)),
+            decision_number=f"BENCH/{index}",
+            drug_name=product_name(rng, index),
+            drug_strength=rng.choice(STRENGTHS),
+            drug_form=rng.choice(FORMS),
+            marketing_authorisation_holder=rng.choice(COMPANIES),
+            batch_number=f"B{index:07d}" if source == DrugEvent.DataSource.GIF else None,
+            description=f"Decyzja dotyczy produktu z powodu {rng.choice(['wady jakościowej', 'niezgodności dokumentacji', 'wyników badań stabilności'])}.",
+        )
+
+
+def iter_regulations(rng, count):
+    from regulations.diff import compute_content_hash
+    from regulations.models import LegalRegulation
+
+    for index in range(count):
+        topic = rng.choice(TOPICS)
+        quarter = rng.randint(1, 4)
+        year = rng.randint(2020, 2027)
+        regulation = LegalRegulation(
+            lp=str(index + 1),
+            nr_w_wykazie=f"BENCH {index}",
+            podstawa_wydania=f"art. {rng.randint(1, 200)} ust. {rng.randint(1, 9)} ustawy o {topic}",
+            tytul_rozporzadzenia=f"Rozporządzenie Ministra Zdrowia w sprawie {topic} ({index})",
+            przyczyny_rezygnacji='Zmiana przepisów ustawowych' if index % 17 == 0 else '',
+            planowany_termin_wydania=f"{['I', 'II', 'III', 'IV'][quarter - 1]} kwartał {year} r.",
+            planowany_termin_wydania_data=date(year, quarter * 3 - 2, rng.randint(1, 28)),
+            istota_rozwiazan=f"Projekt określa zasady {topic} oraz tryb postępowania podmiotów leczniczych.",
+            osoba_odpowiedzialna='Sekretarz Stanu w Ministerstwie Zdrowia',
+            przyczyna_potrzeba=f"Konieczność dostosowania przepisów dotyczących {topic}.",
+            ai_tytul=f"Nowe zasady {topic}",
+            ai_description=f"Rozporządzenie porządkuje kwestie {topic}. Zmiany dotyczą pacjentów i placówek.",
+        )
+        regulation.refresh_is_withdrawn()
+        regulation.content_hash = compute_content_hash(regulation)
+        yield regulation
+
+
+def iter_news(rng, count):
+    from news.models import MedicalNews
+
+    now = timezone.now()
+    for index in range(count):
+        words = rng.sample(NEWS_WORDS, 6)
+        url = f"https://pubmed.ncbi.nlm.nih.gov/bench{index}/"
+        yield MedicalNews(
+            title=' '.join(words).capitalize(),
+            description=' '.join(rng.choices(NEWS_WORDS, k=40)),
+            url=url,
+            url_hash=hashlib.sha256(url.encode('utf-8')).hexdigest(),
+            source=rng.choice(JOURNALS),
+            published_at=now - timedelta(minutes=rng.randint(0, 60 * 24 * 365)),
+            title_pl=f"Badanie: {' '.join(words)}",
+            description_pl='Streszczenie badania klinicznego.',
+            is_translated=index % 10 != 0,
+        )
+
+
+def write_rows(model, rows, batch_size):
+    """bulk_create a row generator in batches, one transaction each"""
+    written = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            with transaction.atomic():
+                model.objects.bulk_create(batch, batch_size=batch_size)
+            written += len(batch)
+            batch = []
+    if batch:
+        with transaction.atomic():
+            model.objects.bulk_create(batch, batch_size=batch_size)
+        written += len(batch)
+    return written
+
+
+def index_regulations(batch_size):
+    """Fill search_vector of the seeded regulations (PostgreSQL only)"""
+    from regulations.models import LegalRegulation
+    from regulations.search import update_search_vectors
+
+    if connection.vendor != 'postgresql':
+        return
+    ids = list(LegalRegulation.objects.filter(search_vector__isnull=True).values_list('pk', flat=True))
+    for start in range(0, len(ids), batch_size * 10):
+        update_search_vectors(LegalRegulation.objects.filter(pk__in=ids[start:start + batch_size * 10]))
+
+
+def seed(count, batch_size=5000, random_seed=42, models=None, log=print):
+    """
+    Seed `count` synthetic rows per table
+
+    Args:
+        count: rows per table
+        batch_size: rows per INSERT transaction
+        random_seed: same seed - same data
+        models: subset of drugs, drug_events, regulations, news (default: all)
+        log: progress callback
+
+    Returns:
+        dict: {name: {"rows", "seconds", "rows_per_second"}}
+    """
+    from news.models import MedicalNews
+    from pharmac.models import Drug
+    from regulations.models import LegalRegulation
+    from scraper.models import DrugEvent
+
+    seeders = {
+        'drugs': (Drug, iter_drugs),
+        'drug_events': (DrugEvent, iter_drug_events),
+        'regulations': (LegalRegulation, iter_regulations),
+        'news': (MedicalNews, iter_news),
+    }
+
+    results = {}
+    for name, (model, rows) in seeders.items():
+        if models and name not in models:
+            continue
+        rng = random.Random(f"{random_seed}-{name}")
+        log(f"🌱 Seeding {count} {name}...")
+        started = time.perf_counter()
+        written = write_rows(model, rows(rng, count), batch_size)
+        if name == 'regulations':
+            index_regulations(batch_size)
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            'rows': written,
+            'seconds': round(elapsed, 3),
+            'rows_per_second': round(written / elapsed, 1) if elapsed else None,
+        }
+
+    # Fresh statistics for the planner, like after a real import
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+    return results
@@ -0,0 +1,306 @@
+"""
+Run metrics of the ingestion paths (GIF, URPL, regulations, news, import_drugs)
+
+Every ingestion runs inside `ingestion_run(source)`, which records:
+- phases: time spent in http/parse/db/ai/... (`with run.phase('http'):`),
+  summed over threads, so a phase run by a worker pool can exceed the
+  wall time of the run,
+- counters and rows written, from which rows/s is computed,
+- LLM calls made through `create_completion`: token usage reported by the
+  API (response.usage) and call latency,
+- cache hit rates (`run.cache('translated', hit)`) - work skipped because
+  its result already existed.
+
+The run is stored as one core.IngestionRun row (status "running" while in
+progress) and logged as a single JSON line on the "core.ingestion"
+logger. `manage.py ingestion_report` compares runs across days. Per-row
+progress and errors of the scrapers go out as JSON lines too (`log_event`).
+
+Code that is called outside of a run (e.g. the summarizer from a shell)
+gets a no-op recorder from `current_run()`, so call sites never check.
+"""
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Errors kept on the IngestionRun row - the count is always complete
+MAX_STORED_ERRORS = 50
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class RunRecorder:
+    """Thread-safe collector of the metrics of one ingestion run"""
+
+    def __init__(self, source):
+        self.source = source
+        self.lock = threading.Lock()
+        self.started_at = timezone.now()
+        self.started = time.perf_counter()
+        self.duration = None
+        self.phases = {}
+        self.counters = {}
+        self.caches = {}
+        self.llm = {'calls': 0, 'errors': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+        self.llm_latencies = []
+        self.errors = []
+        self.error_count = 0
+        self.failed = False
+
+    @contextmanager
+    def phase(self, name):
+        """Add the time spent in the block to phase `name`"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - started)
+
+    def add_phase(self, name, seconds):
+        with self.lock:
+            phase = self.phases.setdefault(name, {'seconds': 0.0, 'calls': 0})
+            phase['seconds'] += seconds
+            phase['calls'] += 1
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_rows(self, amount):
+        """Rows written to the database (the rows/s numerator)"""
+        self.count('rows', amount)
+
+    def cache(self, name, hit, amount=1):
+        with self.lock:
+            cache = self.caches.setdefault(name, {'hits': 0, 'misses': 0})
+            cache['hits' if hit else 'misses'] += amount
+
+    def record_llm(self, response, seconds):
+        """Record one LLM call; `response` is None when the call failed"""
+        usage = getattr(response, 'usage', None)
+        with self.lock:
+            self.llm['calls'] += 1
+            self.llm_latencies.append(seconds)
+            if response is None:
+                self.llm['errors'] += 1
+            elif usage is not None:
+                for name in ('prompt_tokens', 'completion_tokens', 'total_tokens'):
+                    self.llm[name] += getattr(usage, name, None) or 0
+
+    def error(self, message):
+        with self.lock:
+            self.error_count += 1
+            if len(self.errors) < MAX_STORED_ERRORS:
+                self.errors.append(str(message))
+
+    def fail(self, message):
+        """Mark the run failed (for paths that report errors instead of raising)"""
+        self.error(message)
+        self.failed = True
+
+    @property
+    def rows(self):
+        return self.counters.get('rows', 0)
+
+    def elapsed(self):
+        return self.duration if self.duration is not None else time.perf_counter() - self.started
+
+    def snapshot(self):
+        """Metrics as stored on IngestionRun"""
+        with self.lock:
+            elapsed = self.elapsed()
+            llm = dict(self.llm)
+            if self.llm_latencies:
+                llm['latency_p50_ms'] = round(percentile(self.llm_latencies, 0.5) * 1000, 1)
+                llm['latency_p95_ms'] = round(percentile(self.llm_latencies, 0.95) * 1000, 1)
+                llm['latency_max_ms'] = round(max(self.llm_latencies) * 1000, 1)
+            return {
+                'duration_seconds': round(elapsed, 3),
+                'rows': self.rows,
+                'rows_per_second': round(self.rows / elapsed, 2) if elapsed > 0 else None,
+                'phases': {
+                    name: {'seconds': round(phase['seconds'], 3), 'calls': phase['calls']}
+                    for name, phase in self.phases.items()
+                },
+                'counters': dict(self.counters),
+                'llm': llm,
+                'caches': {
+                    name: {**cache, 'hit_rate': round(cache['hits'] / (cache['hits'] + cache['misses']), 3)}
+                    for name, cache in self.caches.items()
+                    if cache['hits'] + cache['misses']
+                },
+                'error_count': self.error_count,
+                'errors': list(self.errors),
+            }
+
+    def summary_lines(self):
+        """Human-readable summary for the command output"""
+        data = self.snapshot()
+        lines = [
+            f"⏱️  {self.source}: {data['duration_seconds']:.1f}s, {data['rows']} rows "
+            f"({data['rows_per_second'] or 0:.1f} rows/s)"
+        ]
+        if data['phases']:
+            lines.append('  phases: ' + ', '.join(
+                f"{name} {phase['seconds']:.2f}s" for name, phase in data['phases'].items()
+            ))
+        llm = data['llm']
+        if llm['calls']:
+            lines.append(
+                f"  🤖 LLM: {llm['calls']} calls ({llm['errors']} failed), {llm['total_tokens']} tokens, "
+                f"p50 {llm['latency_p50_ms']:.0f}ms, p95 {llm['latency_p95_ms']:.0f}ms"
+            )
+        if data['caches']:
+            lines.append('  caches: ' + ', '.join(
+                f"{name} {cache['hit_rate']:.0%} ({cache['hits']}/{cache['hits'] + cache['misses']})"
+                for name, cache in data['caches'].items()
+            ))
+        return lines
+
+
+class NullRecorder(RunRecorder):
+    """Recorder used outside of a run - keeps nothing"""
+
+    def __init__(self):
+        super().__init__('none')
+
+    def add_phase(self, name, seconds):
+        pass
+
+    def count(self, name, amount=1):
+        pass
+
+    def cache(self, name, hit, amount=1):
+        pass
+
+    def record_llm(self, response, seconds):
+        pass
+
+    def error(self, message):
+        pass
+
+    def fail(self, message):
+        pass
+
+
+_null_recorder = NullRecorder()
+# Ingestion runs are process-wide (management commands), and worker pool
+# threads must see the run too - so a module global, not a context variable.
+# One run at a time per process: see ingestion_run
+_active = None
+_active_lock = threading.Lock()
+
+
+def current_run():
+    """The recorder of the run in progress (a no-op one outside of runs)"""
+    return _active or _null_recorder
+
+
+def create_completion(client, **kwargs):
+    """client.chat.completions.create(**kwargs), recording latency and tokens"""
+    run = current_run()
+    started = time.perf_counter()
+    try:
+        response = client.chat.completions.create(**kwargs)
+    except Exception:
+        run.record_llm(None, time.perf_counter() - started)
+        raise
+    run.record_llm(response, time.perf_counter() - started)
+    return response
+
+
+def log_event(logger, event, level=logging.INFO, **fields):
+    """
+    Log one progress or error line of the current run as JSON
+
+    Args:
+        logger: logger of the calling module
+        event: what happened (e.g. "drug_event_created")
+        level: logging level
+        **fields: details of the row (name, number, error, ...)
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, json.dumps(
+            {'event': event, 'source': current_run().source, **fields},
+            ensure_ascii=False, default=str,
+        ))
+
+
+def _save(record, recorder, **fields):
+    """Persist the run - metrics must never break the ingestion itself"""
+    from .models import IngestionRun
+
+    try:
+        if record is None:
+            return IngestionRun.objects.create(source=recorder.source, started_at=recorder.started_at, **fields)
+        for name, value in fields.items():
+            setattr(record, name, value)
+        record.save()
+        return record
+    except Exception as e:
+        logger.warning(f"Could not store ingestion run of {recorder.source}: {str(e)}")
+        return record
+
+
+@contextmanager
+def ingestion_run(source, verbose=True, log=print):
+    """
+    Record an ingestion run (usable as a decorator too)
+
+    The active run is a single process-wide recorder shared by all threads.
+    Runs are meant to be sequential (one management command per process):
+    a run started while another one is active - even from another thread -
+    takes over current_run() until it finishes, so the two runs' metrics
+    get mixed.
+
+    Args:
+        source: IngestionRun.Source value
+        verbose: write the summary when the run finishes
+        log: callable taking one line (e.g. a command's self.stdout.write)
+
+    Yields:
+        RunRecorder: also available as current_run() in the run's threads
+    """
+    from .models import IngestionRun
+
+    global _active
+    recorder = RunRecorder(source)
+    record = _save(None, recorder, status=IngestionRun.Status.RUNNING)
+
+    with _active_lock:
+        previous, _active = _active, recorder
+    status = IngestionRun.Status.SUCCESS
+    try:
+        yield recorder
+    except BaseException as e:
+        status = IngestionRun.Status.FAILED
+        recorder.error(f"{type(e).__name__}: {str(e)}")
+        raise
+    finally:
+        with _active_lock:
+            _active = previous
+        recorder.duration = time.perf_counter() - recorder.started
+        if recorder.failed:
+            status = IngestionRun.Status.FAILED
+
+        data = recorder.snapshot()
+        _save(record, recorder, status=status, finished_at=timezone.now(), **data)
+        logger.info(json.dumps({
+            'event': 'ingestion_run',
+            'source': source,
+            'status': status,
+            'started_at': recorder.started_at.isoformat(),
+            **data,
+        }, ensure_ascii=False, default=str))
+        if verbose:
+            for line in recorder.summary_lines():
+                log(line)
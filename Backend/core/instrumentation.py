@@ -0,0 +1,180 @@
+"""
+Per-request SQL and latency instrumentation
+
+InstrumentationMiddleware measures every request:
+- sql: number and time of SQL queries (an execute wrapper installed on
+  every DB connection, see CoreConfig.ready),
+- serialize: time in serializers (QueryBudgetMixin, TimedRetrieveMixin,
+  core.async_api), without the SQL run inside them (lazy relations) -
+  that is already counted under sql,
+- render: time rendering DRF/template responses,
+- total: wall time through the middleware.
+
+The numbers go out as a Server-Timing header (visible in the browser dev
+tools; disable with SERVER_TIMING_ENABLED=False) and into the metrics
+registry (core/metrics.py), exposed for Prometheus at /internal/metrics.
+
+The current request is tracked in a context variable, so queries run by
+sync_to_async in async views are counted too. Work handed to other thread
+pools (e.g. the unified search sources) is not.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from . import metrics
+
+_current = contextvars.ContextVar('request_timing', default=None)
+
+
+class RequestTiming:
+    """Timings of one request (seconds)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+        self.query_count = 0
+        self.phases = {'sql': 0.0, 'serialize': 0.0, 'render': 0.0}
+        self.render_started = None
+        self.total = None
+
+    def add(self, phase, seconds):
+        with self.lock:
+            self.phases[phase] += seconds
+            if phase == 'sql':
+                self.query_count += 1
+
+    def server_timing(self):
+        return ', '.join([
+            f'sql;dur={self.phases["sql"] * 1000:.1f};desc="{self.query_count} queries"',
+            f'serialize;dur={self.phases["serialize"] * 1000:.1f}',
+            f'render;dur={self.phases["render"] * 1000:.1f}',
+            f'total;dur={self.total * 1000:.1f}',
+        ])
+
+
+def current_timing():
+    return _current.get()
+
+
+@contextmanager
+def timed(phase):
+    """
+    Add the time spent in the block to `phase` of the current request
+
+    Queries run inside the block are left out, so no time is counted under
+    both sql and `phase`.
+    """
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    sql_before = timing.phases['sql']
+    try:
+        yield
+    finally:
+        sql_inside = timing.phases['sql'] - sql_before
+        timing.add(phase, max(0.0, time.perf_counter() - started - sql_inside))
+
+
+def record_query(execute, sql, params, many, context):
+    """DB execute wrapper counting queries of the current request"""
+    timing = _current.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timing.add('sql', time.perf_counter() - started)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created handler - wrap every new DB connection once"""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def instrumentation_enabled():
+    return getattr(settings, 'INSTRUMENTATION_ENABLED', True)
+
+
+def route_label(request):
+    """URL route of the request (bounded cardinality for metric labels)"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unmatched'
+    return match.route or match.view_name or 'unknown'
+
+
+class InstrumentationMiddleware:
+    """Records SQL, serialization, render and total time of each request"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not instrumentation_enabled():
+            return self.get_response(request)
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timing)
+
+    async def __acall__(self, request):
+        if not instrumentation_enabled():
+            return await self.get_response(request)
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timing)
+
+    def process_template_response(self, request, response):
+        # Called last (this middleware is first in MIDDLEWARE), right before
+        # the handler renders the response
+        timing = _current.get()
+        if timing is not None:
+            timing.render_started = time.perf_counter()
+            response.add_post_render_callback(lambda rendered: self.rendered(timing))
+        return response
+
+    def rendered(self, timing):
+        if timing.render_started is not None:
+            timing.add('render', time.perf_counter() - timing.render_started)
+            timing.render_started = None
+
+    def finish(self, request, response, timing):
+        timing.total = time.perf_counter() - timing.started
+
+        if getattr(settings, 'SERVER_TIMING_ENABLED', True):
+            response['Server-Timing'] = timing.server_timing()
+
+        labels = (route_label(request), request.method)
+        metrics.requests_total.inc(labels + (str(response.status_code),))
+        metrics.request_duration.observe(timing.total, labels)
+        metrics.request_queries.observe(timing.query_count, labels)
+        metrics.sql_seconds.inc(labels, timing.phases['sql'])
+        metrics.serialize_seconds.inc(labels, timing.phases['serialize'])
+        metrics.render_seconds.inc(labels, timing.phases['render'])
+        return response
@@ -0,0 +1,40 @@
+"""
+Helpers shared by the LLM callers (news translation, regulation summaries)
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket: on average `rate` requests per second, with bursts"""
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1, int(rate)))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block the calling thread until a token is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def strip_code_fence(content):
+    """Remove the ```json ... ``` fence models like to wrap JSON in"""
+    content = content.strip()
+    if content.startswith('```'):
+        content = content.split('\n', 1)[1] if '\n' in content else ''
+        content = content.rsplit('```', 1)[0]
+    return content.strip()
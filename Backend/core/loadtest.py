@@ -0,0 +1,84 @@
+"""
+Small HTTP load generator used by the loadtest management command
+"""
+import threading
+import time
+
+import requests
+
+
+def percentile(sorted_values, pct):
+    """Return the pct-th percentile (0-100) of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def obtain_token(base_url, email, password):
+    """Log in through the API and return a JWT access token"""
+    response = requests.post(
+        f"{base_url.rstrip('/')}/auth/login",
+        json={'email': email, 'password': password},
+        timeout=30
+    )
+    response.raise_for_status()
+    return response.json()['access']
+
+
+def run_load(url, concurrency=10, duration=30.0, headers=None, method='GET', json_body=None, timeout=30):
+    """
+    Hammer a single URL from `concurrency` threads for `duration` seconds
+
+    Every thread keeps its own keep-alive session, like a browser would.
+
+    Returns:
+        dict: requests, errors, elapsed, rps and latency percentiles in ms
+    """
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        session = requests.Session()
+        local_latencies = []
+        local_errors = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = session.request(method, url, headers=headers, json=json_body, timeout=timeout)
+                # Read the whole body - serialization cost is part of the latency
+                response.content
+                if response.status_code >= 400:
+                    local_errors += 1
+            except requests.RequestException:
+                local_errors += 1
+            local_latencies.append((time.perf_counter() - started) * 1000)
+        session.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors[0] += local_errors
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'url': url,
+        'method': method,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors[0],
+        'elapsed_s': round(elapsed, 3),
+        'rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p90_ms': round(percentile(latencies, 90), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'max_ms': round(latencies[-1], 2) if latencies else 0.0,
+    }
@@ -0,0 +1,82 @@
+"""
+Django management command comparing sync and async endpoints under load
+
+Start one worker of each server so the numbers are per worker, e.g.:
+
+    GUNICORN_WORKERS=1 gunicorn api.wsgi:application -c gunicorn.conf.py
+    GUNICORN_WORKERS=1 GUNICORN_BIND=0.0.0.0:7655 \\
+        GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker gunicorn api.asgi:application -c gunicorn.conf.py
+
+    python manage.py bench_async --sync-base-url http://localhost:7654 --async-base-url http://localhost:7655
+
+All requests come from one IP, so start the server with
+THROTTLE_ENABLED=False to measure the server rather than the rate limiter.
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.loadtest import obtain_token, run_load
+
+
+class Command(BaseCommand):
+    help = 'Sweep concurrency levels and compare req/s and p99 of sync vs async endpoints'
+
+    requires_system_checks = []
+
+    # (sync path, async path)
+    ENDPOINT_PAIRS = [
+        ('/pharmac/drugs/', '/pharmac/async/drugs/'),
+        ('/scraper/drugs', '/scraper/async/drugs'),
+        ('/regulations/', '/regulations/async/'),
+        ('/news/medical/', '/news/async/medical/'),
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sync-base-url', default='http://localhost:7654', help='WSGI server base URL')
+        parser.add_argument('--async-base-url', default='http://localhost:7655', help='ASGI server base URL')
+        parser.add_argument(
+            '--concurrency',
+            default='1,10,50,100',
+            help='Comma separated concurrency levels (default 1,10,50,100)',
+        )
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds per level (default 10)')
+        parser.add_argument('--token', help='JWT access token for authenticated endpoints')
+        parser.add_argument('--email', help='Log in with this email to obtain a token')
+        parser.add_argument('--password', help='Password for --email')
+        parser.add_argument('--output', help='Write results to this JSON file')
+
+    def handle(self, *args, **options):
+        levels = [int(level) for level in options['concurrency'].split(',') if level.strip()]
+        sync_base = options['sync_base_url'].rstrip('/')
+        async_base = options['async_base_url'].rstrip('/')
+
+        token = options['token']
+        if not token and options['email']:
+            token = obtain_token(sync_base, options['email'], options['password'] or '')
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+
+        self.stdout.write(f"🚀 Sync ({sync_base}) vs async ({async_base}), levels: {levels}")
+        self.stdout.write('=' * 70)
+
+        results = []
+        for sync_path, async_path in self.ENDPOINT_PAIRS:
+            self.stdout.write(f'\n📋 {sync_path} vs {async_path}')
+            self.stdout.write(f"   {'clients':>7}  {'sync req/s':>10}  {'async req/s':>11}  {'sync p99':>9}  {'async p99':>9}")
+            for level in levels:
+                sync_stats = run_load(f'{sync_base}{sync_path}', level, options['duration'], headers)
+                async_stats = run_load(f'{async_base}{async_path}', level, options['duration'], headers)
+                results.append({'concurrency': level, 'sync': sync_stats, 'async': async_stats})
+                self.stdout.write(
+                    f"   {level:>7}  {sync_stats['rps']:>10}  {async_stats['rps']:>11}  "
+                    f"{sync_stats['p99_ms']:>7}ms  {async_stats['p99_ms']:>7}ms"
+                )
+                if sync_stats['errors'] or async_stats['errors']:
+                    self.stdout.write(self.style.WARNING(
+                        f"   ⚠️  errors: sync {sync_stats['errors']}, async {async_stats['errors']}"
+                    ))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\n✅ Results written to {options['output']}"))
@@ -0,0 +1,323 @@
+"""
+Django management command running the offline benchmark suite
+
+Everything runs against a throwaway test database (test_<NAME>, created and
+migrated like for the test runner) and without network access:
+- seed: synthetic Drug, DrugEvent, LegalRegulation and MedicalNews rows
+  at the chosen scale (core/benchdata.py),
+- ingestion: import_drugs and every scraper (GIF, URPL, regulations,
+  news) against the local stand-in server replaying HTTP fixtures and
+  stubbing the LLM (core/standin.py); per-phase numbers come from the
+  run's IngestionRun,
+- api: the list and search endpoints through the Django test client,
+  p50/p95/max latency and SQL queries per request.
+
+The report goes to a JSON file; with --baseline the run is compared with
+an earlier report and the command fails when a case got slower than
+--threshold times its baseline, e.g.:
+
+    python manage.py benchmark --scale 10k --output bench.json
+    python manage.py benchmark --scale 100k --keepdb --baseline bench.json
+    python manage.py benchmark --suite api --fixtures recorded.json --llm-latency-ms 300
+
+Run it from Backend/ (import_drugs reads pharmac/initial/drugs.json).
+"""
+import io
+import json
+import statistics
+import time
+from contextlib import nullcontext, redirect_stdout
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.utils import timezone
+
+from core.benchdata import parse_scale, seed
+from core.ingestion import percentile
+from core.replay import load_fixtures, synthetic_fixtures
+from core.standin import StandInServer
+
+SUITES = ['seed', 'ingestion', 'api']
+
+# (name, path, needs a logged-in user)
+API_CASES = [
+    ('drugs_list', '/pharmac/drugs/', False),
+    ('drugs_filter', '/pharmac/drugs/?product_name=Paracetamolum', False),
+    ('drug_events_list', '/scraper/drugs', True),
+    ('drug_events_filter', '/scraper/drugs?source=GIF&event_type=WITHDRAWAL', True),
+    ('regulations_list', '/regulations/', False),
+    ('regulations_filter', '/regulations/?status=active&q=refundacji&ordering=-date', False),
+    ('regulations_search', '/regulations/search/?q=świadczenia gwarantowane', False),
+    ('news_list', '/news/medical/', False),
+    ('news_translated', '/news/medical/?translated=true', False),
+    ('unified_search', '/search/?q=paracetamol', True),
+]
+
+BENCHMARK_EMAIL = 'benchmark@pharmaradar.local'
+
+# Metric compared with the baseline per suite
+REGRESSION_METRICS = {
+    'seed': 'seconds',
+    'ingestion': 'seconds',
+    'api': 'p95_ms',
+}
+
+
+class Command(BaseCommand):
+    help = 'Offline benchmark of seeding, ingestion and API hot paths with a JSON report'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', default='10k', help='Rows per table: 10k, 100k, 1m or a number (default 10k)')
+        parser.add_argument(
+            '--suite',
+            action='append',
+            dest='suites',
+            choices=SUITES,
+            help='Suite to run, can be repeated (default: all)',
+        )
+        parser.add_argument('--fixtures', help='Recorded HTTP fixtures (JSON) instead of synthetic ones')
+        parser.add_argument(
+            '--fixture-rows',
+            type=int,
+            default=200,
+            help='Entries per source in the synthetic fixtures and news --limit (default 200)',
+        )
+        parser.add_argument('--http-latency-ms', type=int, default=0, help='Delay of every replayed HTTP response')
+        parser.add_argument('--llm-latency-ms', type=int, default=50, help='Delay of every stub LLM answer (default 50)')
+        parser.add_argument('--ai-workers', type=int, default=4, help='Concurrent AI requests in regulations/news')
+        parser.add_argument('--repeat', type=int, default=20, help='Requests per API case (default 20)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per seeding transaction')
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Keep the test database (and its seeded data) for the next run',
+        )
+        parser.add_argument(
+            '--no-test-db',
+            action='store_true',
+            help='Use the configured database as is - only for a disposable database',
+        )
+        parser.add_argument('--output', help='Write the report to this JSON file')
+        parser.add_argument('--baseline', help='Compare with this earlier report')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=1.25,
+            help='Fail when a case is this many times slower than the baseline (default 1.25)',
+        )
+        parser.add_argument('--verbose', action='store_true', help='Show the output of the scrapers')
+
+    def handle(self, *args, **options):
+        suites = options['suites'] or SUITES
+        scale = parse_scale(options['scale'])
+
+        # DEBUG off like under the test runner - query logging would skew the timings
+        setup_test_environment(debug=False)
+        old_config = None
+        if not options['no_test_db']:
+            old_config = setup_databases(
+                verbosity=1 if options['verbose'] else 0,
+                interactive=False,
+                keepdb=options['keepdb'],
+            )
+        try:
+            report = {
+                'created_at': timezone.now().isoformat(),
+                'vendor': connection.vendor,
+                'scale': scale,
+                'fixtures': options['fixtures'] or f"synthetic:{options['fixture_rows']}",
+                'llm_latency_ms': options['llm_latency_ms'],
+                'http_latency_ms': options['http_latency_ms'],
+            }
+            self.stdout.write(
+                f"🏁 Benchmark on {connection.settings_dict['NAME']} ({connection.vendor}), "
+                f"scale {scale}, suites: {', '.join(suites)}"
+            )
+            if 'seed' in suites:
+                report['seed'] = self.run_seed(scale, options)
+            if 'ingestion' in suites:
+                report['ingestion'] = self.run_ingestion(options)
+            if 'api' in suites:
+                report['api'] = self.run_api(options)
+        finally:
+            if old_config is not None:
+                teardown_databases(old_config, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            self.stdout.write(self.style.SUCCESS(f"\n✅ Report written to {options['output']}"))
+
+        if options['baseline']:
+            with open(options['baseline'], 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+            regressions = self.compare(report, baseline, options['threshold'])
+            if regressions:
+                for message in regressions:
+                    self.stdout.write(self.style.ERROR(f"❌ {message}"))
+                raise CommandError(f"{len(regressions)} benchmark case(s) regressed against {options['baseline']}")
+            self.stdout.write(self.style.SUCCESS(f"✅ No regressions against {options['baseline']}"))
+
+    def run_seed(self, scale, options):
+        from pharmac.models import Drug
+
+        self.stdout.write('\n📦 Seeding')
+        if options['keepdb'] and Drug.objects.count() >= scale:
+            self.stdout.write(f"  ⏭️  Test database already seeded ({Drug.objects.count()} drugs)")
+            return {}
+
+        results = seed(scale, batch_size=options['batch_size'], log=lambda line: self.stdout.write(f"  {line}"))
+        for name, result in results.items():
+            self.stdout.write(f"  ✅ {name:<12} {result['rows']:>8} rows  {result['seconds']:>8.2f}s  "
+                              f"{result['rows_per_second'] or 0:>10.0f} rows/s")
+        return results
+
+    def run_ingestion(self, options):
+        from core.models import IngestionRun
+        from regulations.scraper import scrape_legal_regulations
+        from scraper.gif_scraper import scrape_rdg_data
+        from scraper.urpl_scraper import scrape_medicinal_products
+
+        fixtures = (
+            load_fixtures(options['fixtures']) if options['fixtures']
+            else synthetic_fixtures(options['fixture_rows'])
+        )
+        rows = options['fixture_rows']
+        cases = [
+            ('import_drugs', lambda: call_command('import_drugs', stdout=io.StringIO())),
+            ('gif', scrape_rdg_data),
+            ('urpl', scrape_medicinal_products),
+            ('regulations', lambda: scrape_legal_regulations(ai_workers=options['ai_workers'])),
+            ('news', lambda: call_command(
+                'fetch_medical_news',
+                limit=rows,
+                efetch_batch_size=max(rows, 200),
+                workers=options['ai_workers'],
+                rate=1000.0,
+                stdout=io.StringIO(),
+            )),
+        ]
+
+        self.stdout.write(f"\n🔁 Ingestion (LLM stub {options['llm_latency_ms']}ms, HTTP replay {options['http_latency_ms']}ms)")
+        results = {}
+        standin = StandInServer(
+            fixtures=fixtures,
+            latency_ms=options['http_latency_ms'],
+            llm_latency_ms=options['llm_latency_ms'],
+        )
+        with standin, override_settings(**standin.settings(), SCALEWAY_API_KEY='benchmark'):
+            for name, run in cases:
+                case_started_at = timezone.now()
+                started = time.perf_counter()
+                error = None
+                try:
+                    with nullcontext() if options['verbose'] else redirect_stdout(io.StringIO()):
+                        run()
+                except Exception as e:
+                    error = f"{type(e).__name__}: {str(e)}"
+                seconds = time.perf_counter() - started
+
+                record = IngestionRun.objects.filter(source=name, started_at__gte=case_started_at).first()
+                result = {
+                    'status': 'error' if error or (record and record.status == IngestionRun.Status.FAILED) else 'ok',
+                    'seconds': round(seconds, 3),
+                    'rows': record.rows if record else None,
+                    'rows_per_second': record.rows_per_second if record else None,
+                    'phases': record.phases if record else {},
+                    'llm': record.llm if record else {},
+                    'caches': record.caches if record else {},
+                    'error': error or (record.errors[0] if record and record.errors else None),
+                }
+                results[name] = result
+                self.print_ingestion(name, result)
+        return results
+
+    def print_ingestion(self, name, result):
+        line = f"  {'✅' if result['status'] == 'ok' else '❌'} {name:<13} {result['seconds']:>8.2f}s"
+        if result['rows'] is not None:
+            line += f"  {result['rows']:>6} rows  {result['rows_per_second'] or 0:>8.1f} rows/s"
+        if result['llm'].get('calls'):
+            line += f"  🤖 {result['llm']['calls']} calls, {result['llm'].get('total_tokens', 0)} tok"
+        self.stdout.write(line)
+        if result['phases']:
+            self.stdout.write('     ' + ', '.join(
+                f"{phase} {values['seconds']:.2f}s" for phase, values in result['phases'].items()
+            ))
+        if result['error']:
+            self.stdout.write(self.style.WARNING(f"     ⚠️  {result['error']}"))
+
+    def run_api(self, options):
+        from django.contrib.auth import get_user_model
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        User = get_user_model()
+        user = User.objects.filter(email=BENCHMARK_EMAIL).first() or User.objects.create_user(
+            email=BENCHMARK_EMAIL, first_name='Benchmark', last_name='User', account_type='doctor'
+        )
+        auth_headers = {'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(user)}'}
+        # Server errors are reported as the case status, not raised
+        client = Client(raise_request_exception=False)
+
+        self.stdout.write(f"\n🌐 API ({options['repeat']} requests per case)")
+        results = {}
+        with override_settings(THROTTLE_ENABLED=False):
+            for name, path, needs_auth in API_CASES:
+                headers = auth_headers if needs_auth else {}
+                # First request warms up caches and counts the queries
+                with CaptureQueriesContext(connection) as queries:
+                    response = client.get(path, **headers)
+                # Read now - the next request_started signal resets the query log
+                query_count = len(queries)
+                timings = []
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    response = client.get(path, **headers)
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                result = {
+                    'path': path,
+                    'status': response.status_code,
+                    'queries': query_count,
+                    'bytes': len(response.content),
+                    'p50_ms': round(statistics.median(timings), 2),
+                    'p95_ms': round(percentile(timings, 0.95), 2),
+                    'max_ms': round(max(timings), 2),
+                }
+                results[name] = result
+                icon = '✅' if response.status_code < 400 else '❌'
+                self.stdout.write(
+                    f"  {icon} {name:<20} {response.status_code}  p50 {result['p50_ms']:>8.2f}ms  "
+                    f"p95 {result['p95_ms']:>8.2f}ms  {result['queries']:>3} queries"
+                )
+        return results
+
+    def compare(self, report, baseline, threshold):
+        """Cases whose metric is at least `threshold` times the baseline value"""
+        if baseline.get('scale') != report.get('scale'):
+            self.stdout.write(self.style.WARNING(
+                f"⚠️  Baseline scale {baseline.get('scale')} differs from {report.get('scale')}"
+            ))
+
+        regressions = []
+        for suite, metric in REGRESSION_METRICS.items():
+            for name, current in report.get(suite, {}).items():
+                previous = baseline.get(suite, {}).get(name) or {}
+                if not previous.get(metric) or current.get(metric) is None:
+                    continue
+                ratio = current[metric] / previous[metric]
+                if ratio >= threshold:
+                    regressions.append(
+                        f"{suite}/{name}: {metric} {current[metric]} vs {previous[metric]} ({ratio:.2f}x)"
+                    )
+        return regressions
@@ -0,0 +1,128 @@
+"""
+Django management command to prepare the database on container start
+
+Replaces the makemigrations / migrate / "manage.py shell" sequence that
+used to start Django three times on every boot. Everything runs in one
+process and each phase is skipped when there is nothing to do.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.state import ProjectState
+
+# Arbitrary key for the PostgreSQL advisory lock that serializes migrations
+# when several containers boot at the same time
+MIGRATION_LOCK_ID = 4207_2025
+
+
+class Command(BaseCommand):
+    help = 'Apply pending migrations and create the superuser, with per-phase timings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check-models',
+            action='store_true',
+            help='Warn about model changes that have no migration yet (replaces makemigrations on boot)',
+        )
+        parser.add_argument(
+            '--skip-superuser',
+            action='store_true',
+            help='Do not create the superuser from DJANGO_SUPERUSER_* variables',
+        )
+
+    def handle(self, *args, **options):
+        self.timings = []
+        started = time.perf_counter()
+
+        self.stdout.write('🚀 Bootstrapping...')
+        self.stdout.write('=' * 50)
+
+        with self.phase('migrations'):
+            self.apply_migrations(options['check_models'])
+
+        if not options['skip_superuser']:
+            with self.phase('superuser'):
+                self.ensure_superuser()
+
+        total_ms = (time.perf_counter() - started) * 1000
+        self.stdout.write('\n⏱️  Timings:')
+        for name, elapsed_ms in self.timings:
+            self.stdout.write(f'   - {name}: {elapsed_ms:.0f} ms')
+        self.stdout.write(self.style.SUCCESS(f'✅ Bootstrap completed in {total_ms:.0f} ms'))
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((name, (time.perf_counter() - started) * 1000))
+
+    @contextmanager
+    def migration_lock(self):
+        if connection.vendor != 'postgresql':
+            yield
+            return
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_lock(%s)', [MIGRATION_LOCK_ID])
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_unlock(%s)', [MIGRATION_LOCK_ID])
+
+    def apply_migrations(self, check_models):
+        with self.migration_lock():
+            executor = MigrationExecutor(connection)
+            plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+
+            if check_models:
+                self.check_model_changes(executor)
+
+            if not plan:
+                self.stdout.write('✅ Database schema is up to date, skipping migrate')
+                return
+
+            self.stdout.write(f'📋 Applying {len(plan)} migration(s)...')
+            call_command('migrate', interactive=False, verbosity=1)
+
+    def check_model_changes(self, executor):
+        """Same detection as `makemigrations --check`, without writing files"""
+        autodetector = MigrationAutodetector(
+            executor.loader.project_state(),
+            ProjectState.from_apps(apps),
+        )
+        changes = autodetector.changes(graph=executor.loader.graph)
+        if changes:
+            self.stdout.write(self.style.WARNING(
+                f"⚠️  Models changed without migrations in: {', '.join(sorted(changes))}. "
+                f"Run `python manage.py makemigrations` and commit the result."
+            ))
+
+    def ensure_superuser(self):
+        email = os.getenv('DJANGO_SUPERUSER_EMAIL')
+        password = os.getenv('DJANGO_SUPERUSER_PASSWORD')
+        if not email or not password:
+            self.stdout.write('⏭️  DJANGO_SUPERUSER_EMAIL/PASSWORD not set, skipping superuser')
+            return
+
+        User = get_user_model()
+        if User.objects.filter(email=email).exists():
+            self.stdout.write('✅ Superuser already exists')
+            return
+
+        User.objects.create_superuser(
+            email=email,
+            first_name='Admin',
+            last_name='User',
+            password=password,
+        )
+        self.stdout.write(self.style.SUCCESS('✅ Superuser created successfully!'))
@@ -0,0 +1,114 @@
+"""
+Django management command summarizing `python -X importtime` output
+
+Starts a fresh interpreter that runs django.setup() and loads the given
+management command (without running it), then prints where the import
+time went, e.g.:
+
+    python manage.py importtime_report --command check_scraping
+    python manage.py importtime_report --command fetch_medical_news --top 30
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output
+
+    Returns:
+        list of dicts with module, self_us, cumulative_us and depth
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        entries.append({
+            'module': module,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            # Python indents nested imports by two spaces per level
+            'depth': (len(indent) - 1) // 2,
+        })
+    return entries
+
+
+class Command(BaseCommand):
+    help = 'Profile start-up import time of Django and a management command (-X importtime digest)'
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('--command', dest='command_name', help='Management command to load')
+        parser.add_argument(
+            '--module',
+            action='append',
+            dest='modules',
+            default=[],
+            help='Extra module to import after setup, can be repeated',
+        )
+        parser.add_argument('--top', type=int, default=20, help='Number of modules to list (default 20)')
+        parser.add_argument('--output', help='Write the parsed entries to this JSON file')
+
+    def handle(self, *args, **options):
+        script = self.build_script(options['command_name'], options['modules'])
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'api.settings'))
+
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+        entries = parse_importtime(process.stderr)
+        if process.returncode != 0 or not entries:
+            raise CommandError(f'Profiled interpreter failed:\n{process.stderr[-2000:]}')
+
+        total_us = sum(e['cumulative_us'] for e in entries if e['depth'] == 0)
+        target = options['command_name'] or 'django.setup()'
+
+        self.stdout.write(f'⏱️  Import time for {target}: {total_us / 1000:.1f} ms ({len(entries)} modules)')
+        self.stdout.write('=' * 70)
+
+        self.stdout.write(f"\n📦 Top {options['top']} packages by self time:")
+        by_package = defaultdict(int)
+        for entry in entries:
+            by_package[entry['module'].split('.')[0]] += entry['self_us']
+        for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:options['top']]:
+            share = self_us / total_us * 100 if total_us else 0
+            self.stdout.write(f'   {self_us / 1000:>8.1f} ms  {share:>5.1f}%  {package}')
+
+        self.stdout.write(f"\n🔍 Top {options['top']} modules by cumulative time:")
+        for entry in sorted(entries, key=lambda e: -e['cumulative_us'])[:options['top']]:
+            self.stdout.write(f"   {entry['cumulative_us'] / 1000:>8.1f} ms  {entry['module']}")
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump({'target': target, 'total_us': total_us, 'entries': entries}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\n✅ Entries written to {options['output']}"))
+
+    def build_script(self, command_name, modules):
+        lines = [
+            'import django',
+            'django.setup()',
+        ]
+        if command_name:
+            lines += [
+                'from django.core.management import get_commands, load_command_class',
+                'commands = get_commands()',
+                f'load_command_class(commands[{command_name!r}], {command_name!r})',
+            ]
+        lines += [f'import {module}' for module in modules]
+        return '\n'.join(lines)
@@ -0,0 +1,134 @@
+"""
+Django management command reporting ingestion run metrics across days
+
+Lists the recorded runs (core.IngestionRun) per source and compares the
+latest successful run with the median of the earlier ones, flagging
+regressions in duration, rows/s and LLM latency, e.g.:
+
+    python manage.py ingestion_report
+    python manage.py ingestion_report --source news --days 30
+    python manage.py ingestion_report --json > ingestion.json
+"""
+import json
+import statistics
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import IngestionRun
+
+
+class Command(BaseCommand):
+    help = 'Report ingestion run metrics (phases, rows/s, LLM usage, caches) and flag regressions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            action='append',
+            dest='sources',
+            choices=IngestionRun.Source.values,
+            help='Source to report, can be repeated (default: all)',
+        )
+        parser.add_argument('--days', type=int, default=14, help='Runs from the last N days (default 14)')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=1.5,
+            help='Flag the latest run when it is this many times worse than the median (default 1.5)',
+        )
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options['days'])
+        sources = options['sources'] or IngestionRun.Source.values
+
+        report = {}
+        for source in sources:
+            runs = list(IngestionRun.objects.filter(source=source, started_at__gte=since).order_by('-started_at'))
+            if runs:
+                report[source] = {
+                    'runs': [self.run_dict(run) for run in runs],
+                    'regressions': self.regressions(runs, options['threshold']),
+                }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False, default=str))
+            return
+
+        if not report:
+            self.stdout.write(self.style.WARNING(f"⚠️  No ingestion runs in the last {options['days']} days"))
+            return
+
+        for source, data in report.items():
+            self.stdout.write('\n' + '=' * 70)
+            self.stdout.write(self.style.SUCCESS(f"📊 {IngestionRun.Source(source).label}"))
+            self.stdout.write('=' * 70)
+            for run in data['runs']:
+                self.print_run(run)
+            for message in data['regressions']:
+                self.stdout.write(self.style.WARNING(f"⚠️  {message}"))
+
+    def run_dict(self, run):
+        return {
+            'started_at': run.started_at,
+            'status': run.status,
+            'duration_seconds': run.duration_seconds,
+            'rows': run.rows,
+            'rows_per_second': run.rows_per_second,
+            'phases': run.phases,
+            'counters': run.counters,
+            'llm': run.llm,
+            'caches': run.caches,
+            'error_count': run.error_count,
+        }
+
+    def print_run(self, run):
+        icon = {'success': '✅', 'failed': '❌'}.get(run['status'], '⏳')
+        duration = f"{run['duration_seconds']:.1f}s" if run['duration_seconds'] is not None else '-'
+        line = (
+            f"{icon} {run['started_at']:%Y-%m-%d %H:%M}  {duration:>8}  {run['rows']:>6} rows  "
+            f"{run['rows_per_second'] or 0:>7.1f} rows/s"
+        )
+        llm = run['llm']
+        if llm.get('calls'):
+            line += f"  🤖 {llm['calls']} calls, {llm.get('total_tokens', 0)} tok, p95 {llm.get('latency_p95_ms', 0):.0f}ms"
+        if run['error_count']:
+            line += f"  ❌ {run['error_count']} errors"
+        self.stdout.write(line)
+
+        if run['phases']:
+            self.stdout.write('    phases: ' + ', '.join(
+                f"{name} {phase['seconds']:.2f}s" for name, phase in run['phases'].items()
+            ))
+        if run['caches']:
+            self.stdout.write('    caches: ' + ', '.join(
+                f"{name} {cache['hit_rate']:.0%}" for name, cache in run['caches'].items()
+            ))
+
+    def regressions(self, runs, threshold):
+        """Compare the latest successful run with the median of the earlier ones"""
+        successful = [run for run in runs if run.status == IngestionRun.Status.SUCCESS]
+        if len(successful) < 2:
+            return []
+        latest, earlier = successful[0], successful[1:]
+
+        messages = []
+        checks = [
+            ('duration', lambda run: run.duration_seconds, True),
+            ('rows/s', lambda run: run.rows_per_second if run.rows else None, False),
+            ('LLM p95 latency', lambda run: run.llm.get('latency_p95_ms'), True),
+        ]
+        for name, value, higher_is_worse in checks:
+            current = value(latest)
+            history = [value(run) for run in earlier if value(run)]
+            if not current or not history:
+                continue
+            median = statistics.median(history)
+            ratio = current / median if higher_is_worse else median / current
+            if ratio >= threshold:
+                messages.append(
+                    f"{name} of the {latest.started_at:%Y-%m-%d %H:%M} run is {ratio:.1f}x worse "
+                    f"than the median of {len(history)} earlier runs ({current:.2f} vs {median:.2f})"
+                )
+        return messages
@@ -0,0 +1,112 @@
+"""
+Django management command to load test the API
+
+Run it once against the development server and once against the
+production profile to compare them, e.g.:
+
+    python manage.py loadtest --base-url http://localhost:7654 --label runserver --output before.json
+    python manage.py loadtest --base-url http://localhost:7654 --label gunicorn --compare before.json
+
+All requests come from one IP, so start the server with
+THROTTLE_ENABLED=False to measure the server rather than the rate limiter.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.loadtest import obtain_token, run_load
+
+
+class Command(BaseCommand):
+    help = 'Load test API endpoints and report req/s and p50/p90/p99 latency'
+
+    requires_system_checks = []
+
+    DEFAULT_ENDPOINTS = ['/scraper/drugs', '/pharmac/drugs/']
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:7654', help='API base URL')
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            dest='endpoints',
+            help='Endpoint path to test, can be repeated (default: drug and drug event lists)',
+        )
+        parser.add_argument('--concurrency', type=int, default=10, help='Parallel clients (default 10)')
+        parser.add_argument('--duration', type=float, default=30.0, help='Seconds per endpoint (default 30)')
+        parser.add_argument('--token', help='JWT access token for authenticated endpoints')
+        parser.add_argument('--email', help='Log in with this email to obtain a token')
+        parser.add_argument('--password', help='Password for --email')
+        parser.add_argument('--label', default='run', help='Name of this run in the JSON report')
+        parser.add_argument('--output', help='Write results to this JSON file')
+        parser.add_argument('--compare', help='JSON file from a previous run to compare against')
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/')
+        endpoints = options['endpoints'] or self.DEFAULT_ENDPOINTS
+
+        token = options['token']
+        if not token and options['email']:
+            token = obtain_token(base_url, options['email'], options['password'] or '')
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+
+        self.stdout.write(
+            f"🚀 Load testing {base_url} - {options['concurrency']} clients, "
+            f"{options['duration']}s per endpoint"
+        )
+        self.stdout.write('=' * 70)
+
+        results = []
+        for endpoint in endpoints:
+            stats = run_load(
+                f'{base_url}{endpoint}',
+                concurrency=options['concurrency'],
+                duration=options['duration'],
+                headers=headers,
+            )
+            stats['endpoint'] = endpoint
+            results.append(stats)
+            self.write_stats(stats)
+
+        report = {'label': options['label'], 'base_url': base_url, 'results': results}
+
+        if options['compare']:
+            self.write_comparison(report, options['compare'])
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"\n✅ Results written to {options['output']}"))
+
+    def write_stats(self, stats):
+        style = self.style.SUCCESS if not stats['errors'] else self.style.WARNING
+        self.stdout.write(style(
+            f"{stats['endpoint']}\n"
+            f"   - Requests: {stats['requests']} ({stats['errors']} errors)\n"
+            f"   - Throughput: {stats['rps']} req/s\n"
+            f"   - Latency: p50 {stats['p50_ms']} ms, p90 {stats['p90_ms']} ms, "
+            f"p99 {stats['p99_ms']} ms, max {stats['max_ms']} ms"
+        ))
+
+    def write_comparison(self, report, baseline_path):
+        try:
+            with open(baseline_path, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise CommandError(f'Could not read baseline {baseline_path}: {str(e)}')
+
+        before = {r['endpoint']: r for r in baseline.get('results', [])}
+        self.stdout.write('\n' + '=' * 70)
+        self.stdout.write(self.style.SUCCESS(f"📊 {baseline.get('label')} -> {report['label']}"))
+        self.stdout.write('=' * 70)
+
+        for stats in report['results']:
+            old = before.get(stats['endpoint'])
+            if not old:
+                continue
+            rps_ratio = stats['rps'] / old['rps'] if old['rps'] else 0
+            self.stdout.write(
+                f"{stats['endpoint']}\n"
+                f"   - req/s: {old['rps']} -> {stats['rps']} (x{rps_ratio:.2f})\n"
+                f"   - p99: {old['p99_ms']} ms -> {stats['p99_ms']} ms"
+            )
@@ -0,0 +1,92 @@
+"""
+Django management command serving local stand-ins for the external sources
+
+Answers for RDG, URPL, the gov.pl register, NCBI E-utilities and the
+Scaleway LLM (core/standin.py) and prints the settings to point the
+scrapers at it, e.g.:
+
+    python manage.py run_standin                                  # synthetic data
+    python manage.py run_standin --mode record --fixtures live.json
+    python manage.py run_standin --mode replay --fixtures live.json --latency-ms 200 --error-rate 0.05
+"""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.replay import load_fixtures, synthetic_fixtures
+from core.standin import StandInServer
+
+
+class Command(BaseCommand):
+    help = 'Serve local stand-ins (record/replay) for RDG, URPL, gov.pl, NCBI and the LLM'
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default 127.0.0.1)')
+        parser.add_argument('--port', type=int, default=8900, help='Port to bind (default 8900)')
+        parser.add_argument(
+            '--mode',
+            choices=['synthetic', 'replay', 'record'],
+            default='synthetic',
+            help='synthetic fixtures, replay --fixtures, or record live answers into --fixtures',
+        )
+        parser.add_argument('--fixtures', help='Fixture file to replay or record into')
+        parser.add_argument('--rows', type=int, default=200, help='Rows per source in synthetic mode (default 200)')
+        parser.add_argument('--latency-ms', type=float, default=0, help='Delay of every upstream answer')
+        parser.add_argument('--jitter-ms', type=float, default=0, help='Random extra delay of every answer')
+        parser.add_argument('--llm-latency-ms', type=float, default=0, help='Delay of every LLM answer')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Share of upstream requests answered 503')
+        parser.add_argument('--llm-error-rate', type=float, default=0.0, help='Share of LLM requests answered 429')
+        parser.add_argument('--seed', type=int, default=0, help='Seed of the jitter and error injection')
+        parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    def handle(self, *args, **options):
+        mode = options['mode']
+        fixtures_path = options['fixtures']
+
+        if mode == 'synthetic':
+            fixtures = synthetic_fixtures(options['rows'])
+        elif not fixtures_path:
+            raise CommandError(f"--fixtures is required in {mode} mode")
+        elif os.path.exists(fixtures_path):
+            fixtures = load_fixtures(fixtures_path)
+        elif mode == 'replay':
+            raise CommandError(f"Fixture file {fixtures_path} does not exist")
+        else:
+            fixtures = []
+
+        server = StandInServer(
+            host=options['host'],
+            port=options['port'],
+            fixtures=fixtures,
+            mode='record' if mode == 'record' else 'replay',
+            record_path=fixtures_path if mode == 'record' else None,
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            llm_latency_ms=options['llm_latency_ms'],
+            error_rate=options['error_rate'],
+            llm_error_rate=options['llm_error_rate'],
+            seed=options['seed'],
+            verbose=options['verbose'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🚀 Stand-in ({mode}, {len(server.store.fixtures)} fixtures) on {server.base_url}"
+        ))
+        self.stdout.write('🔧 Point the scrapers at it with:')
+        for name, value in server.settings().items():
+            self.stdout.write(f"    export {name}='{value}'")
+        self.stdout.write("    export SCALEWAY_API_KEY='standin'")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+        self.stdout.write('\n📊 Requests served:')
+        for source, stats in sorted(server.stats.items()):
+            self.stdout.write(f"    {source}: " + ', '.join(f"{name} {value}" for name, value in sorted(stats.items())))
+        if mode == 'record':
+            self.stdout.write(self.style.SUCCESS(f"💾 {len(server.store.fixtures)} fixtures in {fixtures_path}"))
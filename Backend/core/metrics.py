@@ -0,0 +1,128 @@
+"""
+In-process metrics registry with Prometheus text exposition
+
+Counters and histograms live in memory of the worker process, so every
+gunicorn/uvicorn worker exposes its own numbers (scrape each worker, or
+sum them in the dashboard). Label values should have low cardinality -
+the request instrumentation uses URL routes, not paths.
+"""
+import bisect
+import threading
+
+# Seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Queries per request - a high tail means N+1
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        # Replaced by the registry lock on registration
+        self.lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1.0):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self):
+        for labels, value in self.values.items():
+            yield self.name, labels, value
+
+
+class Histogram:
+    def __init__(self, name, documentation, labelnames=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [bucket counts..., +Inf count, sum]
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def observe(self, value, labels=()):
+        with self.lock:
+            state = self.values.get(labels)
+            if state is None:
+                state = self.values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[bisect.bisect_left(self.buckets, value)] += 1
+            state[-1] += value
+
+    def samples(self):
+        for labels, state in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), state[:-1]):
+                cumulative += count
+                yield f'{self.name}_bucket', labels + (('le', _format_bound(bound)),), cumulative
+            yield f'{self.name}_count', labels, cumulative
+            yield f'{self.name}_sum', labels, state[-1]
+
+
+def _format_bound(bound):
+    return bound if isinstance(bound, str) else repr(float(bound))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class Registry:
+    """Thread-safe collection of metrics"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DURATION_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        # One lock for all metrics, so render() sees a consistent snapshot
+        metric.lock = self.lock
+        with self.lock:
+            return self.metrics.setdefault(metric.name, metric)
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        with self.lock:
+            for metric in self.metrics.values():
+                kind = 'histogram' if isinstance(metric, Histogram) else 'counter'
+                lines.append(f'# HELP {metric.name} {metric.documentation}')
+                lines.append(f'# TYPE {metric.name} {kind}')
+                for name, labels, value in metric.samples():
+                    label_pairs = list(zip(metric.labelnames, labels[:len(metric.labelnames)]))
+                    label_pairs += list(labels[len(metric.labelnames):])
+                    rendered = ','.join(f'{key}="{_escape(val)}"' for key, val in label_pairs)
+                    lines.append(f'{name}{{{rendered}}} {value}' if rendered else f'{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUEST_LABELS = ('view', 'method')
+
+requests_total = registry.counter(
+    'http_requests_total', 'HTTP requests by route, method and status', REQUEST_LABELS + ('status',)
+)
+request_duration = registry.histogram(
+    'http_request_duration_seconds', 'Total request time', REQUEST_LABELS
+)
+request_queries = registry.histogram(
+    'http_request_sql_queries', 'SQL queries per request', REQUEST_LABELS, buckets=QUERY_COUNT_BUCKETS
+)
+sql_seconds = registry.counter(
+    'http_request_sql_seconds_total', 'Time spent executing SQL', REQUEST_LABELS
+)
+serialize_seconds = registry.counter(
+    'http_request_serialize_seconds_total', 'Time spent in serializers', REQUEST_LABELS
+)
+render_seconds = registry.counter(
+    'http_request_render_seconds_total', 'Time spent rendering responses', REQUEST_LABELS
+)
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.11 on 2026-10-19 13:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngestionRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('gif', 'GIF (RDG decisions)'), ('urpl', 'URPL (medicinal products)'), ('regulations', 'Legal regulations (gov.pl)'), ('news', 'Medical news (PubMed)'), ('import_drugs', 'Drug import (JSON)')], max_length=20)),
+                ('status', models.CharField(choices=[('running', 'Running'), ('success', 'Success'), ('failed', 'Failed')], default='running', max_length=10)),
+                ('started_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('duration_seconds', models.FloatField(blank=True, null=True)),
+                ('rows', models.PositiveIntegerField(default=0)),
+                ('rows_per_second', models.FloatField(blank=True, null=True)),
+                ('phases', models.JSONField(blank=True, default=dict)),
+                ('counters', models.JSONField(blank=True, default=dict)),
+                ('llm', models.JSONField(blank=True, default=dict)),
+                ('caches', models.JSONField(blank=True, default=dict)),
+                ('error_count', models.PositiveIntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['source', '-started_at'], name='ingestion_source_started_idx')],
+            },
+        ),
+    ]
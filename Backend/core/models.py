@@ -0,0 +1,56 @@
+from django.db import models
+
+
+class IngestionRun(models.Model):
+    """
+    Metrics of one ingestion run (scraper, news import, drug import)
+
+    Written by core.ingestion.RunRecorder - one row per run, so phase
+    timings, throughput and LLM usage can be compared across days
+    (manage.py ingestion_report).
+    """
+
+    class Source(models.TextChoices):
+        GIF = 'gif', 'GIF (RDG decisions)'
+        URPL = 'urpl', 'URPL (medicinal products)'
+        REGULATIONS = 'regulations', 'Legal regulations (gov.pl)'
+        NEWS = 'news', 'Medical news (PubMed)'
+        IMPORT_DRUGS = 'import_drugs', 'Drug import (JSON)'
+
+    class Status(models.TextChoices):
+        RUNNING = 'running', 'Running'
+        SUCCESS = 'success', 'Success'
+        FAILED = 'failed', 'Failed'
+
+    source = models.CharField(max_length=20, choices=Source.choices)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.RUNNING)
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_seconds = models.FloatField(null=True, blank=True)
+
+    # Rows written (created + updated) and throughput over the whole run
+    rows = models.PositiveIntegerField(default=0)
+    rows_per_second = models.FloatField(null=True, blank=True)
+
+    # {"http": {"seconds": 1.2, "calls": 3}, ...} - seconds summed over threads
+    phases = models.JSONField(default=dict, blank=True)
+    # Free-form counters: {"created": 10, "duplicates": 90, ...}
+    counters = models.JSONField(default=dict, blank=True)
+    # {"calls", "errors", "prompt_tokens", "completion_tokens", "total_tokens",
+    #  "latency_p50_ms", "latency_p95_ms", "latency_max_ms"}
+    llm = models.JSONField(default=dict, blank=True)
+    # {"translated": {"hits": 40, "misses": 10, "hit_rate": 0.8}, ...}
+    caches = models.JSONField(default=dict, blank=True)
+
+    error_count = models.PositiveIntegerField(default=0)
+    # First errors of the run (capped, see core.ingestion.MAX_STORED_ERRORS)
+    errors = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['source', '-started_at'], name='ingestion_source_started_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.source} {self.started_at:%Y-%m-%d %H:%M} ({self.status})"
@@ -0,0 +1,180 @@
+"""
+Query budget for the read endpoints
+
+Keeps a single request from materializing and serializing a whole table:
+- `limit` parameters are validated and clamped to MAX_LIMIT,
+- pathological query parameters (too many, too long, NUL bytes) get a 400,
+- list endpoints switch to cursor pagination when the client asks for a
+  `cursor` or `page_size`, so deep reads are keyset seeks, not OFFSETs,
+- unpaginated lists (what the frontend uses today) are capped at
+  MAX_UNPAGINATED_RESULTS rows and flagged with the X-Result-Truncated
+  header.
+
+Limits come from settings.QUERY_BUDGET.
+"""
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+from .instrumentation import timed
+
+DEFAULTS = {
+    'DEFAULT_LIMIT': 10,
+    'MAX_LIMIT': 100,
+    'PAGE_SIZE': 50,
+    'MAX_PAGE_SIZE': 200,
+    'MAX_UNPAGINATED_RESULTS': 5000,
+    'MAX_PARAMS': 20,
+    'MAX_PARAM_LENGTH': 200,
+}
+
+TRUNCATED_HEADER = 'X-Result-Truncated'
+RESULT_LIMIT_HEADER = 'X-Result-Limit'
+
+
+def budget(key):
+    """Return a QUERY_BUDGET setting, falling back to DEFAULTS"""
+    return getattr(settings, 'QUERY_BUDGET', {}).get(key, DEFAULTS[key])
+
+
+def validate_value(name, value):
+    """Reject a single pathological parameter value"""
+    if len(value) > budget('MAX_PARAM_LENGTH'):
+        raise ValidationError({name: f"Ensure this value has at most {budget('MAX_PARAM_LENGTH')} characters."})
+    if '\x00' in value:
+        raise ValidationError({name: 'Null characters are not allowed.'})
+    return value
+
+
+def validate_query_params(params):
+    """
+    Reject pathological query strings before any query runs
+
+    Args:
+        params: request.query_params / request.GET
+
+    Raises:
+        ValidationError (400) on too many, too long or binary parameters
+    """
+    if len(params) > budget('MAX_PARAMS'):
+        raise ValidationError({'detail': f"Too many query parameters (max {budget('MAX_PARAMS')})."})
+    for name, values in params.lists():
+        for value in values:
+            validate_value(name, value)
+
+
+def parse_limit(params, default=None, max_limit=None):
+    """
+    Parse and clamp the `limit` query parameter
+
+    Returns:
+        int between 1 and max_limit (MAX_LIMIT by default)
+
+    Raises:
+        ValidationError (400) if limit is not a positive integer
+    """
+    default = budget('DEFAULT_LIMIT') if default is None else default
+    max_limit = budget('MAX_LIMIT') if max_limit is None else max_limit
+
+    raw = params.get('limit')
+    if raw in (None, ''):
+        return min(default, max_limit)
+    try:
+        limit = int(raw)
+    except (TypeError, ValueError):
+        raise ValidationError({'limit': 'A valid integer is required.'})
+    if limit < 1:
+        raise ValidationError({'limit': 'Ensure this value is greater than or equal to 1.'})
+    return min(limit, max_limit)
+
+
+def wants_cursor(params):
+    return 'cursor' in params or 'page_size' in params
+
+
+def cap_results(queryset, max_results=None):
+    """
+    Evaluate at most MAX_UNPAGINATED_RESULTS rows
+
+    Returns:
+        tuple: (rows, truncated)
+    """
+    max_results = budget('MAX_UNPAGINATED_RESULTS') if max_results is None else max_results
+    rows = list(queryset[:max_results + 1])
+    return rows[:max_results], len(rows) > max_results
+
+
+def mark_truncated(response, truncated):
+    """Tell the client the list was cut off and how to get the rest"""
+    if truncated:
+        response[TRUNCATED_HEADER] = 'true'
+        response[RESULT_LIMIT_HEADER] = str(budget('MAX_UNPAGINATED_RESULTS'))
+    return response
+
+
+class BudgetCursorPagination(CursorPagination):
+    """Cursor pagination ordered by the view's `cursor_ordering`"""
+
+    page_size_query_param = 'page_size'
+
+    def get_page_size(self, request):
+        self.page_size = budget('PAGE_SIZE')
+        self.max_page_size = budget('MAX_PAGE_SIZE')
+        return super().get_page_size(request)
+
+    def get_ordering(self, request, queryset, view):
+        return (getattr(view, 'cursor_ordering', '-id'),)
+
+
+class TimedRetrieveMixin:
+    """retrieve() that reports its serializer time as `serialize`"""
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        with timed('serialize'):
+            data = self.get_serializer(instance).data
+        return Response(data)
+
+
+class QueryBudgetMixin(TimedRetrieveMixin):
+    """
+    Query budget for generic list views and viewsets
+
+    Views keep returning a plain JSON array unless the client sends
+    `cursor` or `page_size`; then the response is a cursor page
+    ({"next", "previous", "results"}) ordered by `cursor_ordering`.
+    """
+
+    pagination_class = BudgetCursorPagination
+    # Field the cursor seeks on - should be indexed and (close to) unique
+    cursor_ordering = '-id'
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        validate_query_params(request.query_params)
+
+    def paginate_queryset(self, queryset):
+        if not wants_cursor(self.request.query_params):
+            return None
+        return super().paginate_queryset(queryset)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        # The page is a list - its query has already run
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            with timed('serialize'):
+                data = self.get_serializer(page, many=True).data
+            return self.get_paginated_response(data)
+
+        return self.capped_response(queryset)
+
+    def capped_response(self, queryset):
+        """Serialize an unpaginated queryset within MAX_UNPAGINATED_RESULTS"""
+        # Evaluated here, so its query is timed as sql and not as serialize
+        rows, truncated = cap_results(queryset)
+        with timed('serialize'):
+            data = self.get_serializer(rows, many=True).data
+        return mark_truncated(Response(data), truncated)
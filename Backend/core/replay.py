@@ -0,0 +1,205 @@
+"""
+Recorded HTTP exchanges of the external services used by ingestion
+
+Fixtures are a JSON list of {method, url, status, headers, body |
+body_base64} with the real upstream URLs. They are recorded and replayed
+by the local stand-in server (core/standin.py, manage.py run_standin);
+`synthetic_fixtures(rows)` builds a set for RDG, URPL, the gov.pl register
+and PubMed of any size, and `stub_completion` answers OpenAI chat
+completion requests in the shapes the AI callers validate.
+"""
+import base64
+import json
+import threading
+import time
+from datetime import date, timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+# Live upstreams - fixtures are keyed by these URLs, the api/settings.py
+# defaults point at them
+RDG_URL = 'https://rdg.ezdrowie.gov.pl/'
+URPL_URL = 'https://rejestry.ezdrowie.gov.pl/api/rpl/medicinal-products/search/public'
+GOVPL_REGISTER_URL = 'https://www.gov.pl/api/data/registers/search?pageId=21034488'
+NCBI_EUTILS_URL = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils'
+ESEARCH_URL = f'{NCBI_EUTILS_URL}/esearch.fcgi'
+EFETCH_URL = f'{NCBI_EUTILS_URL}/efetch.fcgi'
+
+
+def load_fixtures(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_fixtures(path, fixtures):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fixtures, f, indent=1, ensure_ascii=False)
+
+
+def fixture_body(fixture):
+    if 'body_base64' in fixture:
+        return base64.b64decode(fixture['body_base64'])
+    return fixture.get('body', '').encode('utf-8')
+
+
+def request_key(method, url):
+    """(METHOD, host+path) and the sorted query - fixtures match on both"""
+    parts = urlsplit(url)
+    return (method.upper(), f"{parts.netloc}{parts.path}"), sorted(parse_qsl(parts.query))
+
+
+class FixtureStore:
+    """
+    Thread-safe set of fixtures
+
+    A fixture with the same method, host, path and query wins; otherwise the
+    first fixture recorded for the method, host and path is used (e.g.
+    efetch with a different set of ids - request bodies are not compared).
+    """
+
+    def __init__(self, fixtures=()):
+        self.lock = threading.Lock()
+        self.fixtures = []
+        self.index = {}
+        for fixture in fixtures:
+            self.add(fixture)
+
+    def add(self, fixture):
+        """Add a fixture, replacing one recorded for the same method and URL"""
+        key, query = request_key(fixture['method'], fixture['url'])
+        with self.lock:
+            entries = self.index.setdefault(key, [])
+            for position, (recorded_query, recorded) in enumerate(entries):
+                if recorded_query == query:
+                    entries[position] = (query, fixture)
+                    self.fixtures[self.fixtures.index(recorded)] = fixture
+                    return
+            entries.append((query, fixture))
+            self.fixtures.append(fixture)
+
+    def match(self, method, url):
+        key, query = request_key(method, url)
+        with self.lock:
+            candidates = self.index.get(key)
+            if not candidates:
+                return None
+            return next((fixture for recorded_query, fixture in candidates if recorded_query == query), candidates[0][1])
+
+    def save(self, path):
+        with self.lock:
+            save_fixtures(path, list(self.fixtures))
+
+
+def synthetic_fixtures(rows, today=None):
+    """
+    Fixtures for all ingestion sources with `rows` entries each
+
+    RDG decisions are dated within the scraper's 300-day window, PubMed
+    returns `rows` PMIDs and one efetch answer with `rows` articles (run
+    fetch_medical_news with --efetch-batch-size >= rows).
+    """
+    today = today or date.today()
+
+    rdg_rows = []
+    for index in range(rows):
+        decision_type = ['Wycofanie z obrotu', 'Wstrzymanie w obrocie', 'Zakaz wprowadzania do obrotu'][index % 3]
+        rdg_rows.append(
+            f"<tr><td>{(today - timedelta(days=index % 300)).isoformat()}</td><td>GIF-R/{index}/{today.year}</td>"
+            f"<td>Replay Lek {index}</td><td>{10 + index % 5 * 10} mg</td><td>Replay Pharma {index % 7}</td>"
+            f"<td>{decision_type}</td><td></td><td></td></tr>"
+        )
+    rdg_html = (
+        '<html><body><table class="table-decisions"><tbody>' + ''.join(rdg_rows) + '</tbody></table></body></html>'
+    )
+
+    urpl_products = [
+        {
+            'medicinalProductName': f"Replay Produkt {index}",
+            'commonName': f"Replayinum {index}",
+            'pharmaceuticalFormName': 'Tabletki',
+            'medicinalProductPower': '10 mg',
+            'activeSubstanceName': f"Replayinum {index}",
+            'subjectMedicinalProductName': f"Replay Pharma {index % 7}",
+            'registryNumber': str(50000 + index),
+            'procedureTypeName': 'NAR',
+            'expirationDateString': 'Bezterminowe',
+            'atcCode': 'N02BE01',
+        }
+        for index in range(rows)
+    ]
+
+    register = [
+        {
+            'Lp.': str(index + 1),
+            'Nr w Wykazie': f"REPLAY {index}",
+            'Podstawa wydania': f"art. {index % 90 + 1} ustawy o świadczeniach opieki zdrowotnej",
+            'Tytuł rozporządzenia': f"Rozporządzenie Ministra Zdrowia w sprawie świadczeń gwarantowanych ({index})",
+            'Przyczyny rezygnacji z prac nad projektem': '',
+            'Planowany termin wydania / Publikacja w Dz. U': f"{['I', 'II', 'III', 'IV'][index % 4]} kwartał {today.year} r.",
+            'Istota rozwiązań, które planuje się zawrzeć w projekcie:': 'Zmiana warunków realizacji świadczeń.',
+            'Imię, nazwisko, stanowisko lub funkcja osoby odpowiedzialnej za opracowanie projektu:': 'Podsekretarz Stanu',
+            'Przyczyna i potrzeba wprowadzenia rozwiązań, które planuje się zawrzeć w projekcie:': 'Potrzeba aktualizacji.',
+        }
+        for index in range(rows)
+    ]
+
+    pmids = [str(90000000 + index) for index in range(rows)]
+    articles = ''.join(
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<Journal><Title>Replay Journal</Title><JournalIssue><PubDate><Year>{today.year}</Year>"
+        f"<Month>Jan</Month><Day>15</Day></PubDate></JournalIssue></Journal>"
+        f"<ArticleTitle>Replay study {pmid} of clinical outcomes</ArticleTitle>"
+        f"<Abstract><AbstractText>Randomized trial {pmid} in adult patients.</AbstractText></Abstract>"
+        f"</Article></MedlineCitation></PubmedArticle>"
+        for pmid in pmids
+    )
+    efetch_xml = f'<?xml version="1.0"?><PubmedArticleSet>{articles}</PubmedArticleSet>'
+
+    def fixture(method, url, body, content_type):
+        return {'method': method, 'url': url, 'status': 200, 'headers': {'Content-Type': content_type}, 'body': body}
+
+    return [
+        fixture('GET', RDG_URL, rdg_html, 'text/html; charset=utf-8'),
+        fixture('GET', URPL_URL, json.dumps({'content': urpl_products}, ensure_ascii=False), 'application/json'),
+        fixture('GET', GOVPL_REGISTER_URL, json.dumps(register, ensure_ascii=False), 'application/json'),
+        fixture('GET', ESEARCH_URL, json.dumps({'esearchresult': {'idlist': pmids}}), 'application/json'),
+        fixture('POST', EFETCH_URL, efetch_xml, 'text/xml'),
+    ]
+
+
+def stub_completion(body):
+    """Answer of the stub LLM for an OpenAI chat completion request body"""
+    system = body['messages'][0]['content'] if body['messages'] else ''
+    prompt = body['messages'][-1]['content'] if body['messages'] else ''
+
+    if 'JSON array' in system:
+        # news.translation batch - same number of elements back
+        try:
+            texts = json.loads(prompt)
+        except ValueError:
+            texts = []
+        content = json.dumps([f"[PL] {text}" for text in texts], ensure_ascii=False)
+    elif (body.get('response_format') or {}).get('type') == 'json_object' or '"summary"' in prompt:
+        # regulations.summarizer
+        content = json.dumps({
+            'title': 'Zmiany w przepisach dotyczących świadczeń zdrowotnych',
+            'summary': 'Rozporządzenie wprowadza zmiany w organizacji świadczeń. Dotyczy pacjentów i placówek.',
+        }, ensure_ascii=False)
+    elif prompt.startswith('Translate this to Polish: '):
+        content = f"[PL] {prompt[len('Translate this to Polish: '):]}"
+    else:
+        content = 'Decyzja wynika z wykrycia niezgodności jakościowych w kontroli serii produktu.'
+
+    prompt_tokens = sum(len(str(message.get('content', ''))) for message in body['messages']) // 4
+    completion_tokens = len(content) // 4
+    return {
+        'id': 'chatcmpl-stub',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': body.get('model', 'stub'),
+        'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': content}}],
+        'usage': {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'total_tokens': prompt_tokens + completion_tokens,
+        },
+    }
@@ -0,0 +1,279 @@
+"""
+Unified search across drugs, drug events, regulations and news
+
+One request queries every source concurrently (one pool task per source)
+and merges the hits into a single ranked list:
+- every source has its own latency budget, enforced twice: as the
+  PostgreSQL statement_timeout of the source's query and as the time the
+  request waits for it, so a slow source is dropped (status "timeout")
+  instead of stalling the response,
+- every source scores on the same 0..1 scale (trigram similarity, and
+  ts_rank normalized with flag 32 for regulations), multiplied by the
+  source weight before merging, so a weak hit never outranks a strong one
+  just because it was the best of its source,
+- drug events are only searched for authenticated users, like
+  /scraper/drugs.
+
+Limits and budgets come from settings.UNIFIED_SEARCH.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Coalesce, Greatest
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    # Hits fetched per source before merging
+    'SOURCE_LIMIT': 50,
+    'PAGE_SIZE': 20,
+    'MAX_PAGE_SIZE': 50,
+    # Per-source budget in milliseconds
+    'TIMEOUTS_MS': {
+        'drugs': 800,
+        'drug_events': 800,
+        'regulations': 800,
+        'news': 800,
+    },
+    'MAX_WORKERS': 16,
+}
+
+SNIPPET_LENGTH = 200
+
+# Every hit a source returned matched the query - even the weakest keeps
+# this share of the source weight
+MATCH_FLOOR = 0.1
+
+
+def search_settings(key):
+    """Return a UNIFIED_SEARCH setting, falling back to DEFAULTS"""
+    return getattr(settings, 'UNIFIED_SEARCH', {}).get(key, DEFAULTS[key])
+
+
+def snippet(*parts):
+    """Join the non-empty parts and cut to SNIPPET_LENGTH"""
+    text = ' '.join(' · '.join(part for part in parts if part).split())
+    return text if len(text) <= SNIPPET_LENGTH else text[:SNIPPET_LENGTH - 1].rstrip() + '…'
+
+
+def search_drugs(q, limit):
+    from pharmac.models import Drug
+
+    queryset = Drug.objects.filter(
+        Q(nazwa_produktu_leczniczego__icontains=q) |
+        Q(nazwa_powszechnie_stosowana__icontains=q) |
+        Q(substancja_czynna__icontains=q)
+    ).annotate(
+        score=Greatest(
+            TrigramWordSimilarity(q, 'nazwa_produktu_leczniczego'),
+            TrigramWordSimilarity(q, 'nazwa_powszechnie_stosowana'),
+        )
+    ).order_by('-score', 'id')[:limit]
+
+    return [
+        {
+            'id': drug.id,
+            'title': drug.nazwa_produktu_leczniczego,
+            'snippet': snippet(drug.nazwa_powszechnie_stosowana, drug.moc, drug.podmiot_odpowiedzialny),
+            'date': None,
+            'score': drug.score,
+        }
+        for drug in queryset
+    ]
+
+
+def search_drug_events(q, limit):
+    from scraper.models import DrugEvent
+
+    queryset = DrugEvent.objects.filter(
+        Q(drug_name__icontains=q) |
+        Q(description__icontains=q) |
+        Q(decision_number__icontains=q)
+    ).annotate(
+        score=TrigramWordSimilarity(q, 'drug_name')
+    ).order_by('-score', '-publication_date', 'id')[:limit]
+
+    return [
+        {
+            'id': event.id,
+            'title': event.drug_name,
+            'snippet': snippet(event.get_event_type_display(), event.source, event.description),
+            'date': event.publication_date,
+            'score': event.score,
+        }
+        for event in queryset
+    ]
+
+
+def search_regulations(q, limit):
+    from regulations.models import LegalRegulation
+    from regulations.search import search_regulations as ranked_search
+
+    return [
+        {
+            'id': regulation.id,
+            'title': regulation.ai_tytul or regulation.tytul_rozporzadzenia,
+            'snippet': snippet(regulation.ai_description or regulation.istota_rozwiazan),
+            'date': regulation.planowany_termin_wydania_data,
+            'score': regulation.rank,
+        }
+        # Flag 32: rank / (rank + 1), on the 0..1 scale of the trigram sources
+        for regulation in ranked_search(LegalRegulation.objects.all(), q, normalization=32)[:limit]
+    ]
+
+
+def search_news(q, limit):
+    from news.models import MedicalNews
+
+    queryset = MedicalNews.objects.filter(
+        Q(title_pl__icontains=q) |
+        Q(title__icontains=q) |
+        Q(description_pl__icontains=q)
+    ).annotate(
+        score=TrigramWordSimilarity(q, Coalesce('title_pl', 'title'))
+    ).order_by('-score', '-published_at')[:limit]
+
+    return [
+        {
+            'id': news.id,
+            'title': news.title_pl or news.title,
+            'snippet': snippet(news.description_pl or news.description),
+            'date': news.published_at,
+            'score': news.score,
+        }
+        for news in queryset
+    ]
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    name: str
+    search: object
+    # Multiplier applied to the 0..1 score
+    weight: float = 1.0
+    requires_auth: bool = False
+
+
+SOURCES = [
+    SearchSource('drugs', search_drugs),
+    SearchSource('drug_events', search_drug_events, requires_auth=True),
+    SearchSource('regulations', search_regulations),
+    SearchSource('news', search_news, weight=0.8),
+]
+
+SOURCE_NAMES = [source.name for source in SOURCES]
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Process-wide pool - sources of concurrent requests share its threads"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=search_settings('MAX_WORKERS'),
+                thread_name_prefix='unified-search',
+            )
+    return _executor
+
+
+def source_timeout(name):
+    return search_settings('TIMEOUTS_MS').get(name, DEFAULTS['TIMEOUTS_MS'].get(name, 800))
+
+
+def run_source(source, q, limit, timeout_ms):
+    """
+    Run one source in a pool thread with its statement_timeout
+
+    The timeout is SET LOCAL, so it ends with the source's transaction and
+    the thread's connection is reused (CONN_MAX_AGE) by the next search.
+    """
+    started = time.perf_counter()
+    # Pool threads get no request signals - drop a stale or broken connection here
+    close_old_connections()
+    try:
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL statement_timeout = %s', [int(timeout_ms)])
+            hits = source.search(q, limit)
+    finally:
+        close_old_connections()
+    return hits, (time.perf_counter() - started) * 1000
+
+
+def normalize(hits, weight):
+    """Map the 0..1 raw scores to MATCH_FLOOR..1 of the source weight"""
+    for hit in hits:
+        raw = min(max(hit['score'] or 0, 0.0), 1.0)
+        hit['score'] = round(weight * (MATCH_FLOOR + (1 - MATCH_FLOOR) * raw), 4)
+    return hits
+
+
+def unified_search(q, user=None, types=None):
+    """
+    Search every permitted source concurrently and merge the hits
+
+    Args:
+        q: search text
+        user: request user (drug events need an authenticated one)
+        types: source names to query (default: all)
+
+    Returns:
+        tuple: (hits sorted by score, {source: {"status", "count", "took_ms"}})
+    """
+    authenticated = user is not None and user.is_authenticated
+    limit = search_settings('SOURCE_LIMIT')
+
+    report = {}
+    futures = {}
+    executor = get_executor()
+    for source in SOURCES:
+        if types and source.name not in types:
+            continue
+        if source.requires_auth and not authenticated:
+            report[source.name] = {'status': 'unauthorized', 'count': 0, 'took_ms': 0}
+            continue
+        timeout_ms = source_timeout(source.name)
+        future = executor.submit(run_source, source, q, limit, timeout_ms)
+        futures[future] = (source, time.perf_counter() + timeout_ms / 1000)
+
+    hits = []
+    pending = set(futures)
+    while pending:
+        # Wake up at the next source deadline (or when anything finishes)
+        next_deadline = min(futures[future][1] for future in pending)
+        done, pending = wait(pending, timeout=max(0.0, next_deadline - time.perf_counter()),
+                             return_when=FIRST_COMPLETED)
+        for future in done:
+            source, _ = futures[future]
+            try:
+                source_hits, took_ms = future.result()
+            except Exception as e:
+                logger.warning(f"Unified search source {source.name} failed: {str(e)}")
+                report[source.name] = {'status': 'error', 'count': 0, 'took_ms': None}
+                continue
+            for hit in normalize(source_hits, source.weight):
+                hit['type'] = source.name
+                hits.append(hit)
+            report[source.name] = {'status': 'ok', 'count': len(source_hits), 'took_ms': round(took_ms, 1)}
+
+        now = time.perf_counter()
+        for future in [future for future in pending if futures[future][1] <= now]:
+            source, _ = futures[future]
+            future.cancel()
+            pending.discard(future)
+            logger.warning(f"Unified search source {source.name} exceeded its {source_timeout(source.name)}ms budget")
+            report[source.name] = {'status': 'timeout', 'count': 0, 'took_ms': None}
+
+    hits.sort(key=lambda hit: (-hit['score'], hit['type'], hit['id']))
+    return hits, report
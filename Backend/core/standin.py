@@ -0,0 +1,238 @@
+"""
+Local stand-in for every external service of the ingestion paths
+
+One HTTP server answers for RDG, URPL, the gov.pl register and NCBI
+E-utilities under path prefixes (/rdg/, /urpl/, /govpl/, /ncbi/) and for
+Scaleway as an OpenAI-compatible /v1/chat/completions stub. Point the
+scrapers at it with the settings from `standin_settings(base_url)`.
+
+- replay mode answers from recorded fixtures (core/replay.py), a request
+  without a fixture gets 404,
+- record mode forwards to the live service and stores every exchange,
+- latency (with seeded jitter) and error rates are configurable, so
+  throughput, concurrency and backoff can be measured deterministically.
+
+The LLM is always stubbed, never recorded.
+"""
+import base64
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+
+from .replay import (
+    GOVPL_REGISTER_URL,
+    NCBI_EUTILS_URL,
+    RDG_URL,
+    URPL_URL,
+    FixtureStore,
+    fixture_body,
+    stub_completion,
+)
+
+# Path prefix on the stand-in -> origin of the live service
+UPSTREAMS = {
+    'rdg': 'https://rdg.ezdrowie.gov.pl',
+    'urpl': 'https://rejestry.ezdrowie.gov.pl',
+    'govpl': 'https://www.gov.pl',
+    'ncbi': 'https://eutils.ncbi.nlm.nih.gov',
+}
+
+# Response headers kept in recordings (bodies are stored decoded)
+RECORDED_HEADERS = ('Content-Type',)
+
+
+def local_url(base_url, upstream_url):
+    """The stand-in URL of a live service URL"""
+    parts = urlsplit(upstream_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    prefix = next(name for name, upstream in UPSTREAMS.items() if upstream == origin)
+    return f"{base_url.rstrip('/')}/{prefix}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else '')
+
+
+def standin_settings(base_url):
+    """Django settings pointing every ingestion source at the stand-in"""
+    return {
+        'RDG_BASE_URL': local_url(base_url, RDG_URL),
+        'URPL_API_URL': local_url(base_url, URPL_URL),
+        'GOVPL_REGISTER_URL': local_url(base_url, GOVPL_REGISTER_URL),
+        'NCBI_EUTILS_URL': local_url(base_url, NCBI_EUTILS_URL),
+        'SCALEWAY_BASE_URL': f"{base_url.rstrip('/')}/v1",
+    }
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.dispatch()
+
+    def do_POST(self):
+        self.dispatch()
+
+    def dispatch(self):
+        parts = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+        if parts.path.startswith('/v1/') and parts.path.rstrip('/').endswith('/chat/completions'):
+            self.answer_llm(body)
+            return
+
+        prefix, _, rest = parts.path.lstrip('/').partition('/')
+        if prefix not in UPSTREAMS:
+            self.send_json(404, {'error': f"Unknown stand-in path {parts.path}"})
+            return
+        upstream_url = f"{UPSTREAMS[prefix]}/{rest}" + (f"?{parts.query}" if parts.query else '')
+
+        self.server.count(prefix, 'requests')
+        time.sleep(self.server.delay(self.server.latency_ms))
+        if self.server.inject(self.server.error_rate):
+            self.server.count(prefix, 'injected_errors')
+            self.send_json(503, {'error': 'Injected stand-in error'})
+            return
+
+        if self.server.mode == 'record':
+            fixture = self.server.record(self.command, upstream_url, body, self.headers.get('Content-Type'))
+        else:
+            fixture = self.server.store.match(self.command, upstream_url)
+        if fixture is None:
+            self.server.count(prefix, 'misses')
+            self.send_json(404, {'error': f"No recorded fixture for {self.command} {upstream_url}"})
+            return
+
+        headers = {name: value for name, value in (fixture.get('headers') or {}).items() if name in RECORDED_HEADERS}
+        self.send_body(fixture.get('status', 200), fixture_body(fixture), headers)
+
+    def answer_llm(self, body):
+        self.server.count('llm', 'requests')
+        time.sleep(self.server.delay(self.server.llm_latency_ms))
+        if self.server.inject(self.server.llm_error_rate):
+            self.server.count('llm', 'injected_errors')
+            self.send_json(429, {'error': {'message': 'Injected rate limit', 'type': 'rate_limit_error'}})
+            return
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            self.send_json(400, {'error': {'message': 'Invalid JSON body'}})
+            return
+        self.send_json(200, stub_completion(payload))
+
+    def send_json(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_body(status, data, {'Content-Type': 'application/json'})
+
+    def send_body(self, status, data, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Stand-in server (use as a context manager to serve from a daemon thread)
+
+    Args:
+        fixtures: recorded exchanges to replay
+        mode: "replay" or "record"
+        record_path: file the recordings are saved to after each request
+        latency_ms / jitter_ms: delay of every upstream answer
+        llm_latency_ms: delay of every LLM answer (jitter applies too)
+        error_rate / llm_error_rate: share of requests answered 503 / 429
+        seed: seed of the jitter and error injection
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, fixtures=(), mode='replay', record_path=None,
+                 latency_ms=0, jitter_ms=0, llm_latency_ms=0, error_rate=0.0, llm_error_rate=0.0,
+                 seed=0, verbose=False):
+        super().__init__((host, port), StandInHandler)
+        self.store = FixtureStore(fixtures)
+        self.mode = mode
+        self.record_path = record_path
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.llm_latency_ms = llm_latency_ms
+        self.error_rate = error_rate
+        self.llm_error_rate = llm_error_rate
+        self.verbose = verbose
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def settings(self):
+        return standin_settings(self.base_url)
+
+    def delay(self, latency_ms):
+        if not latency_ms and not self.jitter_ms:
+            return 0.0
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (latency_ms + jitter) / 1000
+
+    def inject(self, rate):
+        if not rate:
+            return False
+        with self.lock:
+            return self.random.random() < rate
+
+    def count(self, source, name):
+        with self.lock:
+            source_stats = self.stats.setdefault(source, {})
+            source_stats[name] = source_stats.get(name, 0) + 1
+
+    def record(self, method, url, body, content_type):
+        """Forward a request to the live service and store the exchange"""
+        try:
+            response = requests.request(
+                method, url, data=body or None,
+                headers={'Content-Type': content_type} if content_type else {},
+                timeout=60,
+            )
+        except requests.RequestException as e:
+            return {'method': method, 'url': url, 'status': 502, 'headers': {'Content-Type': 'text/plain'},
+                    'body': f"Upstream request failed: {str(e)}"}
+
+        fixture = {
+            'method': method,
+            'url': url,
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+        }
+        try:
+            fixture['body'] = response.content.decode('utf-8')
+        except UnicodeDecodeError:
+            fixture['body_base64'] = base64.b64encode(response.content).decode('ascii')
+
+        # Failed upstream answers are passed through but not recorded
+        if response.status_code < 500:
+            self.store.add(fixture)
+            if self.record_path:
+                self.store.save(self.record_path)
+        return fixture
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
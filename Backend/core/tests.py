@@ -0,0 +1,46 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from .throttling import CACHE_KEY_PREFIX, check_request
+
+# Slow refill, so the tokens left are predictable during a test
+BUCKETS = {
+    'anon': {'capacity': 10, 'refill_per_second': 0.001},
+    'user': {'capacity': 10, 'refill_per_second': 0.001},
+    'search': {'capacity': 3, 'refill_per_second': 0.001},
+}
+
+
+@override_settings(TOKEN_BUCKETS=BUCKETS, THROTTLE_ENABLED=True)
+class TokenBucketTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get('/', REMOTE_ADDR='10.0.0.1')
+        self.request.user = AnonymousUser()
+
+    def tokens(self, bucket):
+        tokens, _ = cache.get(f'{CACHE_KEY_PREFIX}:{bucket}:ip:10.0.0.1')
+        return tokens
+
+    def test_requests_pay_from_both_buckets(self):
+        self.assertEqual(check_request(self.request, bucket='search'), 0)
+        self.assertAlmostEqual(self.tokens('anon'), 9, places=2)
+        self.assertAlmostEqual(self.tokens('search'), 2, places=2)
+
+    def test_exhausted_search_bucket_leaves_general_bucket_untouched(self):
+        for _ in range(3):
+            self.assertEqual(check_request(self.request, bucket='search'), 0)
+        anon_tokens = self.tokens('anon')
+
+        for _ in range(5):
+            self.assertGreater(check_request(self.request, bucket='search'), 0)
+        self.assertAlmostEqual(self.tokens('anon'), anon_tokens, places=2)
+        # Other endpoints still get the rest of the general budget
+        self.assertEqual(check_request(self.request), 0)
+
+    def test_exhausted_general_bucket_rejects_without_charging_search(self):
+        self.assertEqual(check_request(self.request, cost=10), 0)
+        self.assertGreater(check_request(self.request, bucket='search'), 0)
+        self.assertIsNone(cache.get(f'{CACHE_KEY_PREFIX}:search:ip:10.0.0.1'))
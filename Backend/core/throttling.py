@@ -0,0 +1,189 @@
+"""
+Token bucket rate limiting for the API
+
+Every client (user id when authenticated, IP otherwise) gets a bucket per
+scope in settings.TOKEN_BUCKETS. A request takes `throttle_cost` tokens
+(1 by default) from the client's "user" or "anon" bucket; views that set
+`throttle_bucket` (e.g. the searches) additionally pay from that bucket,
+so expensive endpoints have their own, smaller budget. A request is only
+charged when every bucket it pays from has the tokens. Buckets refill
+continuously at `refill_per_second`.
+
+Bucket state lives in the Django cache (Redis when REDIS_URL is set), so
+all workers share it. If the cache is unreachable the process falls back
+to an in-memory store instead of failing open on the database. Updates
+are read-modify-write, so concurrent requests of one client may slightly
+overdraw a bucket - good enough for shedding load.
+"""
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = {
+    'anon': {'capacity': 60, 'refill_per_second': 1},
+    'user': {'capacity': 240, 'refill_per_second': 4},
+    'search': {'capacity': 60, 'refill_per_second': 2},
+}
+
+CACHE_KEY_PREFIX = 'throttle'
+
+
+class LocalBucketStore:
+    """In-process LRU store used when the shared cache is down"""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+local_store = LocalBucketStore()
+_cache_down_until = 0.0
+
+
+def _store_get(key):
+    global _cache_down_until
+    if time.monotonic() >= _cache_down_until:
+        try:
+            return cache.get(key)
+        except Exception as e:
+            logger.warning(f"Throttle cache unavailable, using in-memory buckets: {str(e)}")
+            # Don't retry the cache on every request while it is down
+            _cache_down_until = time.monotonic() + 30
+    return local_store.get(key)
+
+
+def _store_set(key, value, timeout):
+    global _cache_down_until
+    if time.monotonic() >= _cache_down_until:
+        try:
+            cache.set(key, value, timeout)
+            return
+        except Exception as e:
+            logger.warning(f"Throttle cache unavailable, using in-memory buckets: {str(e)}")
+            _cache_down_until = time.monotonic() + 30
+    local_store.set(key, value, timeout)
+
+
+def bucket_config(name):
+    buckets = getattr(settings, 'TOKEN_BUCKETS', DEFAULT_BUCKETS)
+    return buckets.get(name) or DEFAULT_BUCKETS[name]
+
+
+def consume(bucket_name, ident, cost=1):
+    """
+    Take `cost` tokens from a client's bucket
+
+    Returns:
+        tuple: (allowed, wait_seconds)
+    """
+    return consume_all([bucket_name], ident, cost)
+
+
+def consume_all(bucket_names, ident, cost=1):
+    """
+    Take `cost` tokens from every bucket, or from none of them
+
+    All buckets are checked before any is debited, so a request rejected by
+    one bucket (e.g. search) costs nothing in the others.
+
+    Returns:
+        tuple: (allowed, wait_seconds) - the wait is the longest one needed
+    """
+    now = time.time()
+    buckets = []
+    wait = 0.0
+    for bucket_name in bucket_names:
+        config = bucket_config(bucket_name)
+        capacity = float(config['capacity'])
+        rate = float(config['refill_per_second'])
+        # A request dearer than the whole bucket could never pass
+        bucket_cost = min(float(cost), capacity)
+
+        key = f'{CACHE_KEY_PREFIX}:{bucket_name}:{ident}'
+        tokens, updated_at = _store_get(key) or (capacity, now)
+        tokens = min(capacity, tokens + max(0.0, now - updated_at) * rate)
+        if tokens < bucket_cost:
+            wait = max(wait, (bucket_cost - tokens) / rate)
+        buckets.append((key, tokens - bucket_cost, math.ceil(capacity / rate) + 1))
+
+    if wait > 0:
+        return False, wait
+    for key, tokens, timeout in buckets:
+        _store_set(key, (tokens, now), timeout=timeout)
+    return True, 0.0
+
+
+def throttling_enabled():
+    return getattr(settings, 'THROTTLE_ENABLED', True)
+
+
+def client_scope(request):
+    """Return (bucket name, ident) for the client making the request"""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return 'user', f'user:{user.pk}'
+    return 'anon', f'ip:{BaseThrottle().get_ident(request)}'
+
+
+def check_request(request, cost=1, bucket=None):
+    """
+    Charge a request against the client's buckets
+
+    Args:
+        request: Django or DRF request (user must already be authenticated)
+        cost: tokens the request takes
+        bucket: extra bucket for expensive endpoints (e.g. "search")
+
+    Returns:
+        float: 0 if the request may proceed, otherwise seconds to wait
+    """
+    if not throttling_enabled():
+        return 0.0
+
+    scope, ident = client_scope(request)
+    allowed, wait = consume_all([scope, bucket] if bucket else [scope], ident, cost)
+    return 0.0 if allowed else wait
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    DRF throttle backed by the token buckets
+
+    Views can set:
+        throttle_cost: tokens per request (default 1)
+        throttle_bucket: extra TOKEN_BUCKETS scope paid by this view
+    """
+
+    def allow_request(self, request, view):
+        self.wait_seconds = check_request(
+            request,
+            cost=getattr(view, 'throttle_cost', 1),
+            bucket=getattr(view, 'throttle_bucket', None),
+        )
+        return self.wait_seconds == 0
+
+    def wait(self):
+        return math.ceil(self.wait_seconds)
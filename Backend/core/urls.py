@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+app_name = 'core'
+
+urlpatterns = [
+    # Search across drugs, drug events, regulations and news
+    path('', views.UnifiedSearchView.as_view(), name='unified-search'),
+]
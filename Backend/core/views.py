@@ -0,0 +1,114 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .metrics import registry
+from .query_budget import validate_query_params
+from .search import SOURCE_NAMES, search_settings, unified_search
+
+MIN_QUERY_LENGTH = 2
+
+
+def parse_positive_int(params, name, default, maximum=None):
+    """Parse a positive integer query parameter (400 on anything else)"""
+    raw = params.get(name)
+    if raw in (None, ''):
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise ValidationError({name: 'A valid integer is required.'})
+    if value < 1:
+        raise ValidationError({name: 'Ensure this value is greater than or equal to 1.'})
+    return min(value, maximum) if maximum else value
+
+
+def parse_types(params):
+    raw = params.get('types')
+    if not raw:
+        return None
+    types = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in types if name not in SOURCE_NAMES]
+    if unknown:
+        raise ValidationError({'types': f"Unknown source(s): {', '.join(unknown)}. Choose from: {', '.join(SOURCE_NAMES)}."})
+    return types
+
+
+class UnifiedSearchView(APIView):
+    """
+    API endpoint searching drugs, drug events, regulations and news at once
+    
+    Sources run concurrently, each within its own latency budget; the
+    `sources` object tells which ones answered (ok), were too slow
+    (timeout), failed (error) or need a login (unauthorized).
+    """
+    
+    permission_classes = [AllowAny]
+    # One request queries every source
+    throttle_cost = len(SOURCE_NAMES)
+    throttle_bucket = 'search'
+    
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        validate_query_params(request.query_params)
+    
+    @extend_schema(
+        description="Ranked search across drugs, drug events (authenticated users only), "
+                    "legal regulations and medical news",
+        parameters=[
+            OpenApiParameter('q', str, required=True, description='Search text'),
+            OpenApiParameter('types', str, description=f"Comma separated sources ({', '.join(SOURCE_NAMES)})"),
+            OpenApiParameter('page', int, description='Page number (default 1)'),
+            OpenApiParameter('page_size', int, description='Results per page'),
+        ],
+        responses={
+            200: OpenApiResponse(description='{"query", "count", "page", "page_size", "next_page", "results", "sources"}'),
+            400: OpenApiResponse(description='Missing or invalid parameters'),
+        }
+    )
+    def get(self, request):
+        params = request.query_params
+        q = (params.get('q') or '').strip()
+        if len(q) < MIN_QUERY_LENGTH:
+            raise ValidationError({'q': f'Enter at least {MIN_QUERY_LENGTH} characters.'})
+        types = parse_types(params)
+        page = parse_positive_int(params, 'page', 1)
+        page_size = parse_positive_int(
+            params, 'page_size', search_settings('PAGE_SIZE'), search_settings('MAX_PAGE_SIZE')
+        )
+        
+        hits, sources = unified_search(q, request.user, types)
+        
+        start = (page - 1) * page_size
+        return Response({
+            'query': q,
+            'count': len(hits),
+            'page': page,
+            'page_size': page_size,
+            'next_page': page + 1 if start + page_size < len(hits) else None,
+            'results': hits[start:start + page_size],
+            'sources': sources,
+        })
+
+
+def metrics_access_allowed(request):
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    auth = request.headers.get('Authorization', '')
+    if token and auth.startswith('Bearer ') and hmac.compare_digest(auth[len('Bearer '):], token):
+        return True
+    return request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', [])
+
+
+@require_GET
+def metrics_view(request):
+    """Prometheus metrics of this worker process (internal, not in the API schema)"""
+    if not metrics_access_allowed(request):
+        return HttpResponseForbidden()
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
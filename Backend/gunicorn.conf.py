@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for the production serving profile
+
+WSGI (default):  gunicorn api.wsgi:application -c gunicorn.conf.py
+ASGI (live feed): GUNICORN_WORKER_CLASS=uvicorn_worker.UvicornWorker \\
+                  gunicorn api.asgi:application -c gunicorn.conf.py
+
+Every setting can be overridden with a GUNICORN_* environment variable.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:7654')
+
+# gthread workers: a few processes with several threads each, so a slow
+# request does not block the whole worker. For the ASGI entry point use
+# uvicorn_worker.UvicornWorker (threads are then ignored).
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+# Recycle workers now and then to contain slow memory growth
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 200))
+
+accesslog = os.getenv('GUNICORN_ACCESSLOG', '-')
+errorlog = os.getenv('GUNICORN_ERRORLOG', '-')
+loglevel = os.getenv('GUNICORN_LOGLEVEL', 'info')
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import MedicalNews
+from .models import MedicalNews, MedicalNewsArchive
 
 
 @admin.register(MedicalNews)
@@ -22,3 +22,12 @@ class MedicalNewsAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(MedicalNewsArchive)
+class MedicalNewsArchiveAdmin(admin.ModelAdmin):
+    list_display = ('title', 'source', 'published_at', 'is_translated', 'archived_at')
+    list_filter = ('is_translated', 'published_at')
+    search_fields = ('title', 'title_pl')
+    readonly_fields = ('created_at', 'updated_at', 'archived_at')
+    date_hierarchy = 'published_at'
@@ -0,0 +1,34 @@
+"""
+Async wersje endpointów newsów medycznych (serwowane przez api/asgi.py)
+"""
+from django.http import JsonResponse
+
+from core.async_api import async_api_view, capped_json_response, not_found, serialize_object
+from core.query_budget import parse_limit
+from .models import MedicalNews
+from .serializers import MedicalNewsSerializer
+from .views import filter_news
+
+
+@async_api_view(['GET'])
+async def news_list(request):
+    """Async wersja MedicalNewsViewSet.list"""
+    queryset = filter_news(MedicalNews.objects.all(), request.GET)
+    return await capped_json_response(MedicalNewsSerializer, queryset)
+
+
+@async_api_view(['GET'])
+async def news_detail(request, pk):
+    """Async wersja MedicalNewsViewSet.retrieve"""
+    data = await serialize_object(MedicalNewsSerializer, MedicalNews.objects.all(), pk)
+    if data is None:
+        return not_found()
+    return JsonResponse(data)
+
+
+@async_api_view(['GET'])
+async def news_latest(request):
+    """Async wersja MedicalNewsViewSet.latest"""
+    limit = parse_limit(request.GET)
+    queryset = filter_news(MedicalNews.objects.all(), request.GET)[:limit]
+    return await capped_json_response(MedicalNewsSerializer, queryset)
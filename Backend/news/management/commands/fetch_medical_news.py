@@ -1,11 +1,15 @@
-import requests
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
-from openai import OpenAI
-from news.models import MedicalNews
+from core.ingestion import current_run, ingestion_run
+from core.llm import RateLimiter
+from core.models import IngestionRun
+from news import pubmed
+from news.models import MedicalNews, MedicalNewsArchive
+from news.translation import Translator
+from stream.publisher import publish_instances
 from datetime import datetime
-import time
 
 
 class Command(BaseCommand):
@@ -18,232 +22,239 @@ class Command(BaseCommand):
             default=20,
             help='Liczba newsów do pobrania (domyślnie 20)',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Liczba równoległych zapytań tłumaczących (domyślnie 4)',
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=2.0,
+            help='Maksymalna liczba zapytań do AI na sekundę (domyślnie 2)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=8,
+            help='Ile krótkich tekstów pakować w jedno zapytanie tłumaczące (domyślnie 8)',
+        )
+        parser.add_argument(
+            '--efetch-batch-size',
+            type=int,
+            default=200,
+            help='Liczba PMID w jednym zapytaniu efetch (domyślnie 200)',
+        )
+        parser.add_argument(
+            '--fetch-workers',
+            type=int,
+            default=3,
+            help='Liczba równoległych zapytań efetch (domyślnie 3); tempo i tak ogranicza limit NCBI (3 zapytania/s, 10 z NCBI_API_KEY)',
+        )
+        parser.add_argument(
+            '--write-batch-size',
+            type=int,
+            default=50,
+            help='Liczba newsów tłumaczonych i zapisywanych w jednej paczce (domyślnie 50)',
+        )
 
     def handle(self, *args, **options):
+        if options['rate'] <= 0:
+            raise CommandError('--rate musi być większe od 0')
+        # Podsumowanie przebiegu trafia na stdout komendy
+        with ingestion_run(IngestionRun.Source.NEWS, log=self.stdout.write):
+            self.fetch_news(**options)
+
+    def fetch_news(self, **options):
         limit = options['limit']
         self.stdout.write(self.style.SUCCESS(f'Rozpoczynam pobieranie {limit} newsów medycznych...'))
         
-        # Pobieranie newsów z PubMed
-        news_data = self.fetch_news_from_apitube(limit)
+        # Inicjalizacja klienta Scaleway AI (import leniwy - openai długo się importuje)
+        from openai import OpenAI
+        scaleway_client = OpenAI(
+            base_url=settings.SCALEWAY_BASE_URL,
+            api_key=settings.SCALEWAY_API_KEY
+        )
         
-        if not news_data:
+        # Równoległe tłumaczenie z limitem zapytań/s zamiast time.sleep(1)
+        translator = Translator(
+            client=scaleway_client,
+            model=settings.SCALEWAY_MODEL,
+            limiter=RateLimiter(options['rate']),
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+        )
+        
+        # Newsy z PubMed trafiają do zapisu paczkami, w trakcie parsowania
+        fetched_count = created_count = updated_count = 0
+        chunk = []
+        articles = self.fetch_news_from_pubmed(limit, options['efetch_batch_size'], options['fetch_workers'])
+        for news_item in articles:
+            fetched_count += 1
+            chunk.append(news_item)
+            if len(chunk) >= options['write_batch_size']:
+                created, updated = self.process_batch(translator, chunk)
+                created_count += created
+                updated_count += updated
+                chunk = []
+        if chunk:
+            created, updated = self.process_batch(translator, chunk)
+            created_count += created
+            updated_count += updated
+        
+        current_run().count('fetched', fetched_count)
+        current_run().count('created', created_count)
+        current_run().count('updated', updated_count)
+        
+        if not fetched_count:
+            current_run().fail('Nie udało się pobrać newsów medycznych')
             self.stdout.write(self.style.ERROR('Nie udało się pobrać newsów medycznych'))
             return
         
-        self.stdout.write(self.style.SUCCESS(f'Pobrano {len(news_data)} newsów'))
+        self.stdout.write(self.style.SUCCESS(
+            f'\nZakończono! Pobrano: {fetched_count}, Utworzono: {created_count}, Zaktualizowano: {updated_count}'
+        ))
+
+    def process_batch(self, translator, news_items):
+        """
+        Tłumaczy paczkę newsów i zapisuje ją jednym upsertem po url_hash
         
-        # Inicjalizacja klienta Scaleway AI
-        scaleway_client = OpenAI(
-            base_url="https://9921ae86-3cf5-4e5c-8151-e1d274ceb539.ifr.fr-par.scaleway.com/v1",
-            api_key=settings.SCALEWAY_API_KEY
-        )
+        Returns:
+            tuple: (created_count, updated_count)
+        """
+        run = current_run()
         
-        # Przetwarzanie każdego newsa
-        created_count = 0
-        updated_count = 0
+        # Klucze całej paczki (duplikaty w paczce pomijamy - upsert nie może dotknąć wiersza dwa razy)
+        items_by_hash = {}
+        for news_item in news_items:
+            if not news_item.get('url'):
+                continue
+            items_by_hash.setdefault(MedicalNews.hash_url(news_item['url']), news_item)
         
-        for news_item in news_data:
-            try:
-                # Sprawdź czy news już istnieje (po URL)
-                existing_news = MedicalNews.objects.filter(url=news_item.get('url')).first()
-                
-                if existing_news and existing_news.is_translated:
-                    self.stdout.write(f'News już istnieje i jest przetłumaczony: {news_item.get("title", "")[:50]}...')
-                    continue
-                
-                # Tłumaczenie na polski
-                title_pl = self.translate_to_polish(scaleway_client, news_item.get('title', ''))
-                description_pl = self.translate_to_polish(scaleway_client, news_item.get('description', ''))
-                
-                # Parsowanie daty
-                published_at = self.parse_date(news_item.get('publishedAt') or news_item.get('published_at'))
-                
-                if existing_news:
-                    # Aktualizuj istniejący news
-                    existing_news.title_pl = title_pl
-                    existing_news.description_pl = description_pl
-                    existing_news.is_translated = True
-                    existing_news.save()
-                    updated_count += 1
-                    self.stdout.write(f'Zaktualizowano: {news_item.get("title", "")[:50]}...')
-                else:
-                    # Utwórz nowy news
-                    MedicalNews.objects.create(
-                        title=news_item.get('title', ''),
-                        description=news_item.get('description', ''),
-                        url=news_item.get('url', ''),
-                        source=news_item.get('source', {}).get('name', 'Unknown') if isinstance(news_item.get('source'), dict) else str(news_item.get('source', 'Unknown')),
-                        published_at=published_at,
-                        image_url=news_item.get('urlToImage') or news_item.get('image_url', ''),
-                        title_pl=title_pl,
-                        description_pl=description_pl,
-                        is_translated=True,
-                    )
-                    created_count += 1
-                    self.stdout.write(f'Utworzono: {news_item.get("title", "")[:50]}...')
-                
-                # Delay żeby nie przesadzić z API requests
-                time.sleep(1)
-                
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'Błąd podczas przetwarzania newsa: {str(e)}'))
+        # Jedno zapytanie po unikalnym indeksie: które newsy już są i czy są przetłumaczone
+        with run.phase('db'):
+            translated_by_hash = dict(
+                MedicalNews.objects.filter(url_hash__in=list(items_by_hash)).values_list('url_hash', 'is_translated')
+            )
+            # Newsy przeniesione do archiwum (prune_medical_news) nie wracają do gorącej tabeli
+            archived_hashes = set(
+                MedicalNewsArchive.objects.filter(url_hash__in=list(items_by_hash)).values_list('url_hash', flat=True)
+            )
+        
+        to_translate = []
+        for url_hash, news_item in items_by_hash.items():
+            if translated_by_hash.get(url_hash):
+                self.stdout.write(f'News już istnieje i jest przetłumaczony: {news_item.get("title", "")[:50]}...')
+                continue
+            if url_hash in archived_hashes:
+                self.stdout.write(f'News jest już w archiwum: {news_item.get("title", "")[:50]}...')
                 continue
+            to_translate.append((url_hash, news_item))
         
-        self.stdout.write(self.style.SUCCESS(
-            f'\nZakończono! Utworzono: {created_count}, Zaktualizowano: {updated_count}'
-        ))
+        # Trafienie = news już przetłumaczony (lub w archiwum), bez wywołań AI
+        run.cache('translated', hit=True, amount=len(items_by_hash) - len(to_translate))
+        run.cache('translated', hit=False, amount=len(to_translate))
+        
+        if not to_translate:
+            return 0, 0
+        
+        # Tytuły i opisy całej paczki tłumaczone są współbieżnie
+        texts = []
+        for _, news_item in to_translate:
+            texts.append(news_item.get('title', ''))
+            texts.append(news_item.get('description', ''))
+        with run.phase('ai'):
+            translations = translator.translate_many(texts)
+        
+        rows = []
+        failed_count = 0
+        for index, (url_hash, news_item) in enumerate(to_translate):
+            title_pl, title_ok = translations[2 * index]
+            description_pl, description_ok = translations[2 * index + 1]
+            # Nieudane tłumaczenie zostaje z tekstem oryginalnym i is_translated=False,
+            # więc następne uruchomienie spróbuje ponownie
+            is_translated = title_ok and description_ok
+            if not is_translated:
+                failed_count += 1
+            # Parsowanie daty
+            published_at = self.parse_date(news_item.get('publishedAt') or news_item.get('published_at'))
+            rows.append(MedicalNews(
+                title=news_item.get('title', ''),
+                description=news_item.get('description', ''),
+                url=news_item.get('url', ''),
+                url_hash=url_hash,  # bulk_create nie wywołuje save()
+                source=news_item.get('source', {}).get('name', 'Unknown') if isinstance(news_item.get('source'), dict) else str(news_item.get('source', 'Unknown')),
+                published_at=published_at,
+                image_url=news_item.get('urlToImage') or news_item.get('image_url', ''),
+                title_pl=title_pl,
+                description_pl=description_pl,
+                is_translated=is_translated,
+            ))
+        
+        new_hashes = [row.url_hash for row in rows if row.url_hash not in translated_by_hash]
+        
+        with run.phase('db'), transaction.atomic():
+            # INSERT ... ON CONFLICT (url_hash) DO UPDATE - nowe i nieprzetłumaczone newsy jednym zapytaniem
+            MedicalNews.objects.bulk_create(
+                rows,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['url_hash'],
+                update_fields=['title_pl', 'description_pl', 'is_translated', 'updated_at'],
+            )
+            # bulk_create nie wysyła sygnałów (a z update_conflicts nie zwraca id) -
+            # publikujemy nowe newsy do live feedu ręcznie
+            if new_hashes:
+                publish_instances(MedicalNews.objects.filter(url_hash__in=new_hashes).only('id'))
+        
+        for row in rows:
+            action = 'Zaktualizowano' if row.url_hash in translated_by_hash else 'Utworzono'
+            self.stdout.write(f'{action}: {row.title[:50]}...')
+        
+        if failed_count:
+            run.count('translation_failed', failed_count)
+            self.stdout.write(self.style.WARNING(f'Nie udało się przetłumaczyć {failed_count} newsów - ponowna próba przy następnym pobraniu'))
+        
+        created_count = len(new_hashes)
+        run.add_rows(len(rows))
+        return created_count, len(rows) - created_count
 
-    def fetch_news_from_apitube(self, limit=20):
-        """Pobiera newsy medyczne z PubMed API (NCBI) - całkowicie darmowe!"""
-        try:
-            import xml.etree.ElementTree as ET
-            
-            # Step 1: Wyszukaj artykuły w PubMed
-            search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-            search_params = {
-                'db': 'pubmed',
-                'term': '(health[Title/Abstract] OR medical[Title/Abstract] OR disease[Title/Abstract]) AND ("last 30 days"[PDat])',
-                'retmax': limit,
-                'sort': 'pub_date',
-                'retmode': 'json',
-            }
-            
-            self.stdout.write(f'Wyszukiwanie artykułów medycznych w PubMed...')
-            search_response = requests.get(search_url, params=search_params, timeout=30)
-            search_response.raise_for_status()
-            search_data = search_response.json()
-            
-            id_list = search_data.get('esearchresult', {}).get('idlist', [])
+    def fetch_news_from_pubmed(self, limit, efetch_batch_size, fetch_workers):
+        """
+        Pobiera newsy medyczne z PubMed API (NCBI) - całkowicie darmowe!
+        
+        Generator: artykuły są zwracane pojedynczo, gdy tylko się sparsują
+        """
+        import requests
+        
+        # esearch i efetch dzielą jeden limit zapytań/s NCBI
+        limiter = pubmed.ncbi_limiter()
+        with requests.Session() as session:
+            try:
+                # Step 1: Wyszukaj artykuły w PubMed
+                self.stdout.write(f'Wyszukiwanie artykułów medycznych w PubMed...')
+                id_list = pubmed.search_pmids(session, limit, limiter=limiter)
+            except requests.exceptions.RequestException as e:
+                self.stdout.write(self.style.ERROR(f'Request Error: {str(e)}'))
+                return
             
             if not id_list:
                 self.stdout.write(self.style.WARNING('Nie znaleziono artykułów w PubMed'))
-                return []
+                return
             
             self.stdout.write(f'Znaleziono {len(id_list)} artykułów')
             
-            # Step 2: Pobierz szczegóły artykułów
-            fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-            fetch_params = {
-                'db': 'pubmed',
-                'id': ','.join(id_list),
-                'retmode': 'xml',
-            }
-            
+            # Step 2: Pobierz szczegóły artykułów (paczki efetch równolegle, parsowanie strumieniowe)
             self.stdout.write(f'Pobieranie szczegółów artykułów...')
-            fetch_response = requests.get(fetch_url, params=fetch_params, timeout=30)
-            fetch_response.raise_for_status()
-            
-            # Parsowanie XML
-            root = ET.fromstring(fetch_response.content)
-            
-            articles = []
-            for article in root.findall('.//PubmedArticle'):
-                try:
-                    # Tytuł
-                    title_elem = article.find('.//ArticleTitle')
-                    title = title_elem.text if title_elem is not None and title_elem.text else 'No title'
-                    
-                    # Abstract
-                    abstract_elems = article.findall('.//AbstractText')
-                    abstract = ' '.join([elem.text for elem in abstract_elems if elem.text]) if abstract_elems else ''
-                    if not abstract:
-                        abstract = title  # Fallback do tytułu jeśli brak abstractu
-                    
-                    # PMID (ID artykułu)
-                    pmid_elem = article.find('.//PMID')
-                    pmid = pmid_elem.text if pmid_elem is not None else ''
-                    
-                    # Data publikacji
-                    pub_date = article.find('.//PubDate')
-                    if pub_date is not None:
-                        year = pub_date.find('Year')
-                        month = pub_date.find('Month')
-                        day = pub_date.find('Day')
-                        
-                        year_str = year.text if year is not None else '2025'
-                        month_str = self.parse_month(month.text if month is not None else '01')
-                        day_str = day.text if day is not None else '01'
-                        
-                        date_str = f"{year_str}-{month_str}-{day_str}T00:00:00Z"
-                    else:
-                        date_str = timezone.now().isoformat()
-                    
-                    # Journal/Source
-                    journal_elem = article.find('.//Journal/Title')
-                    source = journal_elem.text if journal_elem is not None and journal_elem.text else 'PubMed'
-                    
-                    articles.append({
-                        'title': title.strip(),
-                        'description': abstract[:1000].strip(),  # Max 1000 chars
-                        'url': f'https://pubmed.ncbi.nlm.nih.gov/{pmid}/' if pmid else '',
-                        'source': source,
-                        'publishedAt': date_str,
-                        'urlToImage': '',  # PubMed nie ma obrazków
-                    })
-                    
-                except Exception as e:
-                    self.stdout.write(self.style.WARNING(f'Błąd parsowania artykułu: {str(e)}'))
-                    continue
-            
-            self.stdout.write(f'Sparsowano {len(articles)} artykułów z PubMed')
-            return articles
-            
-        except requests.exceptions.RequestException as e:
-            self.stdout.write(self.style.ERROR(f'Request Error: {str(e)}'))
-            return []
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f'Błąd: {str(e)}'))
-            import traceback
-            self.stdout.write(self.style.ERROR(f'Traceback: {traceback.format_exc()}'))
-            return []
-    
-    def parse_month(self, month_str):
-        """Konwertuje nazwę miesiąca na numer"""
-        months = {
-            'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-            'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-            'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12',
-            'January': '01', 'February': '02', 'March': '03', 'April': '04',
-            'May': '05', 'June': '06', 'July': '07', 'August': '08',
-            'September': '09', 'October': '10', 'November': '11', 'December': '12'
-        }
-        if month_str in months:
-            return months[month_str]
-        if month_str.isdigit():
-            return month_str.zfill(2)
-        return '01'
-
-    def translate_to_polish(self, client, text):
-        """Tłumaczy tekst na polski używając Scaleway AI"""
-        if not text or len(text.strip()) == 0:
-            return ""
-        
-        try:
-            response = client.chat.completions.create(
-                model="qwen/qwen3-235b-a22b-instruct-2507:awq",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional translator. Translate the given text to Polish. Return ONLY the translation, nothing else."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Translate this to Polish: {text}"
-                    },
-                ],
-                max_tokens=512,
-                temperature=0.3,
-                top_p=0.8,
-                stream=False
+            yield from pubmed.iter_articles(
+                session,
+                id_list,
+                batch_size=efetch_batch_size,
+                workers=fetch_workers,
+                limiter=limiter,
             )
-            
-            translated_text = response.choices[0].message.content.strip()
-            return translated_text
-            
-        except Exception as e:
-            self.stdout.write(self.style.WARNING(f'Błąd tłumaczenia: {str(e)}. Używam oryginalnego tekstu.'))
-            return text
-
+    
     def parse_date(self, date_string):
         """Parsuje datę z różnych formatów"""
         if not date_string:
@@ -0,0 +1,85 @@
+"""
+Django management command przenoszący stare newsy medyczne do archiwum
+
+Gorąca tabela MedicalNews trzyma tylko ostatnie NEWS_RETENTION_DAYS dni,
+dzięki czemu lista i `latest` pracują na małym indeksie. Starsze wiersze
+są przenoszone paczkami do MedicalNewsArchive (każda paczka w osobnej
+transakcji, więc długie blokady nie występują).
+
+Uruchamiaj np. raz dziennie:
+
+    python manage.py prune_medical_news
+    python manage.py prune_medical_news --days 90 --dry-run
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from news.models import MedicalNews, MedicalNewsArchive
+
+# Pola kopiowane do archiwum (wszystko poza id)
+ARCHIVED_FIELDS = [
+    'title', 'description', 'url', 'url_hash', 'source', 'published_at', 'image_url',
+    'title_pl', 'description_pl', 'created_at', 'updated_at', 'is_translated',
+]
+
+
+class Command(BaseCommand):
+    help = 'Przenosi newsy medyczne starsze niż NEWS_RETENTION_DAYS do archiwum'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.NEWS_RETENTION_DAYS,
+            help=f'Retencja w dniach (domyślnie NEWS_RETENTION_DAYS={settings.NEWS_RETENTION_DAYS})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Liczba newsów przenoszonych w jednej transakcji (domyślnie 1000)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Tylko policz newsy do archiwizacji',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        expired = MedicalNews.objects.filter(published_at__lt=cutoff)
+
+        self.stdout.write(f"🗄️  Archiwizacja newsów opublikowanych przed {cutoff:%Y-%m-%d} ({options['days']} dni)")
+
+        if options['dry_run']:
+            self.stdout.write(f'📋 Do archiwizacji: {expired.count()} newsów (dry run)')
+            return
+
+        archived_count = 0
+        while True:
+            with transaction.atomic():
+                # Najstarsze najpierw - korzysta z indeksu news_published_idx
+                batch = list(
+                    expired.order_by('published_at')
+                    .select_for_update(skip_locked=True)
+                    .values('id', *ARCHIVED_FIELDS)[:options['batch_size']]
+                )
+                if not batch:
+                    break
+
+                ids = [row.pop('id') for row in batch]
+                # ignore_conflicts: news mógł już trafić do archiwum w przerwanym uruchomieniu
+                MedicalNewsArchive.objects.bulk_create(
+                    [MedicalNewsArchive(**row) for row in batch],
+                    ignore_conflicts=True,
+                )
+                MedicalNews.objects.filter(id__in=ids).delete()
+
+            archived_count += len(ids)
+            self.stdout.write(f'   ✅ Przeniesiono {archived_count} newsów...')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Zakończono! Zarchiwizowano: {archived_count}'))
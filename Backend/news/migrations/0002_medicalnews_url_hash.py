@@ -0,0 +1,48 @@
+# Generated by Django 4.2.11 on 2026-10-19 13:10
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_url_hash(apps, schema_editor):
+    """Uzupełnia url_hash i usuwa duplikaty URL (zostaje przetłumaczony / najstarszy wpis)"""
+    MedicalNews = apps.get_model('news', 'MedicalNews')
+    seen = set()
+    duplicates = []
+    to_update = []
+    for news in MedicalNews.objects.order_by('-is_translated', 'id').only('id', 'url', 'is_translated').iterator(chunk_size=2000):
+        news.url_hash = hashlib.sha256((news.url or '').strip().encode('utf-8')).hexdigest()
+        if news.url_hash in seen:
+            duplicates.append(news.id)
+            continue
+        seen.add(news.url_hash)
+        to_update.append(news)
+        if len(to_update) >= 2000:
+            MedicalNews.objects.bulk_update(to_update, ['url_hash'])
+            to_update = []
+    if to_update:
+        MedicalNews.objects.bulk_update(to_update, ['url_hash'])
+    for start in range(0, len(duplicates), 2000):
+        MedicalNews.objects.filter(id__in=duplicates[start:start + 2000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='medicalnews',
+            name='url_hash',
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(backfill_url_hash, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='medicalnews',
+            name='url_hash',
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+    ]
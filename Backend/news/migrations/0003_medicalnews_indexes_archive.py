@@ -0,0 +1,46 @@
+# Generated by Django 4.2.11 on 2026-10-19 12:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_medicalnews_url_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MedicalNewsArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=500)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('url', models.URLField(max_length=1000)),
+                ('url_hash', models.CharField(editable=False, max_length=64, unique=True)),
+                ('source', models.CharField(max_length=200)),
+                ('published_at', models.DateTimeField()),
+                ('image_url', models.URLField(blank=True, max_length=1000, null=True)),
+                ('title_pl', models.CharField(blank=True, max_length=500, null=True)),
+                ('description_pl', models.TextField(blank=True, null=True)),
+                ('is_translated', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived Medical News',
+                'verbose_name_plural': 'Archived Medical News',
+                'ordering': ['-published_at'],
+                'abstract': False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name='medicalnews',
+            index=models.Index(fields=['-published_at'], name='news_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='medicalnews',
+            index=models.Index(fields=['is_translated', '-published_at'], name='news_translated_published_idx'),
+        ),
+    ]
@@ -1,10 +1,15 @@
+import hashlib
+
 from django.db import models
 
 
-class MedicalNews(models.Model):
+class BaseMedicalNews(models.Model):
+    """Pola wspólne dla gorącej tabeli newsów i archiwum"""
     title = models.CharField(max_length=500)
     description = models.TextField(blank=True, null=True)
     url = models.URLField(max_length=1000)
+    # sha256 z URL - unikalny klucz deduplikacji (indeks na 1000-znakowym URL byłby zbyt duży)
+    url_hash = models.CharField(max_length=64, unique=True, editable=False)
     source = models.CharField(max_length=200)
     published_at = models.DateTimeField()
     image_url = models.URLField(max_length=1000, blank=True, null=True)
@@ -17,9 +22,44 @@ class MedicalNews(models.Model):
     is_translated = models.BooleanField(default=False)
     
     class Meta:
+        abstract = True
         ordering = ['-published_at']
-        verbose_name = 'Medical News'
-        verbose_name_plural = 'Medical News'
+    
+    @staticmethod
+    def hash_url(url):
+        """Klucz deduplikacji newsa - sha256 z URL"""
+        return hashlib.sha256((url or '').strip().encode('utf-8')).hexdigest()
+    
+    def save(self, *args, **kwargs):
+        self.url_hash = self.hash_url(self.url)
+        super().save(*args, **kwargs)
     
     def __str__(self):
         return f"{self.title[:50]} - {self.source}"
+
+
+class MedicalNews(BaseMedicalNews):
+    class Meta(BaseMedicalNews.Meta):
+        verbose_name = 'Medical News'
+        verbose_name_plural = 'Medical News'
+        indexes = [
+            # latest / lista: ORDER BY published_at DESC LIMIT n
+            models.Index(fields=['-published_at'], name='news_published_idx'),
+            # ?translated=true: WHERE is_translated ORDER BY published_at DESC
+            models.Index(fields=['is_translated', '-published_at'], name='news_translated_published_idx'),
+        ]
+
+
+class MedicalNewsArchive(BaseMedicalNews):
+    """
+    Newsy starsze niż NEWS_RETENTION_DAYS przeniesione przez prune_medical_news,
+    żeby gorąca tabela MedicalNews pozostała mała
+    """
+    # Znaczniki czasu przenoszone z MedicalNews bez zmian
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta(BaseMedicalNews.Meta):
+        verbose_name = 'Archived Medical News'
+        verbose_name_plural = 'Archived Medical News'
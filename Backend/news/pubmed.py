@@ -0,0 +1,273 @@
+"""
+Klient PubMed (NCBI E-utilities) - strumieniowe pobieranie artykułów
+
+esearch zwraca listę PMID, a szczegóły pobierane są przez efetch w paczkach
+(POST, więc długość URL nie ogranicza liczby ID). Kilka paczek pobieranych
+jest równolegle, a każda odpowiedź parsowana jest przez iterparse prosto ze
+strumienia HTTP i czyszczona po każdym artykule. Artykuły trafiają do
+odbiorcy przez ograniczoną kolejkę zaraz po sparsowaniu, więc zużycie
+pamięci nie zależy ani od --limit, ani od rozmiaru paczki.
+
+NCBI pozwala na 3 zapytania/s bez klucza API (10 z NCBI_API_KEY) - pilnuje
+tego wspólny dla esearch i efetch RateLimiter (ncbi_limiter).
+"""
+import logging
+import queue
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.ingestion import current_run
+from core.llm import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TERM = '(health[Title/Abstract] OR medical[Title/Abstract] OR disease[Title/Abstract]) AND ("last 30 days"[PDat])'
+
+# esearch zwraca maksymalnie 10 000 ID na zapytanie
+ESEARCH_MAX_RETMAX = 10000
+
+# Limity NCBI E-utilities (zapytania/s)
+NCBI_RATE = 3
+NCBI_RATE_WITH_KEY = 10
+
+# Ile sparsowanych artykułów może czekać na zapis
+ARTICLE_QUEUE_SIZE = 100
+
+# Znacznik końca paczki w kolejce artykułów
+_BATCH_DONE = object()
+
+MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
+    'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
+    'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12',
+    'January': '01', 'February': '02', 'March': '03', 'April': '04',
+    'June': '06', 'July': '07', 'August': '08',
+    'September': '09', 'October': '10', 'November': '11', 'December': '12'
+}
+
+
+def parse_month(month_str):
+    """Konwertuje nazwę miesiąca na numer"""
+    if month_str in MONTHS:
+        return MONTHS[month_str]
+    if month_str.isdigit():
+        return month_str.zfill(2)
+    return '01'
+
+
+def eutils_url(name):
+    """URL narzędzia E-utilities (esearch, efetch) pod NCBI_EUTILS_URL"""
+    return f"{settings.NCBI_EUTILS_URL.rstrip('/')}/{name}.fcgi"
+
+
+def _api_params(params):
+    api_key = getattr(settings, 'NCBI_API_KEY', '')
+    if api_key:
+        params['api_key'] = api_key
+    return params
+
+
+def ncbi_limiter():
+    """RateLimiter z limitem NCBI: 3 zapytania/s, 10 z NCBI_API_KEY"""
+    return RateLimiter(NCBI_RATE_WITH_KEY if getattr(settings, 'NCBI_API_KEY', '') else NCBI_RATE)
+
+
+def search_pmids(session, limit, term=DEFAULT_TERM, limiter=None):
+    """
+    Wyszukaj najnowsze artykuły w PubMed
+
+    Args:
+        limiter: RateLimiter zapytań do NCBI (domyślnie ncbi_limiter())
+
+    Returns:
+        list: PMID (stringi), maksymalnie `limit`
+    """
+    pmids = []
+    run = current_run()
+    limiter = limiter or ncbi_limiter()
+    while len(pmids) < limit:
+        retmax = min(limit - len(pmids), ESEARCH_MAX_RETMAX)
+        limiter.acquire()
+        with run.phase('http'):
+            response = session.get(eutils_url('esearch'), params=_api_params({
+                'db': 'pubmed',
+                'term': term,
+                'retstart': len(pmids),
+                'retmax': retmax,
+                'sort': 'pub_date',
+                'retmode': 'json',
+            }), timeout=30)
+            response.raise_for_status()
+            id_list = response.json().get('esearchresult', {}).get('idlist', [])
+        pmids.extend(id_list)
+        if len(id_list) < retmax:
+            break
+    return pmids
+
+
+def fetch_articles(session, pmids, limiter=None):
+    """
+    Pobierz jedną paczkę artykułów przez efetch i sparsuj ją strumieniowo
+
+    Pobieranie i parsowanie idą razem (strumień), więc w metrykach przebiegu
+    to jedna faza "fetch" - bez czasu, w którym odbiorca trzyma artykuł.
+
+    Yields:
+        dict: artykuły, każdy zaraz po sparsowaniu
+    """
+    run = current_run()
+    if limiter is not None:
+        limiter.acquire()
+    started = time.perf_counter()
+    response = session.post(eutils_url('efetch'), data=_api_params({
+        'db': 'pubmed',
+        'id': ','.join(pmids),
+        'retmode': 'xml',
+    }), timeout=60, stream=True)
+    try:
+        response.raise_for_status()
+        # urllib3 rozpakowuje gzip dopiero gdy o to poprosimy
+        response.raw.decode_content = True
+        for article in parse_articles(response.raw):
+            run.add_phase('fetch', time.perf_counter() - started)
+            yield article
+            started = time.perf_counter()
+        run.add_phase('fetch', time.perf_counter() - started)
+    finally:
+        response.close()
+
+
+def parse_articles(stream):
+    """
+    Parsuje XML efetch przez iterparse, zwalniając każdy artykuł po odczycie
+
+    Yields:
+        dict: artykuł w formacie oczekiwanym przez fetch_medical_news
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+        if elem.tag != 'PubmedArticle':
+            continue
+
+        try:
+            yield article_to_dict(elem)
+        except Exception as e:
+            logger.warning(f"Błąd parsowania artykułu: {str(e)}")
+        finally:
+            # Bez tego drzewo rośnie o każdy (pusty) artykuł pod korzeniem
+            elem.clear()
+            root.clear()
+
+
+def _text(elem):
+    return ''.join(elem.itertext()).strip() if elem is not None else ''
+
+
+def article_to_dict(article):
+    """Mapuje element <PubmedArticle> na słownik newsa"""
+    # Tytuł
+    title = _text(article.find('.//ArticleTitle')) or 'No title'
+
+    # Abstract
+    abstract = ' '.join(filter(None, (_text(elem) for elem in article.findall('.//AbstractText'))))
+    if not abstract:
+        abstract = title  # Fallback do tytułu jeśli brak abstractu
+
+    # PMID (ID artykułu)
+    pmid = _text(article.find('.//PMID'))
+
+    # Data publikacji
+    pub_date = article.find('.//PubDate')
+    if pub_date is not None:
+        year = pub_date.find('Year')
+        month = pub_date.find('Month')
+        day = pub_date.find('Day')
+
+        year_str = year.text if year is not None else '2025'
+        month_str = parse_month(month.text if month is not None else '01')
+        day_str = day.text.zfill(2) if day is not None else '01'
+
+        date_str = f"{year_str}-{month_str}-{day_str}T00:00:00Z"
+    else:
+        date_str = timezone.now().isoformat()
+
+    # Journal/Source
+    source = _text(article.find('.//Journal/Title')) or 'PubMed'
+
+    return {
+        'title': title,
+        'description': abstract[:1000].strip(),  # Max 1000 chars
+        'url': f'https://pubmed.ncbi.nlm.nih.gov/{pmid}/' if pmid else '',
+        'source': source,
+        'publishedAt': date_str,
+        'urlToImage': '',  # PubMed nie ma obrazków
+    }
+
+
+def iter_articles(session, pmids, batch_size=200, workers=3, limiter=None, queue_size=ARTICLE_QUEUE_SIZE):
+    """
+    Pobiera artykuły paczkami efetch, kilka paczek równolegle
+
+    Wątki pobierające przekazują każdy sparsowany artykuł przez ograniczoną
+    kolejkę, więc zapis może zacząć się przed końcem paczki, a w pamięci
+    jest najwyżej `queue_size` artykułów (plus po jednym w każdym wątku),
+    niezależnie od --limit i rozmiaru paczki. Gdy odbiorca nie nadąża,
+    wątki czekają na miejsce w kolejce.
+
+    Args:
+        limiter: RateLimiter zapytań do NCBI (domyślnie ncbi_limiter())
+
+    Yields:
+        dict: artykuły w kolejności parsowania (paczki się przeplatają)
+    """
+    batches = [pmids[i:i + batch_size] for i in range(0, len(pmids), batch_size)]
+    if not batches:
+        return
+    limiter = limiter or ncbi_limiter()
+    articles = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put(item):
+        # Odbiorca mógł przestać czytać (break w pętli) - wtedy nie czekamy w nieskończoność
+        while not stop.is_set():
+            try:
+                articles.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch_batch(batch):
+        try:
+            for article in fetch_articles(session, batch, limiter):
+                if not put(article):
+                    return
+        except Exception as e:
+            # Nieudana paczka nie przerywa całego importu
+            logger.warning(f"Nie udało się pobrać paczki efetch: {str(e)}")
+        finally:
+            put(_BATCH_DONE)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for batch in batches:
+            executor.submit(fetch_batch, batch)
+        remaining = len(batches)
+        while remaining:
+            article = articles.get()
+            if article is _BATCH_DONE:
+                remaining -= 1
+                continue
+            yield article
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,3 +1,105 @@
-from django.test import TestCase
+import io
+import threading
+import time
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from core.llm import RateLimiter
+from . import pubmed
+
+ARTICLE_XML = (
+    '<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>'
+    '<ArticleTitle>Article {pmid}</ArticleTitle></Article></MedlineCitation></PubmedArticle>'
+)
+
+
+class BlockingStream(io.RawIOBase):
+    """efetch body that sends the first article, then waits for `release`"""
+
+    def __init__(self, pmids, release):
+        self.chunks = [
+            b'<?xml version="1.0"?><PubmedArticleSet>' + ARTICLE_XML.format(pmid=pmids[0]).encode(),
+            None,
+            ''.join(ARTICLE_XML.format(pmid=pmid) for pmid in pmids[1:]).encode() + b'</PubmedArticleSet>',
+        ]
+        self.release = release
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if not self.chunks:
+            return b''
+        chunk = self.chunks.pop(0)
+        if chunk is None:
+            self.release.wait(timeout=5)
+            chunk = self.chunks.pop(0)
+        return chunk
+
+
+class FakeSession:
+
+    def __init__(self, release):
+        self.release = release
+        self.posts = 0
+
+    def post(self, url, data, **kwargs):
+        self.posts += 1
+        raw = BlockingStream(data['id'].split(','), self.release)
+        return SimpleNamespace(raw=raw, raise_for_status=lambda: None, close=lambda: None)
+
+
+class CountingLimiter:
+
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self):
+        self.calls += 1
+
+
+class RateLimitTests(SimpleTestCase):
+
+    def test_rate_limiter_rejects_non_positive_rates(self):
+        for rate in (0, -1):
+            with self.subTest(rate=rate):
+                with self.assertRaises(ValueError):
+                    RateLimiter(rate)
+
+    def test_fetch_command_rejects_non_positive_rate(self):
+        for rate in ('0', '-2'):
+            with self.subTest(rate=rate):
+                with self.assertRaises(CommandError):
+                    call_command('fetch_medical_news', '--rate', rate)
+
+
+class PubmedStreamingTests(SimpleTestCase):
+
+    def test_articles_are_yielded_before_the_batch_finishes(self):
+        release = threading.Event()
+        session = FakeSession(release)
+        articles = pubmed.iter_articles(session, ['1', '2', '3'], batch_size=3, workers=1, limiter=CountingLimiter())
+
+        # The rest of the batch is still "downloading" (BlockingStream gives up after 5s)
+        started = time.monotonic()
+        self.assertEqual(next(articles)['title'], 'Article 1')
+        self.assertLess(time.monotonic() - started, 2)
+        release.set()
+        self.assertEqual([article['title'] for article in articles], ['Article 2', 'Article 3'])
+
+    def test_every_efetch_request_waits_for_the_limiter(self):
+        release = threading.Event()
+        release.set()
+        limiter = CountingLimiter()
+        articles = list(pubmed.iter_articles(FakeSession(release), [str(i) for i in range(5)], batch_size=2, workers=2, limiter=limiter))
+
+        self.assertEqual(sorted(article['title'] for article in articles), [f'Article {i}' for i in range(5)])
+        self.assertEqual(limiter.calls, 3)
+
+    def test_ncbi_limit_depends_on_api_key(self):
+        with override_settings(NCBI_API_KEY=''):
+            self.assertEqual(pubmed.ncbi_limiter().rate, 3)
+        with override_settings(NCBI_API_KEY='key'):
+            self.assertEqual(pubmed.ncbi_limiter().rate, 10)
@@ -0,0 +1,132 @@
+"""
+Współbieżne tłumaczenie tekstów na polski przez Scaleway AI
+
+Zamiast dwóch szeregowych wywołań LLM na artykuł i time.sleep(1):
+- krótkie teksty są pakowane po kilka w jedno zapytanie (tablica JSON),
+- zapytania idą równolegle z puli wątków,
+- tempo ogranicza core.llm.RateLimiter (token bucket) zamiast stałego opóźnienia.
+"""
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from core.ingestion import create_completion, current_run
+from core.llm import strip_code_fence
+
+logger = logging.getLogger(__name__)
+
+SINGLE_SYSTEM_PROMPT = (
+    "You are a professional translator. Translate the given text to Polish. "
+    "Return ONLY the translation, nothing else."
+)
+BATCH_SYSTEM_PROMPT = (
+    "You are a professional translator. You receive a JSON array of texts. "
+    "Translate every element to Polish. Return ONLY a JSON array of strings "
+    "with exactly the same number of elements, in the same order."
+)
+
+
+class Translator:
+    """Tłumaczy wiele tekstów naraz, pakując krótkie teksty w jedno zapytanie"""
+
+    def __init__(self, client, model, limiter, workers=4, batch_size=8,
+                 max_batch_chars=2500, short_text_chars=600):
+        self.client = client
+        self.model = model
+        self.limiter = limiter
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_batch_chars = max_batch_chars
+        self.short_text_chars = short_text_chars
+
+    def translate_many(self, texts):
+        """
+        Przetłumacz listę tekstów
+
+        Args:
+            texts: lista tekstów (puste teksty zwracane są jako "")
+
+        Returns:
+            list: (tłumaczenie, czy_przetłumaczono) w tej samej kolejności;
+                przy błędzie zwracany jest tekst oryginalny i False
+        """
+        results = ['' if not text or not text.strip() else text for text in texts]
+        # Identyczne teksty tłumaczymy raz
+        unique_texts = list(dict.fromkeys(text for text in texts if text and text.strip()))
+        if not unique_texts:
+            return [(text, True) for text in results]
+        non_empty = sum(1 for text in texts if text and text.strip())
+        current_run().cache('translation_dedup', hit=True, amount=non_empty - len(unique_texts))
+        current_run().cache('translation_dedup', hit=False, amount=len(unique_texts))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            translated_batches = executor.map(self._translate_batch, self._pack(unique_texts))
+            translations = {}
+            for batch, translated in translated_batches:
+                translations.update(zip(batch, translated))
+
+        return [translations.get(text, (text, False)) if text else (text, True) for text in results]
+
+    def _pack(self, texts):
+        """Grupuje krótkie teksty w paczki; długie teksty idą pojedynczo"""
+        batch, batch_chars = [], 0
+        for text in texts:
+            if len(text) > self.short_text_chars:
+                yield [text]
+                continue
+            if batch and (len(batch) >= self.batch_size or batch_chars + len(text) > self.max_batch_chars):
+                yield batch
+                batch, batch_chars = [], 0
+            batch.append(text)
+            batch_chars += len(text)
+        if batch:
+            yield batch
+
+    def _translate_batch(self, batch):
+        if len(batch) == 1:
+            return batch, [self.translate_one(batch[0])]
+
+        translated = self._request_batch(batch)
+        if translated is None:
+            # Odpowiedź nie przeszła walidacji - tłumaczymy pojedynczo
+            return batch, [self.translate_one(text) for text in batch]
+        return batch, [(text, True) for text in translated]
+
+    def _request_batch(self, batch):
+        try:
+            content = self._complete(BATCH_SYSTEM_PROMPT, json.dumps(batch, ensure_ascii=False))
+            translated = json.loads(strip_code_fence(content))
+        except Exception as e:
+            logger.warning(f"Batch translation failed, falling back to single texts: {str(e)}")
+            return None
+
+        if (not isinstance(translated, list) or len(translated) != len(batch)
+                or not all(isinstance(t, str) and t.strip() for t in translated)):
+            logger.warning("Batch translation returned an invalid array, falling back to single texts")
+            return None
+        return [t.strip() for t in translated]
+
+    def translate_one(self, text):
+        """Zwraca (tłumaczenie, True) albo (tekst oryginalny, False) przy błędzie"""
+        try:
+            return self._complete(SINGLE_SYSTEM_PROMPT, f"Translate this to Polish: {text}"), True
+        except Exception as e:
+            logger.warning(f"Translation failed, using original text: {str(e)}")
+            return text, False
+
+    def _complete(self, system_prompt, user_content):
+        self.limiter.acquire()
+        response = create_completion(
+            self.client,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            max_tokens=2048,
+            temperature=0.3,
+            top_p=0.8,
+            stream=False
+        )
+        return response.choices[0].message.content.strip()
+
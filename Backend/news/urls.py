@@ -1,10 +1,15 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import MedicalNewsViewSet
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'medical', MedicalNewsViewSet, basename='medical-news')
 
 urlpatterns = [
+    # Async wersje endpointów (ASGI)
+    path('async/medical/', async_views.news_list, name='async-medical-news-list'),
+    path('async/medical/latest/', async_views.news_latest, name='async-medical-news-latest'),
+    path('async/medical/<int:pk>/', async_views.news_detail, name='async-medical-news-detail'),
     path('', include(router.urls)),
 ]
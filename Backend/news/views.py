@@ -1,11 +1,22 @@
 from rest_framework import viewsets, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from core.query_budget import QueryBudgetMixin, parse_limit
 from .models import MedicalNews
 from .serializers import MedicalNewsSerializer
 
 
-class MedicalNewsViewSet(viewsets.ReadOnlyModelViewSet):
+def filter_news(queryset, params):
+    """Apply the list endpoint filters"""
+    # Filtrowanie tylko przetłumaczonych newsów
+    only_translated = params.get('translated', None)
+    if only_translated == 'true':
+        queryset = queryset.filter(is_translated=True)
+    
+    return queryset
+
+
+class MedicalNewsViewSet(QueryBudgetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet do pobierania newsów medycznych.
     Tylko odczyt (GET) - newsy są dodawane przez scheduled task.
@@ -13,21 +24,15 @@ class MedicalNewsViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = MedicalNews.objects.all()
     serializer_class = MedicalNewsSerializer
     permission_classes = [permissions.AllowAny]  # Możesz zmienić na IsAuthenticated
+    cursor_ordering = '-published_at'
     
     def get_queryset(self):
-        queryset = MedicalNews.objects.all()
-        
-        # Filtrowanie tylko przetłumaczonych newsów
-        only_translated = self.request.query_params.get('translated', None)
-        if only_translated == 'true':
-            queryset = queryset.filter(is_translated=True)
-        
-        return queryset
+        return filter_news(MedicalNews.objects.all(), self.request.query_params)
     
     @action(detail=False, methods=['get'])
     def latest(self, request):
-        """Endpoint do pobrania najnowszych newsów"""
-        limit = int(request.query_params.get('limit', 10))
+        """Endpoint do pobrania najnowszych newsów (limit przycinany do QUERY_BUDGET['MAX_LIMIT'])"""
+        limit = parse_limit(request.query_params)
         news = self.get_queryset()[:limit]
         serializer = self.get_serializer(news, many=True)
         return Response(serializer.data)
@@ -0,0 +1,54 @@
+"""
+Async variants of the drug endpoints, served through api/asgi.py
+"""
+from django.http import JsonResponse
+
+from core.async_api import (
+    async_api_view,
+    capped_json_response,
+    not_found,
+    request_json,
+    serialize_object,
+)
+from core.query_budget import validate_value
+from .models import Drug
+from .serializers import DrugSerializer
+from .views import SEARCH_THROTTLE_COST, filter_drugs, search_drugs_by_name, search_drugs_by_substance
+
+
+@async_api_view(['GET'])
+async def drug_list(request):
+    """Async version of DrugListView"""
+    queryset = filter_drugs(Drug.objects.all().order_by('id'), request.GET)
+    return await capped_json_response(DrugSerializer, queryset)
+
+
+@async_api_view(['GET'])
+async def drug_detail(request, pk):
+    """Async version of DrugDetailView"""
+    data = await serialize_object(DrugSerializer, Drug.objects.all(), pk)
+    if data is None:
+        return not_found()
+    return JsonResponse(data)
+
+
+@async_api_view(['POST'], throttle_cost=SEARCH_THROTTLE_COST, throttle_bucket='search')
+async def drug_search_by_name(request):
+    """Async version of DrugSearchByNameView"""
+    search_query = request_json(request).get('name', '')
+    if not search_query:
+        return JsonResponse({'error': 'Parameter "name" is required'}, status=400)
+    validate_value('name', str(search_query))
+
+    return await capped_json_response(DrugSerializer, search_drugs_by_name(search_query))
+
+
+@async_api_view(['POST'], throttle_cost=SEARCH_THROTTLE_COST, throttle_bucket='search')
+async def drug_search_by_substance(request):
+    """Async version of DrugSearchBySubstanceView"""
+    search_query = request_json(request).get('substance', '')
+    if not search_query:
+        return JsonResponse({'error': 'Parameter "substance" is required'}, status=400)
+    validate_value('substance', str(search_query))
+
+    return await capped_json_response(DrugSerializer, search_drugs_by_substance(search_query))
@@ -4,6 +4,8 @@ Django management command to import drugs from JSON file
 import json
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from core.ingestion import current_run, ingestion_run
+from core.models import IngestionRun
 from pharmac.models import Drug
 
 
@@ -11,12 +13,17 @@ class Command(BaseCommand):
     help = 'Import drugs from JSON file (pharmac/initial/drugs.json)'
 
     def handle(self, *args, **options):
+        with ingestion_run(IngestionRun.Source.IMPORT_DRUGS, log=self.stdout.write):
+            self.import_drugs()
+
+    def import_drugs(self):
         json_file_path = 'pharmac/initial/drugs.json'
+        run = current_run()
         
         self.stdout.write(f"📁 Loading data from {json_file_path}...")
         
         try:
-            with open(json_file_path, 'r', encoding='utf-8') as f:
+            with run.phase('parse'), open(json_file_path, 'r', encoding='utf-8') as f:
                 drugs_data = json.load(f)
             
             self.stdout.write(f"✅ Loaded {len(drugs_data)} drugs from JSON")
@@ -26,7 +33,7 @@ class Command(BaseCommand):
             skipped_count = 0
             errors = []
             
-            with transaction.atomic():
+            with run.phase('db'), transaction.atomic():
                 for idx, drug_data in enumerate(drugs_data, 1):
                     try:
                         # Get or create drug
@@ -57,8 +64,16 @@ class Command(BaseCommand):
                         error_msg = f"Error processing drug at index {idx}: {str(e)}"
                         self.stdout.write(self.style.ERROR(f"❌ {error_msg}"))
                         errors.append(error_msg)
+                        run.error(error_msg)
                         continue
             
+            run.add_rows(created_count)
+            run.count('created', created_count)
+            run.count('skipped', skipped_count)
+            # Trafienie = lek już był w bazie
+            run.cache('existing', hit=True, amount=skipped_count)
+            run.cache('existing', hit=False, amount=created_count)
+            
             # Summary
             self.stdout.write("\n" + "="*50)
             self.stdout.write(self.style.SUCCESS(f"✅ Import completed!"))
@@ -75,9 +90,12 @@ class Command(BaseCommand):
                     self.stdout.write(f"  ... and {len(errors) - 10} more errors")
         
         except FileNotFoundError:
+            run.fail(f"File not found: {json_file_path}")
             self.stdout.write(self.style.ERROR(f"❌ File not found: {json_file_path}"))
         except json.JSONDecodeError as e:
+            run.fail(f"Invalid JSON: {str(e)}")
             self.stdout.write(self.style.ERROR(f"❌ Invalid JSON: {str(e)}"))
         except Exception as e:
+            run.fail(f"Unexpected error: {str(e)}")
             self.stdout.write(self.style.ERROR(f"❌ Unexpected error: {str(e)}"))
 
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import views, async_views
 
 app_name = 'pharmac'
 
@@ -15,5 +15,11 @@ urlpatterns = [
     
     # Search by active substance
     path('search/substance/', views.DrugSearchBySubstanceView.as_view(), name='drug-search-by-substance'),
+    
+    # Async variants (ASGI)
+    path('async/drugs/', async_views.drug_list, name='async-drug-list'),
+    path('async/drugs/<int:pk>/', async_views.drug_detail, name='async-drug-detail'),
+    path('async/search/name/', async_views.drug_search_by_name, name='async-drug-search-by-name'),
+    path('async/search/substance/', async_views.drug_search_by_substance, name='async-drug-search-by-substance'),
 ]
 
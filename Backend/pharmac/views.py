@@ -4,11 +4,59 @@ from rest_framework.permissions import AllowAny
 from django.db.models import Q
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 
+from core.query_budget import QueryBudgetMixin, TimedRetrieveMixin, validate_value
 from .models import Drug
 from .serializers import DrugSerializer
 
 
-class DrugListView(generics.ListAPIView):
+# Searches scan the whole drug table - each one costs several tokens
+# and is also paid from the separate "search" bucket
+SEARCH_THROTTLE_COST = 3
+
+
+def filter_drugs(queryset, params):
+    """Apply the list endpoint filters (partial, case-insensitive matches)"""
+    # Filter by product name
+    product_name = params.get('product_name')
+    if product_name:
+        queryset = queryset.filter(
+            nazwa_produktu_leczniczego__icontains=product_name
+        )
+    
+    # Filter by common name
+    common_name = params.get('common_name')
+    if common_name:
+        queryset = queryset.filter(
+            nazwa_powszechnie_stosowana__icontains=common_name
+        )
+    
+    # Filter by active substance
+    active_substance = params.get('active_substance')
+    if active_substance:
+        queryset = queryset.filter(
+            substancja_czynna__icontains=active_substance
+        )
+    
+    return queryset
+
+
+def search_drugs_by_name(search_query):
+    """Search in product name, common name, and manufacturer"""
+    return Drug.objects.filter(
+        Q(nazwa_produktu_leczniczego__icontains=search_query) |
+        Q(nazwa_powszechnie_stosowana__icontains=search_query) |
+        Q(podmiot_odpowiedzialny__icontains=search_query)
+    ).order_by('nazwa_produktu_leczniczego')
+
+
+def search_drugs_by_substance(search_query):
+    """Search in active substance field"""
+    return Drug.objects.filter(
+        substancja_czynna__icontains=search_query
+    ).order_by('nazwa_produktu_leczniczego')
+
+
+class DrugListView(QueryBudgetMixin, generics.ListAPIView):
     """
     API endpoint to list all drugs
     
@@ -20,6 +68,7 @@ class DrugListView(generics.ListAPIView):
     
     serializer_class = DrugSerializer
     permission_classes = [AllowAny]
+    cursor_ordering = 'id'
     
     @extend_schema(
         parameters=[
@@ -48,32 +97,10 @@ class DrugListView(generics.ListAPIView):
     )
     def get_queryset(self):
         queryset = Drug.objects.all().order_by('id')
-        
-        # Filter by product name (partial match, case-insensitive)
-        product_name = self.request.query_params.get('product_name')
-        if product_name:
-            queryset = queryset.filter(
-                nazwa_produktu_leczniczego__icontains=product_name
-            )
-        
-        # Filter by common name (partial match, case-insensitive)
-        common_name = self.request.query_params.get('common_name')
-        if common_name:
-            queryset = queryset.filter(
-                nazwa_powszechnie_stosowana__icontains=common_name
-            )
-        
-        # Filter by active substance (partial match, case-insensitive)
-        active_substance = self.request.query_params.get('active_substance')
-        if active_substance:
-            queryset = queryset.filter(
-                substancja_czynna__icontains=active_substance
-            )
-        
-        return queryset
+        return filter_drugs(queryset, self.request.query_params)
 
 
-class DrugDetailView(generics.RetrieveAPIView):
+class DrugDetailView(TimedRetrieveMixin, generics.RetrieveAPIView):
     """API endpoint to get details of a specific drug by ID"""
     
     queryset = Drug.objects.all().order_by('id')
@@ -81,7 +108,7 @@ class DrugDetailView(generics.RetrieveAPIView):
     permission_classes = [AllowAny]
 
 
-class DrugSearchByNameView(generics.GenericAPIView):
+class DrugSearchByNameView(QueryBudgetMixin, generics.GenericAPIView):
     """
     API endpoint to search drugs by product name (partial match)
     
@@ -90,6 +117,8 @@ class DrugSearchByNameView(generics.GenericAPIView):
     
     serializer_class = DrugSerializer
     permission_classes = [AllowAny]
+    throttle_cost = SEARCH_THROTTLE_COST
+    throttle_bucket = 'search'
     
     @extend_schema(
         request={
@@ -118,18 +147,13 @@ class DrugSearchByNameView(generics.GenericAPIView):
                 status=400
             )
         
-        # Search in product name, common name, and manufacturer
-        queryset = Drug.objects.filter(
-            Q(nazwa_produktu_leczniczego__icontains=search_query) |
-            Q(nazwa_powszechnie_stosowana__icontains=search_query) |
-            Q(podmiot_odpowiedzialny__icontains=search_query)
-        ).order_by('nazwa_produktu_leczniczego')
+        validate_value('name', str(search_query))
+        queryset = search_drugs_by_name(search_query)
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.capped_response(queryset)
 
 
-class DrugSearchBySubstanceView(generics.GenericAPIView):
+class DrugSearchBySubstanceView(QueryBudgetMixin, generics.GenericAPIView):
     """
     API endpoint to search drugs by active substance (partial match)
     
@@ -138,6 +162,8 @@ class DrugSearchBySubstanceView(generics.GenericAPIView):
     
     serializer_class = DrugSerializer
     permission_classes = [AllowAny]
+    throttle_cost = SEARCH_THROTTLE_COST
+    throttle_bucket = 'search'
     
     @extend_schema(
         request={
@@ -166,10 +192,7 @@ class DrugSearchBySubstanceView(generics.GenericAPIView):
                 status=400
             )
         
-        # Search in active substance field
-        queryset = Drug.objects.filter(
-            substancja_czynna__icontains=search_query
-        ).order_by('nazwa_produktu_leczniczego')
+        validate_value('substance', str(search_query))
+        queryset = search_drugs_by_substance(search_query)
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.capped_response(queryset)
@@ -0,0 +1,26 @@
+"""
+Async variants of the legal regulation endpoints, served through api/asgi.py
+"""
+from django.http import JsonResponse
+
+from core.async_api import async_api_view, capped_json_response, not_found, serialize_object
+from .models import LegalRegulation
+from .serializers import LegalRegulationSerializer, LegalRegulationListSerializer
+from .views import filter_regulations, slice_regulations
+
+
+@async_api_view(['GET'])
+async def regulation_list(request):
+    """Async version of LegalRegulationListView"""
+    queryset = filter_regulations(LegalRegulation.objects.all(), request.GET)
+    queryset = slice_regulations(queryset, request.GET)
+    return await capped_json_response(LegalRegulationListSerializer, queryset)
+
+
+@async_api_view(['GET'])
+async def regulation_detail(request, pk):
+    """Async version of LegalRegulationDetailView"""
+    data = await serialize_object(LegalRegulationSerializer, LegalRegulation.objects.all(), pk)
+    if data is None:
+        return not_found()
+    return JsonResponse(data)
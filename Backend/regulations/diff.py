@@ -0,0 +1,132 @@
+"""
+Change detection for legal regulations
+
+Every regulation stores a content_hash of the fields that come from the
+gov.pl register. A scrape compares the hashes of all fetched rows with the
+database in one query and sorts them into new, changed and unchanged rows,
+so only changed rows are written and only rows whose AI inputs changed (or
+that never got an AI summary) are summarized again.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, field
+
+from .models import LegalRegulation
+
+# Register column -> model field
+REGISTER_COLUMNS = {
+    'Lp.': 'lp',
+    'Podstawa wydania': 'podstawa_wydania',
+    'Tytuł rozporządzenia': 'tytul_rozporzadzenia',
+    'Przyczyny rezygnacji z prac nad projektem': 'przyczyny_rezygnacji',
+    'Planowany termin wydania / Publikacja w Dz. U': 'planowany_termin_wydania',
+    'Istota rozwiązań, które planuje się zawrzeć w projekcie:': 'istota_rozwiazan',
+    'Imię, nazwisko, stanowisko lub funkcja osoby odpowiedzialnej za opracowanie projektu:': 'osoba_odpowiedzialna',
+    'Przyczyna i potrzeba wprowadzenia rozwiązań, które planuje się zawrzeć w projekcie:': 'przyczyna_potrzeba',
+}
+
+# Fields covered by content_hash (keep in sync with migration 0003)
+SOURCE_FIELDS = [
+    'lp',
+    'podstawa_wydania',
+    'tytul_rozporzadzenia',
+    'przyczyny_rezygnacji',
+    'planowany_termin_wydania',
+    'istota_rozwiazan',
+    'osoba_odpowiedzialna',
+    'przyczyna_potrzeba',
+]
+
+# Fields the AI title/description is generated from
+AI_INPUT_FIELDS = [
+    'podstawa_wydania',
+    'tytul_rozporzadzenia',
+    'istota_rozwiazan',
+    'przyczyna_potrzeba',
+    'przyczyny_rezygnacji',
+]
+
+
+def parse_register_row(reg_data):
+    """
+    Map one gov.pl register entry to model field values
+
+    Returns:
+        dict with nr_w_wykazie and SOURCE_FIELDS, or None without a number
+    """
+    nr_w_wykazie = (reg_data.get('Nr w Wykazie') or '').strip()
+    if not nr_w_wykazie:
+        return None
+
+    row = {'nr_w_wykazie': nr_w_wykazie}
+    for column, field_name in REGISTER_COLUMNS.items():
+        value = reg_data.get(column)
+        row[field_name] = '' if value is None else str(value)
+    return row
+
+
+def compute_content_hash(values):
+    """sha256 of the register fields (dict or LegalRegulation)"""
+    get = values.get if isinstance(values, dict) else lambda name: getattr(values, name)
+    payload = json.dumps([(get(name) or '').strip() for name in SOURCE_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def changed_fields(regulation, row):
+    """Register fields whose value differs between the DB and the fetched row"""
+    return [
+        name for name in SOURCE_FIELDS
+        if (getattr(regulation, name) or '').strip() != (row[name] or '').strip()
+    ]
+
+
+def has_ai_summary(regulation):
+    """Whether the AI stage has already filled the title and description"""
+    return bool(regulation.ai_tytul and regulation.ai_description)
+
+
+@dataclass
+class RegulationDiff:
+    new: list = field(default_factory=list)
+    # (LegalRegulation, fetched row, changed field names)
+    changed: list = field(default_factory=list)
+    unchanged: int = 0
+    # Unchanged LegalRegulation rows without an AI title or description
+    missing_ai: list = field(default_factory=list)
+
+
+def diff_regulations(rows):
+    """
+    Compare fetched register rows with the database in one query
+
+    Args:
+        rows: dicts from parse_register_row (content_hash is added)
+
+    Returns:
+        RegulationDiff
+    """
+    for row in rows:
+        row['content_hash'] = compute_content_hash(row)
+
+    existing = LegalRegulation.objects.filter(
+        nr_w_wykazie__in=[row['nr_w_wykazie'] for row in rows]
+    ).in_bulk(field_name='nr_w_wykazie')
+
+    diff = RegulationDiff()
+    seen = set()
+    for row in rows:
+        # The register occasionally lists a number twice - the first entry wins
+        if row['nr_w_wykazie'] in seen:
+            continue
+        seen.add(row['nr_w_wykazie'])
+
+        regulation = existing.get(row['nr_w_wykazie'])
+        if regulation is None:
+            diff.new.append(row)
+        elif regulation.content_hash == row['content_hash']:
+            diff.unchanged += 1
+            if not has_ai_summary(regulation):
+                diff.missing_ai.append(regulation)
+        else:
+            diff.changed.append((regulation, row, changed_fields(regulation, row)))
+    return diff
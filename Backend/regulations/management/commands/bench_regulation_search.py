@@ -0,0 +1,148 @@
+"""
+Django management command measuring full-text search latency
+
+Runs a fixed set of typical user queries against the regulation search
+(the same query the /regulations/search/ endpoint runs) and reports hits
+and p50/p95/max latency per query, e.g.:
+
+    python manage.py bench_regulation_search
+    python manage.py bench_regulation_search --repeat 50 --compare-icontains
+    python manage.py bench_regulation_search --explain --output search.json
+
+Keep the query set stable so results can be compared between runs.
+"""
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Q
+
+from regulations.models import LegalRegulation
+from regulations.search import search_regulations
+
+BENCHMARK_QUERIES = [
+    'refundacja',
+    'leki refundowane',
+    'apteka',
+    'szpital',
+    'ratownictwo medyczne',
+    'szczepienia ochronne',
+    'dokumentacja medyczna',
+    'badania laboratoryjne',
+    'wyroby medyczne',
+    'zywnosc',
+    '"świadczenia gwarantowane"',
+    'pielęgniarki -położne',
+    'onkologia or nowotwory',
+    'lekarz dentysta',
+]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark full-text search over legal regulations with a fixed query set'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per query (default 20)')
+        parser.add_argument('--limit', type=int, default=20, help='Results fetched per query (default 20)')
+        parser.add_argument(
+            '--query',
+            action='append',
+            dest='queries',
+            help='Query to run instead of the built-in set, can be repeated',
+        )
+        parser.add_argument(
+            '--compare-icontains',
+            action='store_true',
+            help='Also time an icontains scan over the same text columns',
+        )
+        parser.add_argument('--explain', action='store_true', help='Print EXPLAIN ANALYZE for each query')
+        parser.add_argument('--output', help='Write results to this JSON file')
+
+    def handle(self, *args, **options):
+        queries = options['queries'] or BENCHMARK_QUERIES
+        total = LegalRegulation.objects.count()
+        indexed = LegalRegulation.objects.filter(search_vector__isnull=False).count()
+
+        self.stdout.write(
+            f"🔎 Regulation search benchmark: {len(queries)} queries x {options['repeat']} runs, "
+            f"{total} regulations ({indexed} indexed)"
+        )
+        self.stdout.write('=' * 70)
+
+        results = []
+        for text in queries:
+            queryset = search_regulations(LegalRegulation.objects.all(), text)[:options['limit']]
+            result = {'query': text, 'fts': self.measure(queryset, options['repeat'])}
+
+            if options['compare_icontains']:
+                # Same words without the web search syntax
+                words = [
+                    word.strip('"') for word in text.split()
+                    if word.lower() != 'or' and not word.startswith('-')
+                ]
+                scan = LegalRegulation.objects.filter(self.icontains_filter(words))[:options['limit']]
+                result['icontains'] = self.measure(scan, options['repeat'])
+
+            results.append(result)
+            self.print_result(result)
+
+            if options['explain']:
+                self.stdout.write(queryset.explain(analyze=True))
+
+        all_p50 = [r['fts']['p50_ms'] for r in results]
+        self.stdout.write('\n' + '=' * 70)
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Median of p50: {statistics.median(all_p50):.2f}ms, worst p95: "
+            f"{max(r['fts']['p95_ms'] for r in results):.2f}ms"
+        ))
+
+        if options['output']:
+            report = {
+                'vendor': connection.vendor,
+                'regulations': total,
+                'indexed': indexed,
+                'repeat': options['repeat'],
+                'limit': options['limit'],
+                'results': results,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            self.stdout.write(self.style.SUCCESS(f"✅ Results written to {options['output']}"))
+
+    def measure(self, queryset, repeat):
+        timings = []
+        hits = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            hits = len(list(queryset))
+            timings.append((time.perf_counter() - started) * 1000)
+        return {
+            'hits': hits,
+            'p50_ms': round(statistics.median(timings), 2),
+            'p95_ms': round(percentile(timings, 0.95), 2),
+            'max_ms': round(max(timings), 2),
+        }
+
+    def icontains_filter(self, words):
+        condition = Q()
+        for word in words:
+            word_match = Q()
+            for name in ('ai_tytul', 'tytul_rozporzadzenia', 'ai_description', 'istota_rozwiazan', 'przyczyna_potrzeba'):
+                word_match |= Q(**{f'{name}__icontains': word})
+            condition &= word_match
+        return condition
+
+    def print_result(self, result):
+        fts = result['fts']
+        line = f"📋 {result['query']:<30} {fts['hits']:>3} hits  p50 {fts['p50_ms']:>7.2f}ms  p95 {fts['p95_ms']:>7.2f}ms"
+        if 'icontains' in result:
+            scan = result['icontains']
+            line += f"  | icontains {scan['hits']:>3} hits  p50 {scan['p50_ms']:>7.2f}ms"
+        self.stdout.write(line)
@@ -1,22 +1,50 @@
 """
 Django management command to scrape legal regulations
 """
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from regulations.scraper import scrape_legal_regulations
 
 
 class Command(BaseCommand):
     help = 'Scrape legal regulations from Ministry of Health API and generate AI titles/descriptions'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ai-workers',
+            type=int,
+            default=4,
+            help='Concurrent AI requests (default 4)'
+        )
+        parser.add_argument(
+            '--ai-rate',
+            type=float,
+            default=None,
+            help='Max AI requests per second (default: unlimited)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Rows written per transaction (default 200)'
+        )
+
     def handle(self, *args, **options):
+        if options['ai_rate'] is not None and options['ai_rate'] <= 0:
+            raise CommandError('--ai-rate must be positive (omit it for no limit)')
+        
         self.stdout.write("🚀 Starting legal regulations scraper...")
         
-        result = scrape_legal_regulations()
+        result = scrape_legal_regulations(
+            ai_workers=options['ai_workers'],
+            ai_rate=options['ai_rate'],
+            batch_size=options['batch_size']
+        )
         
         self.stdout.write("\n" + "="*50)
         self.stdout.write(self.style.SUCCESS("✅ Scraping completed!"))
-        self.stdout.write(f"  New records: {result['new_records']}")
-        self.stdout.write(f"  Duplicates skipped: {result['duplicates_skipped']}")
+        self.stdout.write(f"  New records: {result['new_records']} (with AI: {result['ai_generated']})")
+        self.stdout.write(f"  Updated records: {result['updated_records']} (AI regenerated: {result['ai_regenerated']})")
+        self.stdout.write(f"  Unchanged skipped: {result['duplicates_skipped']}")
         self.stdout.write(f"  Errors: {len(result['errors'])}")
         
         if result['errors']:
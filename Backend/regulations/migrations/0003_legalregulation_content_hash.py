@@ -0,0 +1,43 @@
+# Generated by Django 4.2.11 on 2026-10-19 13:02
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+# Same fields and encoding as regulations.diff.compute_content_hash
+SOURCE_FIELDS = [
+    'lp',
+    'podstawa_wydania',
+    'tytul_rozporzadzenia',
+    'przyczyny_rezygnacji',
+    'planowany_termin_wydania',
+    'istota_rozwiazan',
+    'osoba_odpowiedzialna',
+    'przyczyna_potrzeba',
+]
+
+
+def backfill_content_hash(apps, schema_editor):
+    LegalRegulation = apps.get_model('regulations', 'LegalRegulation')
+    regulations = list(LegalRegulation.objects.only('id', *SOURCE_FIELDS))
+    for regulation in regulations:
+        payload = json.dumps([(getattr(regulation, name) or '').strip() for name in SOURCE_FIELDS], ensure_ascii=False)
+        regulation.content_hash = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    LegalRegulation.objects.bulk_update(regulations, ['content_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0002_legalregulation_planowany_termin_wydania_data_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='legalregulation',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', help_text='Hash of the fields scraped from the register', max_length=64),
+        ),
+        migrations.RunPython(backfill_content_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.11 on 2026-10-19 13:07
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+def backfill_is_withdrawn(apps, schema_editor):
+    LegalRegulation = apps.get_model('regulations', 'LegalRegulation')
+    LegalRegulation.objects.exclude(przyczyny_rezygnacji__regex=r'^\s*$').update(is_withdrawn=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0003_legalregulation_content_hash'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='legalregulation',
+            name='is_withdrawn',
+            field=models.BooleanField(default=False, help_text='Prace nad projektem zostały wstrzymane (są przyczyny rezygnacji)'),
+        ),
+        migrations.RunPython(backfill_is_withdrawn, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=models.Index(fields=['-created_at'], name='regulation_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=models.Index(fields=['planowany_termin_wydania_data'], name='regulation_planned_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=models.Index(fields=['is_withdrawn', 'planowany_termin_wydania_data'], name='regulation_status_planned_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('ai_tytul'), name='gin_trgm_ops'), name='regulation_ai_tytul_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('tytul_rozporzadzenia'), name='gin_trgm_ops'), name='regulation_tytul_trgm'),
+        ),
+    ]
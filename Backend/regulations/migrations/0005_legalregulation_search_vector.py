@@ -0,0 +1,54 @@
+# Generated by Django 4.2.11 on 2026-10-19 13:09
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import UnaccentExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# Same configuration and weights as regulations.search
+SEARCH_CONFIG = 'polish_unaccent'
+SEARCH_WEIGHTS = {
+    'A': ['ai_tytul', 'tytul_rozporzadzenia', 'nr_w_wykazie'],
+    'B': ['ai_description', 'istota_rozwiazan'],
+    'C': ['przyczyna_potrzeba', 'podstawa_wydania'],
+}
+
+# No Polish stemmer ships with PostgreSQL - simple dictionary behind unaccent
+CREATE_CONFIG = f"""
+CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = simple);
+ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG}
+    ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple;
+"""
+DROP_CONFIG = f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {SEARCH_CONFIG};"
+
+
+def backfill_search_vector(apps, schema_editor):
+    LegalRegulation = apps.get_model('regulations', 'LegalRegulation')
+    vector = None
+    for weight, fields in SEARCH_WEIGHTS.items():
+        part = SearchVector(*fields, weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    LegalRegulation.objects.update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0004_legalregulation_filters'),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        migrations.RunSQL(CREATE_CONFIG, DROP_CONFIG),
+        migrations.AddField(
+            model_name='legalregulation',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='regulation_search_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.11 on 2026-10-19 13:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('regulations', '0005_legalregulation_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='legalregulation',
+            name='regulation_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='legalregulation',
+            name='regulation_planned_idx',
+        ),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=models.Index(fields=['-created_at', '-id'], name='regulation_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=models.Index(fields=['planowany_termin_wydania_data', 'id'], name='regulation_planned_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legalregulation',
+            index=models.Index(models.OrderBy(models.F('planowany_termin_wydania_data'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='regulation_planned_desc_idx'),
+        ),
+    ]
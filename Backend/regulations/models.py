@@ -1,4 +1,10 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
+
+from .search import SEARCH_FIELDS, update_search_vectors
 
 
 class LegalRegulation(models.Model):
@@ -25,6 +31,11 @@ class LegalRegulation(models.Model):
         blank=True,
         help_text="Przyczyny rezygnacji z prac nad projektem"
     )
+    # Derived from przyczyny_rezygnacji so the status filter can use an index
+    is_withdrawn = models.BooleanField(
+        default=False,
+        help_text="Prace nad projektem zostały wstrzymane (są przyczyny rezygnacji)"
+    )
     planowany_termin_wydania = models.TextField(
         blank=True,
         help_text="Planowany termin wydania / Publikacja w Dz. U (tekst)"
@@ -61,6 +72,20 @@ class LegalRegulation(models.Model):
         help_text="AI-generated summary description"
     )
     
+    # sha256 of the register fields (regulations/diff.py) - detects changed rows
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        help_text="Hash of the fields scraped from the register"
+    )
+    
+    # Weighted tsvector for full-text search (regulations/search.py)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False
+    )
+    
     # Tracking
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -72,6 +97,26 @@ class LegalRegulation(models.Model):
         indexes = [
             models.Index(fields=['nr_w_wykazie']),
             models.Index(fields=['lp']),
+            # Same column order and NULL placement as regulations.views.regulation_ordering
+            models.Index(fields=['-created_at', '-id'], name='regulation_created_idx'),
+            # ASC puts NULLs last by default; DESC NULLS LAST needs its own index
+            models.Index(fields=['planowany_termin_wydania_data', 'id'], name='regulation_planned_idx'),
+            models.Index(
+                F('planowany_termin_wydania_data').desc(nulls_last=True),
+                F('id').desc(),
+                name='regulation_planned_desc_idx'
+            ),
+            models.Index(
+                fields=['is_withdrawn', 'planowany_termin_wydania_data'],
+                name='regulation_status_planned_idx'
+            ),
+            # Trigram indexes for the `q` filter (icontains compares UPPER(column))
+            GinIndex(OpClass(Upper('ai_tytul'), name='gin_trgm_ops'), name='regulation_ai_tytul_trgm'),
+            GinIndex(
+                OpClass(Upper('tytul_rozporzadzenia'), name='gin_trgm_ops'),
+                name='regulation_tytul_trgm'
+            ),
+            GinIndex(fields=['search_vector'], name='regulation_search_idx'),
         ]
         # Unique constraint to prevent duplicates
         constraints = [
@@ -81,5 +126,19 @@ class LegalRegulation(models.Model):
             )
         ]
     
+    def refresh_is_withdrawn(self):
+        """Derive is_withdrawn from przyczyny_rezygnacji (bulk writes skip save())"""
+        self.is_withdrawn = bool((self.przyczyny_rezygnacji or '').strip())
+    
+    def save(self, *args, **kwargs):
+        self.refresh_is_withdrawn()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'przyczyny_rezygnacji' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'is_withdrawn'}
+        super().save(*args, **kwargs)
+        
+        if update_fields is None or set(update_fields) & set(SEARCH_FIELDS):
+            update_search_vectors(type(self).objects.filter(pk=self.pk))
+    
     def __str__(self):
         return f"{self.nr_w_wykazie}: {self.ai_tytul or self.tytul_rozporzadzenia[:50]}"
@@ -1,134 +1,308 @@
 """
 Scraper for legal regulations from gov.pl Ministry of Health API
 """
-import requests
 import logging
+
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
+
+from core.ingestion import current_run, ingestion_run, log_event
+from core.llm import RateLimiter
+from core.models import IngestionRun
+from stream.publisher import publish_instances
 
 from .models import LegalRegulation
-from .ai_generator import generate_regulation_title_and_description
+from .search import update_search_vectors
+from .summarizer import RegulationSummarizer, build_client
 from .date_parser import parse_and_generate_date
+from .diff import AI_INPUT_FIELDS, SOURCE_FIELDS, diff_regulations, has_ai_summary, parse_register_row
 
 logger = logging.getLogger(__name__)
 
+# Written for every changed row - one bulk_update covers any combination of changes
+CHANGED_UPDATE_FIELDS = [
+    *SOURCE_FIELDS, 'is_withdrawn', 'content_hash', 'planowany_termin_wydania_data', 'updated_at'
+]
+
+
+def apply_changed_fields(regulation, row, fields):
+    """
+    Copy the changed register fields of a row onto an existing regulation
+    
+    The random planned date is regenerated only when the planned term text
+    changed.
+    
+    Returns:
+        bool: whether the AI title/description has to be regenerated
+    """
+    for name in fields:
+        setattr(regulation, name, row[name])
+    regulation.refresh_is_withdrawn()
+    regulation.content_hash = row['content_hash']
+    regulation.updated_at = timezone.now()
+    
+    if 'planowany_termin_wydania' in fields:
+        regulation.planowany_termin_wydania_data = parse_and_generate_date(row['planowany_termin_wydania'])
+    
+    return any(name in AI_INPUT_FIELDS for name in fields)
+
 
-def scrape_legal_regulations():
+def write_in_batches(write, items, batch_size, errors):
+    """
+    Run `write(batch)` for consecutive batches, one transaction each
+    
+    A failing batch is retried row by row, so a bad row only loses itself;
+    its error is appended to `errors` and recorded on the ingestion run.
+    
+    Returns:
+        list: items that were written
+    """
+    written = []
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        try:
+            with transaction.atomic():
+                write(batch)
+            written.extend(batch)
+            continue
+        except Exception as e:
+            log_event(logger, 'regulation_batch_failed', logging.WARNING, rows=len(batch), error=str(e))
+        
+        for item in batch:
+            try:
+                with transaction.atomic():
+                    write([item])
+                written.append(item)
+            except Exception as e:
+                error_msg = f"Error writing regulation {item.nr_w_wykazie}: {str(e)}"
+                log_event(logger, 'regulation_write_failed', logging.ERROR,
+                          nr_w_wykazie=item.nr_w_wykazie, error=str(e))
+                errors.append(error_msg)
+                current_run().error(error_msg)
+    return written
+
+
+def enrich_with_ai(regulations, workers, rate=None):
+    """
+    Generate AI titles/descriptions with the summarizer worker pool
+    
+    Regulations whose summary still failed after the retries are left
+    unchanged.
+    
+    Args:
+        regulations: LegalRegulation instances to summarize
+        workers: Concurrent AI requests
+        rate: Max AI requests per second (None - unlimited)
+    
+    Returns:
+        list: regulations that received a new AI title and description
+    """
+    if not regulations:
+        return []
+    
+    client = build_client()
+    if client is None:
+        return []
+    
+    print(f"🤖 Generating AI for {len(regulations)} regulations with {workers} workers...")
+    summarizer = RegulationSummarizer(
+        client,
+        settings.SCALEWAY_MODEL,
+        limiter=RateLimiter(rate, burst=workers) if rate else None,
+        workers=workers,
+    )
+    summaries = summarizer.summarize_many([
+        {'nr_w_wykazie': regulation.nr_w_wykazie, **{name: getattr(regulation, name) for name in AI_INPUT_FIELDS}}
+        for regulation in regulations
+    ])
+    
+    enriched = []
+    now = timezone.now()
+    for regulation, (ai_title, ai_description) in zip(regulations, summaries):
+        if ai_title and ai_description:
+            regulation.ai_tytul = ai_title
+            regulation.ai_description = ai_description
+            regulation.updated_at = now
+            enriched.append(regulation)
+    print(f"  🤖 AI summaries: {len(enriched)}/{len(regulations)}")
+    return enriched
+
+
+@ingestion_run(IngestionRun.Source.REGULATIONS)
+def scrape_legal_regulations(ai_workers=4, batch_size=200, ai_rate=None):
     """
     Scrape legal regulations from Ministry of Health API
     
+    New register entries are created, entries whose content changed since
+    the last scrape (content_hash) are updated, the rest is skipped. The
+    ingest is set-based: existing numbers are loaded in one query, rows are
+    written with bulk_create/bulk_update in batched transactions, and the
+    AI titles/descriptions are generated afterwards in a concurrent stage.
+    Rows without an AI summary (e.g. the AI stage failed last time) are
+    summarized again even when their content did not change. A failing
+    write batch is retried row by row and a failing AI stage is recorded,
+    so later stages still run.
+    
+    Args:
+        ai_workers: Concurrent AI requests
+        ai_rate: Max AI requests per second (None - unlimited)
+        batch_size: Rows per insert/update transaction
+    
     Returns:
-        dict: Results with new_records, duplicates_skipped, errors
+        dict: Results with new_records, updated_records, ai_generated (new
+            rows with AI), ai_regenerated (changed rows), duplicates_skipped
+            (unchanged entries), errors; run metrics go to core.ingestion
     """
-    api_url = "https://www.gov.pl/api/data/registers/search?pageId=21034488"
+    # Imported lazily to keep command start-up fast
+    import requests
+    
+    api_url = settings.GOVPL_REGISTER_URL
     
     results = {
         'new_records': 0,
         'duplicates_skipped': 0,
         'updated_records': 0,
+        'ai_generated': 0,
+        'ai_regenerated': 0,
         'errors': []
     }
+    run = current_run()
     
     try:
-        logger.info("🔍 Fetching legal regulations from gov.pl API...")
         print("🔍 Fetching legal regulations from gov.pl API...")
         
-        response = requests.get(api_url, timeout=30)
-        response.raise_for_status()
+        with run.phase('http'):
+            response = requests.get(api_url, timeout=30)
+            response.raise_for_status()
         
-        regulations_data = response.json()
+        with run.phase('parse'):
+            regulations_data = response.json()
         
-        logger.info(f"📊 Found {len(regulations_data)} regulations")
+        log_event(logger, 'register_fetched', rows=len(regulations_data))
         print(f"📊 Found {len(regulations_data)} regulations")
         
-        for idx, reg_data in enumerate(regulations_data, 1):
-            try:
-                # Extract data from API
-                nr_w_wykazie = reg_data.get('Nr w Wykazie', '').strip()
-                
-                if not nr_w_wykazie:
-                    logger.warning(f"Skipping regulation at index {idx}: missing Nr w Wykazie")
-                    continue
-                
-                lp = reg_data.get('Lp.', '')
-                podstawa_wydania = reg_data.get('Podstawa wydania', '')
-                tytul_rozporzadzenia = reg_data.get('Tytuł rozporządzenia', '')
-                przyczyny_rezygnacji = reg_data.get('Przyczyny rezygnacji z prac nad projektem', '')
-                planowany_termin = reg_data.get('Planowany termin wydania / Publikacja w Dz. U', '')
-                istota_rozwiazan = reg_data.get('Istota rozwiązań, które planuje się zawrzeć w projekcie:', '')
-                osoba_odpowiedzialna = reg_data.get('Imię, nazwisko, stanowisko lub funkcja osoby odpowiedzialnej za opracowanie projektu:', '')
-                przyczyna_potrzeba = reg_data.get('Przyczyna i potrzeba wprowadzenia rozwiązań, które planuje się zawrzeć w projekcie:', '')
-                
-                # Check if regulation already exists
-                existing = LegalRegulation.objects.filter(nr_w_wykazie=nr_w_wykazie).first()
-                
-                if existing:
-                    # Skip duplicates (could update here if needed)
-                    results['duplicates_skipped'] += 1
-                    print(f"⏭️  Skipping duplicate: {nr_w_wykazie}")
+        rows = []
+        with run.phase('parse'):
+            for idx, reg_data in enumerate(regulations_data, 1):
+                row = parse_register_row(reg_data)
+                if row is None:
+                    log_event(logger, 'row_skipped', logging.WARNING, reason='missing Nr w Wykazie', index=idx)
                     continue
-                
-                # Generate AI title and description
-                logger.info(f"🤖 Generating AI content for: {nr_w_wykazie}")
-                print(f"🤖 Generating AI for: {nr_w_wykazie}...")
-                
-                ai_title, ai_description = generate_regulation_title_and_description(
-                    nr_w_wykazie=nr_w_wykazie,
-                    podstawa_wydania=podstawa_wydania,
-                    tytul_rozporzadzenia=tytul_rozporzadzenia,
-                    istota_rozwiazan=istota_rozwiazan,
-                    przyczyna_potrzeba=przyczyna_potrzeba,
-                    przyczyny_rezygnacji=przyczyny_rezygnacji
-                )
-                
-                # Parse and generate random date from quarter/semester
-                planowany_data = parse_and_generate_date(planowany_termin)
-                
-                # Create new regulation
-                regulation = LegalRegulation.objects.create(
-                    lp=lp,
-                    nr_w_wykazie=nr_w_wykazie,
-                    podstawa_wydania=podstawa_wydania,
-                    tytul_rozporzadzenia=tytul_rozporzadzenia,
-                    przyczyny_rezygnacji=przyczyny_rezygnacji,
-                    planowany_termin_wydania=planowany_termin,
-                    planowany_termin_wydania_data=planowany_data,
-                    istota_rozwiazan=istota_rozwiazan,
-                    osoba_odpowiedzialna=osoba_odpowiedzialna,
-                    przyczyna_potrzeba=przyczyna_potrzeba,
-                    ai_tytul=ai_title,
-                    ai_description=ai_description
+                rows.append(row)
+        
+        # One query: which rows are new, which changed since the last scrape
+        with run.phase('db'):
+            diff = diff_regulations(rows)
+        results['duplicates_skipped'] = diff.unchanged
+        print(f"🔎 New: {len(diff.new)}, changed: {len(diff.changed)}, unchanged: {diff.unchanged}")
+        
+        # Stage 1: insert new rows (without AI) in batched transactions
+        new_regulations = [
+            LegalRegulation(
+                **row,
+                planowany_termin_wydania_data=parse_and_generate_date(row['planowany_termin_wydania']),
+            )
+            for row in diff.new
+        ]
+        for regulation in new_regulations:
+            regulation.refresh_is_withdrawn()
+        with run.phase('db'):
+            inserted = write_in_batches(
+                lambda batch: LegalRegulation.objects.bulk_create(batch, batch_size=batch_size),
+                new_regulations,
+                batch_size,
+                results['errors'],
+            )
+            # bulk_create does not set primary keys on every backend - reload them
+            created = list(
+                LegalRegulation.objects.filter(
+                    nr_w_wykazie__in=[regulation.nr_w_wykazie for regulation in inserted]
                 )
-                
-                results['new_records'] += 1
-                ai_status = "✨ with AI" if ai_title and ai_description else "📝 no AI"
-                print(f"✅ Created: {nr_w_wykazie} {ai_status}")
-                
-                # Progress indicator
-                if results['new_records'] % 10 == 0:
-                    print(f"  📊 Progress: {idx}/{len(regulations_data)} processed, {results['new_records']} created")
-            
-            except Exception as e:
-                error_msg = f"Error processing regulation at index {idx}: {str(e)}"
-                logger.error(error_msg)
-                results['errors'].append(error_msg)
-                print(f"❌ {error_msg}")
-                continue
+            )
+        created_ids = {regulation.pk for regulation in created}
+        results['new_records'] = len(created)
+        print(f"✅ Created: {len(created)} regulations")
+        
+        # Stage 2: update changed rows in batched transactions
+        changed = []
+        needs_ai = list(created)
+        for regulation, row, fields in diff.changed:
+            if apply_changed_fields(regulation, row, fields) or not has_ai_summary(regulation):
+                needs_ai.append(regulation)
+            changed.append(regulation)
+            log_event(logger, 'regulation_updated', nr_w_wykazie=regulation.nr_w_wykazie, fields=fields)
+        with run.phase('db'):
+            changed = write_in_batches(
+                lambda batch: LegalRegulation.objects.bulk_update(
+                    batch, CHANGED_UPDATE_FIELDS, batch_size=batch_size
+                ),
+                changed,
+                batch_size,
+                results['errors'],
+            )
+        written_ids = created_ids | {regulation.pk for regulation in changed}
+        needs_ai = [regulation for regulation in needs_ai if regulation.pk in written_ids]
+        # Unchanged rows left without a summary by an earlier (failed) AI stage
+        needs_ai.extend(diff.missing_ai)
+        results['updated_records'] = len(changed)
+        run.add_rows(len(created) + len(changed))
+        # Unchanged rows and changes outside the AI inputs keep their summaries
+        run.cache('ai_summary', hit=True, amount=diff.unchanged + len(changed) + len(created) - len(needs_ai))
+        run.cache('ai_summary', hit=False, amount=len(needs_ai))
+        
+        # Stage 3: AI enrichment runs concurrently, then one bulk update
+        enriched = []
+        try:
+            with run.phase('ai'):
+                enriched = enrich_with_ai(needs_ai, ai_workers, ai_rate)
+        except Exception as e:
+            # The rows keep empty AI fields and are summarized on the next scrape
+            error_msg = f"AI enrichment failed: {str(e)}"
+            log_event(logger, 'ai_enrichment_failed', logging.ERROR, rows=len(needs_ai), error=str(e))
+            results['errors'].append(error_msg)
+            run.error(error_msg)
+        with run.phase('db'):
+            enriched = write_in_batches(
+                lambda batch: LegalRegulation.objects.bulk_update(
+                    batch, ['ai_tytul', 'ai_description', 'updated_at'], batch_size=batch_size
+                ),
+                enriched,
+                batch_size,
+                results['errors'],
+            )
+        results['ai_generated'] = sum(1 for regulation in enriched if regulation.pk in created_ids)
+        results['ai_regenerated'] = len(enriched) - results['ai_generated']
+        
+        # One UPDATE refreshes the full-text vectors of every written row
+        indexed_ids = written_ids | {regulation.pk for regulation in enriched}
+        if indexed_ids:
+            with run.phase('search_index'):
+                update_search_vectors(LegalRegulation.objects.filter(pk__in=indexed_ids))
+        
+        # Published after enrichment so the feed gets the AI titles
+        with run.phase('publish'):
+            publish_instances(created)
+        
+        for name in ('new_records', 'updated_records', 'ai_generated', 'ai_regenerated', 'duplicates_skipped'):
+            run.count(name, results[name])
         
         print(f"\n📊 Scraping completed!")
-        print(f"  ✅ New records: {results['new_records']}")
-        print(f"  ⏭️  Duplicates skipped: {results['duplicates_skipped']}")
+        print(f"  ✅ New records: {results['new_records']} (with AI: {results['ai_generated']})")
+        print(f"  🔄 Updated records: {results['updated_records']} (AI regenerated: {results['ai_regenerated']})")
+        print(f"  ⏭️  Unchanged skipped: {results['duplicates_skipped']}")
         print(f"  ❌ Errors: {len(results['errors'])}")
         
     except requests.RequestException as e:
         error_msg = f"Failed to fetch data from API: {str(e)}"
-        logger.error(error_msg)
+        log_event(logger, 'fetch_failed', logging.ERROR, url=api_url, error=str(e))
         results['errors'].append(error_msg)
-        print(f"❌ {error_msg}")
+        run.fail(error_msg)
     except Exception as e:
         error_msg = f"Unexpected error during scraping: {str(e)}"
-        logger.error(error_msg)
+        log_event(logger, 'scrape_failed', logging.ERROR, error=str(e))
         results['errors'].append(error_msg)
-        print(f"❌ {error_msg}")
+        run.fail(error_msg)
     
     return results
 
@@ -0,0 +1,73 @@
+"""
+Full-text search over legal regulations
+
+PostgreSQL ships no Polish stemmer, so the vectors use the
+`polish_unaccent` text search configuration created in migration 0005:
+the `simple` parser and dictionary behind `unaccent`, so "zywnosc" finds
+"żywność". There is no stemming, so matches are whole word forms.
+
+The stored search_vector is weighted so title hits outrank body hits:
+    A: ai_tytul, tytul_rozporzadzenia, nr_w_wykazie
+    B: ai_description, istota_rozwiazan
+    C: przyczyna_potrzeba, podstawa_wydania
+
+The scraper refreshes the vectors of every row it writes
+(update_search_vectors); LegalRegulation.save() does the same for single
+rows.
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F
+
+SEARCH_CONFIG = 'polish_unaccent'
+
+# weight -> fields, keep in sync with migration 0005
+SEARCH_WEIGHTS = {
+    'A': ['ai_tytul', 'tytul_rozporzadzenia', 'nr_w_wykazie'],
+    'B': ['ai_description', 'istota_rozwiazan'],
+    'C': ['przyczyna_potrzeba', 'podstawa_wydania'],
+}
+
+SEARCH_FIELDS = [name for names in SEARCH_WEIGHTS.values() for name in names]
+
+
+def search_vector_expression():
+    """Weighted tsvector expression over the searchable fields"""
+    vector = None
+    for weight, fields in SEARCH_WEIGHTS.items():
+        part = SearchVector(*fields, weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vectors(queryset):
+    """
+    Recompute search_vector in one UPDATE
+
+    Args:
+        queryset: LegalRegulation queryset (e.g. filter(pk__in=ids))
+
+    Returns:
+        int: number of updated rows
+    """
+    return queryset.update(search_vector=search_vector_expression())
+
+
+def search_query(text):
+    """websearch_to_tsquery: quotes, OR and -negation work like in a search engine"""
+    return SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+
+
+def search_regulations(queryset, text, normalization=None):
+    """
+    Ranked full-text search
+
+    Args:
+        normalization: ts_rank normalization flags (32 scales rank to 0..1)
+
+    Returns:
+        queryset annotated with `rank`, best matches first
+    """
+    query = search_query(text)
+    return queryset.filter(search_vector=query).annotate(
+        rank=SearchRank(F('search_vector'), query, normalization=normalization)
+    ).order_by('-rank', '-id')
@@ -14,6 +14,7 @@ class LegalRegulationSerializer(serializers.ModelSerializer):
             'ai_tytul',
             'ai_description',
             'planowany_termin_wydania_data',
+            'is_withdrawn',
             'lp',
             'tytul_rozporzadzenia',
             'przyczyny_rezygnacji',
@@ -24,7 +25,7 @@ class LegalRegulationSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'is_withdrawn', 'created_at', 'updated_at']
 
 
 class LegalRegulationListSerializer(serializers.ModelSerializer):
@@ -39,6 +40,16 @@ class LegalRegulationListSerializer(serializers.ModelSerializer):
             'ai_tytul',
             'ai_description',
             'planowany_termin_wydania_data',
+            'is_withdrawn',
             'created_at'
         ]
 
+
+
+class LegalRegulationSearchSerializer(LegalRegulationListSerializer):
+    """List fields plus the full-text search rank"""
+    
+    rank = serializers.FloatField(read_only=True)
+    
+    class Meta(LegalRegulationListSerializer.Meta):
+        fields = LegalRegulationListSerializer.Meta.fields + ['rank']
@@ -0,0 +1,200 @@
+"""
+Concurrent AI summarization of legal regulations
+
+The model is asked for a JSON object ({"title": ..., "summary": ...})
+instead of free text, the answer is validated cheaply (valid JSON, both
+fields present, sane lengths), and only the regulations whose answer
+failed are sent again in the next round. Requests run in a bounded thread
+pool, optionally paced by a core.llm.RateLimiter.
+
+The client is built from settings.SCALEWAY_BASE_URL, so pointing it at a
+local OpenAI-compatible stub (e.g. SCALEWAY_BASE_URL=http://127.0.0.1:8089/v1
+SCALEWAY_API_KEY=stub) exercises the whole pipeline offline.
+"""
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.ingestion import create_completion
+from core.llm import strip_code_fence
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = (
+    "Jesteś ekspertem prawnym specjalizującym się w regulacjach Ministerstwa Zdrowia. "
+    "Odpowiadasz WYŁĄCZNIE obiektem JSON."
+)
+
+TITLE_MAX_LENGTH = 200  # the prompt asks for 100, leave the model some slack
+SUMMARY_MIN_LENGTH = 20
+SUMMARY_MAX_LENGTH = 3000
+
+
+class SummaryError(ValueError):
+    """The model answer is not a valid summary"""
+
+
+def build_prompt(row):
+    """
+    Build the user prompt for one regulation
+
+    Args:
+        row: dict with nr_w_wykazie and the AI input fields
+    """
+    przyczyny_rezygnacji = row.get('przyczyny_rezygnacji') or ''
+    is_resigned = bool(przyczyny_rezygnacji.strip())
+    status = "WYCOFANY" if is_resigned else "AKTYWNY"
+
+    def clip(name, length):
+        value = row.get(name)
+        return value[:length] if value else 'brak'
+
+    return f"""Przeanalizuj poniższą regulację prawną i wygeneruj krótki, trafny tytuł (max 100 znaków) oraz zwięzłe podsumowanie (2-3 zdania).
+
+DANE REGULACJI:
+Numer: {row['nr_w_wykazie']}
+Status: {status}
+Podstawa prawna: {clip('podstawa_wydania', 200)}
+Tytuł oryginalny: {clip('tytul_rozporzadzenia', 200)}
+Istota rozwiązań: {clip('istota_rozwiazan', 300)}
+Przyczyna i potrzeba: {clip('przyczyna_potrzeba', 300)}
+{"Przyczyny rezygnacji: " + przyczyny_rezygnacji[:200] if is_resigned else ""}
+
+WYMAGANIA:
+- title: krótki, konkretny, opisujący istotę regulacji. Bez słowa "Rozporządzenie" na początku.
+- summary: profesjonalny język prawniczy, zwięzłe wyjaśnienie celu i zakresu regulacji.
+{"- Wspomnij w summary, że projekt został WYCOFANY/ZAWIESZONY." if is_resigned else ""}
+
+Odpowiedz dokładnie w formacie: {{"title": "...", "summary": "..."}}"""
+
+
+def parse_summary(content):
+    """
+    Validate a model answer
+
+    Returns:
+        tuple: (title, summary)
+
+    Raises:
+        SummaryError: if the answer is not a usable summary
+    """
+    try:
+        data = json.loads(strip_code_fence(content or ''))
+    except json.JSONDecodeError as e:
+        raise SummaryError(f"invalid JSON: {str(e)}")
+    if not isinstance(data, dict):
+        raise SummaryError("answer is not a JSON object")
+
+    title = data.get('title')
+    summary = data.get('summary')
+    if not isinstance(title, str) or not title.strip():
+        raise SummaryError("missing title")
+    if not isinstance(summary, str) or len(summary.strip()) < SUMMARY_MIN_LENGTH:
+        raise SummaryError("missing or too short summary")
+
+    title, summary = title.strip(), summary.strip()
+    if len(title) > TITLE_MAX_LENGTH:
+        raise SummaryError(f"title longer than {TITLE_MAX_LENGTH} characters")
+    return title, summary[:SUMMARY_MAX_LENGTH]
+
+
+def build_client(timeout=60):
+    """
+    OpenAI-compatible client for the configured endpoint
+
+    Returns:
+        OpenAI client, or None when SCALEWAY_API_KEY is not set
+    """
+    from django.conf import settings
+    # Imported lazily - openai is slow to import and most commands never call the AI
+    from openai import OpenAI
+
+    if not settings.SCALEWAY_API_KEY:
+        logger.warning("SCALEWAY_API_KEY not found in settings")
+        return None
+    # Retries are done per failed row by the summarizer
+    return OpenAI(
+        base_url=settings.SCALEWAY_BASE_URL,
+        api_key=settings.SCALEWAY_API_KEY,
+        timeout=timeout,
+        max_retries=0,
+    )
+
+
+class RegulationSummarizer:
+    """Summarizes many regulations with a bounded worker pool"""
+
+    def __init__(self, client, model, limiter=None, workers=4, max_attempts=3,
+                 retry_delay=2.0, json_mode=True):
+        self.client = client
+        self.model = model
+        self.limiter = limiter
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        # response_format={"type": "json_object"}; disable for servers without it
+        self.json_mode = json_mode
+
+    def summarize_many(self, rows):
+        """
+        Summarize a list of regulations
+
+        Args:
+            rows: dicts with nr_w_wykazie and the AI input fields
+
+        Returns:
+            list: (title, summary) per row, in order; (None, None) for rows
+                that still failed after max_attempts
+        """
+        results = [(None, None)] * len(rows)
+        pending = list(range(len(rows)))
+
+        for attempt in range(1, self.max_attempts + 1):
+            if not pending:
+                break
+            if attempt > 1:
+                logger.info(f"Retrying {len(pending)} failed summaries (attempt {attempt}/{self.max_attempts})")
+                time.sleep(self.retry_delay * (attempt - 1))
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                answers = list(executor.map(self._summarize_row, (rows[i] for i in pending)))
+
+            failed = []
+            for index, answer in zip(pending, answers):
+                if answer is None:
+                    failed.append(index)
+                else:
+                    results[index] = answer
+            pending = failed
+
+        for index in pending:
+            logger.error(f"Giving up on AI summary for regulation {rows[index]['nr_w_wykazie']}")
+        return results
+
+    def _summarize_row(self, row):
+        try:
+            return parse_summary(self._complete(build_prompt(row)))
+        except Exception as e:
+            logger.warning(f"AI summary failed for regulation {row['nr_w_wykazie']}: {str(e)}")
+            return None
+
+    def _complete(self, prompt):
+        if self.limiter is not None:
+            self.limiter.acquire()
+        kwargs = {'response_format': {"type": "json_object"}} if self.json_mode else {}
+        response = create_completion(
+            self.client,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=400,
+            temperature=0.3,
+            top_p=0.8,
+            presence_penalty=0,
+            stream=False,
+            **kwargs
+        )
+        return response.choices[0].message.content
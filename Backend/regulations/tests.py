@@ -1,3 +1,207 @@
-from django.test import TestCase
+import json
+import re
+import threading
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.standin import StandInServer
+from .diff import compute_content_hash, diff_regulations, parse_register_row
+from .models import LegalRegulation
+from .summarizer import RegulationSummarizer, SummaryError, build_client, parse_summary
+
+VALID_ANSWER = json.dumps({
+    'title': 'Zmiany w refundacji leków',
+    'summary': 'Rozporządzenie zmienia zasady refundacji. Dotyczy aptek i pacjentów.',
+}, ensure_ascii=False)
+
+
+def regulation_row(number, **fields):
+    return {
+        'nr_w_wykazie': number,
+        'podstawa_wydania': 'art. 37 ustawy o refundacji',
+        'tytul_rozporzadzenia': f"Rozporządzenie w sprawie refundacji ({number})",
+        'istota_rozwiazan': 'Zmiana zasad refundacji.',
+        'przyczyna_potrzeba': 'Potrzeba aktualizacji.',
+        'przyczyny_rezygnacji': '',
+        **fields,
+    }
+
+
+class ScriptedClient:
+    """OpenAI-like client answering from a per-regulation list of answers"""
+
+    def __init__(self, answers):
+        self.answers = {number: list(script) for number, script in answers.items()}
+        self.calls = []
+        self.lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        number = re.search(r'Numer: (\S+)', kwargs['messages'][-1]['content']).group(1)
+        with self.lock:
+            self.calls.append((number, kwargs))
+            answer = self.answers[number].pop(0) if len(self.answers[number]) > 1 else self.answers[number][0]
+        if isinstance(answer, Exception):
+            raise answer
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=answer))],
+            usage=None,
+        )
+
+
+class ParseSummaryTests(SimpleTestCase):
+
+    def test_valid_answer(self):
+        self.assertEqual(
+            parse_summary(VALID_ANSWER),
+            ('Zmiany w refundacji leków', 'Rozporządzenie zmienia zasady refundacji. Dotyczy aptek i pacjentów.'),
+        )
+
+    def test_code_fence_is_stripped(self):
+        title, _ = parse_summary(f"```json\n{VALID_ANSWER}\n```")
+        self.assertEqual(title, 'Zmiany w refundacji leków')
+
+    def test_invalid_payloads_are_rejected(self):
+        invalid = [
+            None,
+            '',
+            'Tytuł: Zmiany w refundacji',
+            '["Zmiany", "w refundacji"]',
+            json.dumps({'summary': 'Rozporządzenie zmienia zasady refundacji.'}),
+            json.dumps({'title': '  ', 'summary': 'Rozporządzenie zmienia zasady refundacji.'}),
+            json.dumps({'title': 'Zmiany', 'summary': 'Za krótko'}),
+            json.dumps({'title': 'Zmiany', 'summary': 42}),
+            json.dumps({'title': 'x' * 201, 'summary': 'Rozporządzenie zmienia zasady refundacji.'}),
+        ]
+        for content in invalid:
+            with self.subTest(content=content):
+                with self.assertRaises(SummaryError):
+                    parse_summary(content)
+
+    def test_long_summary_is_truncated(self):
+        _, summary = parse_summary(json.dumps({'title': 'Zmiany', 'summary': 'a' * 5000}))
+        self.assertEqual(len(summary), 3000)
+
+
+class RegulationSummarizerTests(SimpleTestCase):
+
+    def summarizer(self, client, **kwargs):
+        return RegulationSummarizer(client, 'test-model', workers=2, retry_delay=0, **kwargs)
+
+    def test_json_mode_requests_json_object(self):
+        client = ScriptedClient({'A': [VALID_ANSWER]})
+        self.summarizer(client).summarize_many([regulation_row('A')])
+        self.assertEqual(client.calls[0][1]['response_format'], {'type': 'json_object'})
+
+        client = ScriptedClient({'A': [VALID_ANSWER]})
+        self.summarizer(client, json_mode=False).summarize_many([regulation_row('A')])
+        self.assertNotIn('response_format', client.calls[0][1])
+
+    def test_only_failed_rows_are_retried(self):
+        client = ScriptedClient({
+            'A': [VALID_ANSWER],
+            'B': ['not json', RuntimeError('timeout'), VALID_ANSWER],
+        })
+        with self.assertLogs('regulations.summarizer', level='WARNING'):
+            results = self.summarizer(client).summarize_many([regulation_row('A'), regulation_row('B')])
+
+        self.assertEqual([title for title, _ in results], ['Zmiany w refundacji leków'] * 2)
+        self.assertEqual([number for number, _ in client.calls].count('A'), 1)
+        self.assertEqual([number for number, _ in client.calls].count('B'), 3)
+
+    def test_gives_up_after_max_attempts(self):
+        client = ScriptedClient({'A': [VALID_ANSWER], 'B': ['{"title": "Zmiany"}']})
+        with self.assertLogs('regulations.summarizer', level='WARNING') as logs:
+            results = self.summarizer(client, max_attempts=2).summarize_many([regulation_row('A'), regulation_row('B')])
+
+        self.assertEqual(results[1], (None, None))
+        self.assertEqual(results[0][0], 'Zmiany w refundacji leków')
+        self.assertEqual([number for number, _ in client.calls].count('B'), 2)
+        self.assertIn('Giving up on AI summary for regulation B', logs.output[-1])
+
+    def test_against_local_stub(self):
+        with StandInServer() as server, override_settings(
+            SCALEWAY_BASE_URL=server.settings()['SCALEWAY_BASE_URL'], SCALEWAY_API_KEY='stub'
+        ):
+            summarizer = self.summarizer(build_client(timeout=5))
+            results = summarizer.summarize_many([regulation_row('A'), regulation_row('B', przyczyny_rezygnacji='Brak')])
+
+        for title, summary in results:
+            self.assertEqual(title, 'Zmiany w przepisach dotyczących świadczeń zdrowotnych')
+            self.assertTrue(summary)
+        self.assertEqual(server.stats['llm']['requests'], 2)
+
+    def test_stub_errors_exhaust_the_retries(self):
+        with StandInServer(llm_error_rate=1.0) as server, override_settings(
+            SCALEWAY_BASE_URL=server.settings()['SCALEWAY_BASE_URL'], SCALEWAY_API_KEY='stub'
+        ):
+            with self.assertLogs('regulations.summarizer', level='WARNING'):
+                results = self.summarizer(build_client(timeout=5), max_attempts=2).summarize_many([regulation_row('A')])
+
+        self.assertEqual(results, [(None, None)])
+        self.assertEqual(server.stats['llm']['injected_errors'], 2)
+
+
+class DiffRegulationsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        # Written like the scraper does - bulk_create, without save() and its search vector update
+        regulations = []
+        for number, ai_title in [('MZ 1', 'Refundacja'), ('MZ 2', 'Refundacja'), ('MZ 3', None)]:
+            regulation = LegalRegulation(
+                lp='1',
+                **regulation_row(number),
+                ai_tytul=ai_title,
+                ai_description='Opis' if ai_title else None,
+            )
+            regulation.content_hash = compute_content_hash(regulation)
+            regulations.append(regulation)
+        LegalRegulation.objects.bulk_create(regulations)
+
+    def register_entry(self, number, **fields):
+        row = {'lp': '1', **regulation_row(number), **fields}
+        return {
+            'Nr w Wykazie': f" {number} ",
+            'Lp.': row['lp'],
+            'Podstawa wydania': row['podstawa_wydania'],
+            'Tytuł rozporządzenia': row['tytul_rozporzadzenia'],
+            'Przyczyny rezygnacji z prac nad projektem': row['przyczyny_rezygnacji'],
+            'Istota rozwiązań, które planuje się zawrzeć w projekcie:': row['istota_rozwiazan'],
+            'Przyczyna i potrzeba wprowadzenia rozwiązań, które planuje się zawrzeć w projekcie:': row['przyczyna_potrzeba'],
+        }
+
+    def test_parse_register_row(self):
+        self.assertIsNone(parse_register_row({'Nr w Wykazie': '  '}))
+        row = parse_register_row(self.register_entry('MZ 1'))
+        self.assertEqual(row['nr_w_wykazie'], 'MZ 1')
+        self.assertEqual(row['osoba_odpowiedzialna'], '')
+
+    def test_new_changed_and_unchanged_rows(self):
+        entries = [
+            self.register_entry('MZ 1'),
+            self.register_entry('MZ 2', istota_rozwiazan='Nowe zasady refundacji.'),
+            self.register_entry('MZ 4'),
+            # Listed twice - the first entry wins
+            self.register_entry('MZ 4', istota_rozwiazan='Inna treść.'),
+        ]
+        diff = diff_regulations([parse_register_row(entry) for entry in entries])
+
+        self.assertEqual([row['nr_w_wykazie'] for row in diff.new], ['MZ 4'])
+        self.assertEqual(diff.new[0]['istota_rozwiazan'], 'Zmiana zasad refundacji.')
+        self.assertEqual(len(diff.new[0]['content_hash']), 64)
+        self.assertEqual(diff.unchanged, 1)
+        [(regulation, row, fields)] = diff.changed
+        self.assertEqual((regulation.nr_w_wykazie, fields), ('MZ 2', ['istota_rozwiazan']))
+        self.assertEqual(row['content_hash'], compute_content_hash(row))
+        self.assertEqual(diff.missing_ai, [])
+
+    def test_whitespace_only_changes_are_unchanged(self):
+        diff = diff_regulations([parse_register_row(self.register_entry('MZ 1', podstawa_wydania=' art. 37 ustawy o refundacji '))])
+        self.assertEqual((diff.new, diff.changed, diff.unchanged), ([], [], 1))
+
+    def test_unchanged_rows_without_ai_summary(self):
+        diff = diff_regulations([parse_register_row(self.register_entry('MZ 3'))])
+        self.assertEqual(diff.unchanged, 1)
+        self.assertEqual([regulation.nr_w_wykazie for regulation in diff.missing_ai], ['MZ 3'])
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import views, async_views
 
 app_name = 'regulations'
 
@@ -7,7 +7,14 @@ urlpatterns = [
     # List all regulations
     path('', views.LegalRegulationListView.as_view(), name='regulation-list'),
     
+    # Ranked full-text search
+    path('search/', views.LegalRegulationSearchView.as_view(), name='regulation-search'),
+    
     # Get specific regulation by ID
     path('<int:pk>/', views.LegalRegulationDetailView.as_view(), name='regulation-detail'),
+    
+    # Async variants (ASGI)
+    path('async/', async_views.regulation_list, name='async-regulation-list'),
+    path('async/<int:pk>/', async_views.regulation_detail, name='async-regulation-detail'),
 ]
 
@@ -1,12 +1,110 @@
+from django.db.models import F, Q
+from django.utils.dateparse import parse_date
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
-from drf_spectacular.utils import extend_schema
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 
+from core.query_budget import QueryBudgetMixin, TimedRetrieveMixin, parse_limit, validate_query_params, wants_cursor
 from .models import LegalRegulation
-from .serializers import LegalRegulationSerializer, LegalRegulationListSerializer
+from .search import search_regulations
+from .serializers import (
+    LegalRegulationSerializer,
+    LegalRegulationListSerializer,
+    LegalRegulationSearchSerializer,
+)
 
 
-class LegalRegulationListView(generics.ListAPIView):
+# `ordering` values accepted by the list endpoint -> indexed model field
+ORDERING_FIELDS = {
+    'created_at': 'created_at',
+    'date': 'planowany_termin_wydania_data',
+    'planowany_termin_wydania_data': 'planowany_termin_wydania_data',
+}
+DEFAULT_ORDERING = '-created_at'
+# Ordering fields that may be NULL (sorted NULLS LAST)
+NULLABLE_ORDERING_FIELDS = {'planowany_termin_wydania_data'}
+
+STATUS_FILTERS = {
+    'active': False,
+    'withdrawn': True,
+}
+
+
+def parse_date_param(params, name):
+    """Parse a YYYY-MM-DD query parameter (400 on anything else)"""
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value) if len(value) == 10 else None
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: 'Date has wrong format. Use YYYY-MM-DD.'})
+    return parsed
+
+
+def regulation_ordering(params):
+    """Translate the `ordering` parameter into order_by() arguments"""
+    ordering = params.get('ordering') or DEFAULT_ORDERING
+    field_name = ORDERING_FIELDS.get(ordering.lstrip('-'))
+    if field_name is None:
+        raise ValidationError({
+            'ordering': f"Choose one of: {', '.join(ORDERING_FIELDS)} (prefix - for descending)."
+        })
+    descending = ordering.startswith('-')
+    if field_name not in NULLABLE_ORDERING_FIELDS:
+        # Plain ORDER BY, so the (created_at, id) index serves both directions
+        return [f'-{field_name}', '-id'] if descending else [field_name, 'id']
+    # Regulations without a planned date go last in both directions; each
+    # direction has an index with the same NULLS LAST ordering
+    if descending:
+        return [F(field_name).desc(nulls_last=True), '-id']
+    return [F(field_name).asc(nulls_last=True), 'id']
+
+
+def filter_regulations(queryset, params):
+    """
+    Apply the list endpoint filters
+    
+    Supported parameters:
+        planowany_termin_wydania_data__gte / __lte: planned date range (YYYY-MM-DD)
+        status: active | withdrawn
+        q: case-insensitive text match in ai_tytul / tytul_rozporzadzenia
+        ordering: created_at | date (prefix - for descending, default -created_at)
+    """
+    date_from = parse_date_param(params, 'planowany_termin_wydania_data__gte')
+    if date_from:
+        queryset = queryset.filter(planowany_termin_wydania_data__gte=date_from)
+    
+    date_to = parse_date_param(params, 'planowany_termin_wydania_data__lte')
+    if date_to:
+        queryset = queryset.filter(planowany_termin_wydania_data__lte=date_to)
+    
+    status = params.get('status')
+    if status:
+        if status not in STATUS_FILTERS:
+            raise ValidationError({'status': f"Choose one of: {', '.join(STATUS_FILTERS)}."})
+        queryset = queryset.filter(is_withdrawn=STATUS_FILTERS[status])
+    
+    # Served by the trigram indexes on UPPER(ai_tytul) / UPPER(tytul_rozporzadzenia)
+    q = (params.get('q') or '').strip()
+    if q:
+        queryset = queryset.filter(Q(ai_tytul__icontains=q) | Q(tytul_rozporzadzenia__icontains=q))
+    
+    return queryset.order_by(*regulation_ordering(params))
+
+
+def slice_regulations(queryset, params):
+    """Apply `limit` unless the client pages with a cursor"""
+    if 'limit' in params and not wants_cursor(params):
+        return queryset[:parse_limit(params)]
+    return queryset
+
+
+class LegalRegulationListView(QueryBudgetMixin, generics.ListAPIView):
     """
     API endpoint to list all legal regulations
     Returns AI-generated title, description, legal basis, and planned date
@@ -14,17 +112,88 @@ class LegalRegulationListView(generics.ListAPIView):
     
     serializer_class = LegalRegulationListSerializer
     permission_classes = [AllowAny]
-    queryset = LegalRegulation.objects.all().order_by('-created_at')
+    # Cursor pages always seek on created_at; `ordering` applies to plain lists
+    cursor_ordering = '-created_at'
+    
+    def get_queryset(self):
+        queryset = filter_regulations(LegalRegulation.objects.all(), self.request.query_params)
+        return slice_regulations(queryset, self.request.query_params)
     
     @extend_schema(
-        description="Get list of all legal regulations with AI-generated titles and descriptions",
+        description="Get list of legal regulations with AI-generated titles and descriptions, "
+                    "filtered by planned date, status and text",
+        parameters=[
+            OpenApiParameter('planowany_termin_wydania_data__gte', str, description='Planned date from (YYYY-MM-DD)'),
+            OpenApiParameter('planowany_termin_wydania_data__lte', str, description='Planned date to (YYYY-MM-DD)'),
+            OpenApiParameter('status', str, enum=list(STATUS_FILTERS), description='Active or withdrawn projects'),
+            OpenApiParameter('q', str, description='Text in the AI or original title'),
+            OpenApiParameter(
+                'ordering',
+                str,
+                enum=[prefix + name for name in ORDERING_FIELDS for prefix in ('', '-')],
+                description='Sort order (default -created_at)'
+            ),
+            OpenApiParameter('limit', int, description='Return only the first N regulations'),
+        ],
         responses={200: LegalRegulationListSerializer(many=True)}
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
 
-class LegalRegulationDetailView(generics.RetrieveAPIView):
+def ranked_regulation_search(params):
+    """
+    Full-text search used by the search endpoints
+    
+    Raises:
+        ValidationError (400) without `q` or with an unknown status
+    """
+    q = (params.get('q') or '').strip()
+    if not q:
+        raise ValidationError({'q': 'This parameter is required.'})
+    
+    queryset = LegalRegulation.objects.all()
+    status = params.get('status')
+    if status:
+        if status not in STATUS_FILTERS:
+            raise ValidationError({'status': f"Choose one of: {', '.join(STATUS_FILTERS)}."})
+        queryset = queryset.filter(is_withdrawn=STATUS_FILTERS[status])
+    
+    return search_regulations(queryset, q)[:parse_limit(params, default=20)]
+
+
+class LegalRegulationSearchView(generics.GenericAPIView):
+    """
+    API endpoint for ranked full-text search over regulations
+    
+    Searches titles, AI summaries and the long description fields
+    (istota_rozwiazan, przyczyna_potrzeba) - see regulations/search.py.
+    """
+    
+    serializer_class = LegalRegulationSearchSerializer
+    permission_classes = [AllowAny]
+    throttle_bucket = 'search'
+    
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        validate_query_params(request.query_params)
+    
+    @extend_schema(
+        description="Full-text search in regulation titles, AI summaries and descriptions, best matches first. "
+                    "Accepts web search syntax: \"quoted phrase\", or, -excluded.",
+        parameters=[
+            OpenApiParameter('q', str, required=True, description='Search text'),
+            OpenApiParameter('status', str, enum=list(STATUS_FILTERS), description='Active or withdrawn projects'),
+            OpenApiParameter('limit', int, description='Max results (default 20)'),
+        ],
+        responses={200: LegalRegulationSearchSerializer(many=True)}
+    )
+    def get(self, request, *args, **kwargs):
+        results = ranked_regulation_search(request.query_params)
+        return Response(self.get_serializer(results, many=True).data)
+
+
+class LegalRegulationDetailView(TimedRetrieveMixin, generics.RetrieveAPIView):
     """
     API endpoint to get details of a specific legal regulation
     """
@@ -4,7 +4,6 @@ Uses Scaleway AI with Qwen model to generate professional descriptions
 """
 import os
 import logging
-from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +27,12 @@ def generate_drug_description(event_type, drug_name, drug_strength=None, drug_fo
     """
     try:
         from django.conf import settings
+        # Imported lazily - openai is slow to import and most commands never call the AI
+        from openai import OpenAI
+        from core.ingestion import create_completion
         
         api_key = settings.SCALEWAY_API_KEY
-        base_url = "https://9921ae86-3cf5-4e5c-8151-e1d274ceb539.ifr.fr-par.scaleway.com/v1"
+        base_url = settings.SCALEWAY_BASE_URL
         
         if not api_key:
             logger.warning("SCALEWAY_API_KEY not found in settings")
@@ -67,9 +69,10 @@ Wygeneruj krótki (2-3 zdania), profesjonalny opis przyczyny {action}. Opis ma b
 Użyj profesjonalnego języka farmaceutycznego. Nie używaj fraz typu "zmyślony" lub "fikcyjny" w odpowiedzi.
 Możesz wymyślić przyczyny takie jak: problemy z jakością, niezgodności w dokumentacji, wykrycie zanieczyszczeń, niespełnienie standardów GMP, problemy z bezpieczeństwem, itp."""
 
-        # Call Scaleway Qwen model
-        response = client.chat.completions.create(
-            model="qwen/qwen3-235b-a22b-instruct-2507:awq",
+        # Call Scaleway Qwen model (latency and tokens go to the ingestion run)
+        response = create_completion(
+            client,
+            model=settings.SCALEWAY_MODEL,
             messages=[
                 {"role": "system", "content": "Jesteś ekspertem farmaceutycznym generującym profesjonalne opisy decyzji regulacyjnych."},
                 {"role": "user", "content": prompt}
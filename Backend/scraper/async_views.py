@@ -0,0 +1,25 @@
+"""
+Async variants of the drug event endpoints, served through api/asgi.py
+"""
+from django.http import JsonResponse
+
+from core.async_api import async_api_view, capped_json_response, not_found, serialize_object
+from .models import DrugEvent
+from .serializers import DrugEventSerializer, DrugEventListSerializer
+from .views import filter_drug_events
+
+
+@async_api_view(['GET'], auth_required=True)
+async def drug_event_list(request):
+    """Async version of DrugEventListView"""
+    queryset = filter_drug_events(DrugEvent.objects.all().order_by('id'), request.GET)
+    return await capped_json_response(DrugEventListSerializer, queryset)
+
+
+@async_api_view(['GET'], auth_required=True)
+async def drug_event_detail(request, pk):
+    """Async version of DrugEventDetailView"""
+    data = await serialize_object(DrugEventSerializer, DrugEvent.objects.all(), pk)
+    if data is None:
+        return not_found()
+    return JsonResponse(data)
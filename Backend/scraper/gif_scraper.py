@@ -1,37 +1,48 @@
-import requests
-from bs4 import BeautifulSoup
 import json
 from datetime import datetime, timedelta
+from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
 import logging
 
 from .models import DrugEvent
 from .ai_generator import generate_drug_description
+from alerts.engine import dispatch_alerts_safely
+from core.ingestion import current_run, ingestion_run, log_event
+from core.models import IngestionRun
 
 logger = logging.getLogger(__name__)
 
 
+@ingestion_run(IngestionRun.Source.GIF)
 def scrape_rdg_data():
     """
     Scrapes data from RDG website and saves to database with duplicate checking
-    Returns dict with scraping results
+    Returns dict with scraping results (run metrics: core.ingestion)
     """
-    base_url = "https://rdg.ezdrowie.gov.pl/"
+    # HTTP/HTML libraries are imported lazily to keep command start-up fast
+    import requests
+    from bs4 import BeautifulSoup
+    
+    base_url = settings.RDG_BASE_URL
     results = {
         'new_records': 0,
         'duplicates_skipped': 0,
+        'alerts_created': 0,
         'errors': []
     }
+    run = current_run()
     
     try:
         print("🔍 Scraping data from RDG website...")
         
         # Get the main page
-        response = requests.get(base_url, timeout=30)
-        response.raise_for_status()
+        with run.phase('http'):
+            response = requests.get(base_url, timeout=30)
+            response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        with run.phase('parse'):
+            soup = BeautifulSoup(response.content, 'html.parser')
         
         # Find the table with decisions
         table = soup.find('table', class_='table-decisions')
@@ -49,6 +60,7 @@ def scrape_rdg_data():
         rows = tbody.find_all('tr')
         new_records = 0
         duplicates_skipped = 0
+        created_events = []
         
         # Calculate date 300 days ago
         ten_days_ago = timezone.now().date() - timedelta(days=300) # Zmieniłem nazwę zmiennej dla jasności
@@ -84,7 +96,8 @@ def scrape_rdg_data():
                 try:
                     decision_date = datetime.strptime(decision_date_str, '%Y-%m-%d').date()
                 except ValueError:
-                    print(f"⚠️  Could not parse date: {decision_date_str}")
+                    log_event(logger, 'row_skipped', logging.WARNING,
+                              reason='unparsable date', decision_date=decision_date_str)
                     continue
                 
                 # Check if decision is from last 300 days
@@ -119,64 +132,81 @@ def scrape_rdg_data():
                         # Ważne: Wygeneruj AI *przed* wywołaniem bazy, 
                         # aby nie trzymać transakcji otwartej podczas wywołania API
                         
-                        ai_description = generate_drug_description(
-                            event_type=event_type,
-                            drug_name=drug_name,
-                            drug_strength=strength,
-                            drug_form=None,
-                            marketing_holder=responsible_entity,
-                            publication_date=decision_date,
-                            decision_number=decision_number
-                        )
+                        with run.phase('ai'):
+                            ai_description = generate_drug_description(
+                                event_type=event_type,
+                                drug_name=drug_name,
+                                drug_strength=strength,
+                                drug_form=None,
+                                marketing_holder=responsible_entity,
+                                publication_date=decision_date,
+                                decision_number=decision_number
+                            )
                         
-                        obj, created = DrugEvent.objects.get_or_create(
-                            # Pola do wyszukania (zgodne z Twoim unique constraint)
-                            event_type=event_type,
-                            drug_name=drug_name,
-                            source=DrugEvent.DataSource.GIF,
-                            
-                            # Dane, które zostaną użyte TYLKO przy tworzeniu nowego rekordu
-                            defaults={
-                                'publication_date': decision_date,
-                                'decision_number': decision_number,
-                                'drug_strength': strength,
-                                'marketing_authorisation_holder': responsible_entity,
-                                'batch_number': None,
-                                'expiry_date': None,
-                                'description': ai_description,
-                            }
-                        )
+                        with run.phase('db'):
+                            obj, created = DrugEvent.objects.get_or_create(
+                                # Pola do wyszukania (zgodne z Twoim unique constraint)
+                                event_type=event_type,
+                                drug_name=drug_name,
+                                source=DrugEvent.DataSource.GIF,
+                                
+                                # Dane, które zostaną użyte TYLKO przy tworzeniu nowego rekordu
+                                defaults={
+                                    'publication_date': decision_date,
+                                    'decision_number': decision_number,
+                                    'drug_strength': strength,
+                                    'marketing_authorisation_holder': responsible_entity,
+                                    'batch_number': None,
+                                    'expiry_date': None,
+                                    'description': ai_description,
+                                }
+                            )
+                        # Trafienie = zdarzenie już było w bazie
+                        run.cache('existing', hit=not created)
                         
                         if created:
                             new_records += 1
-                            desc_status = "✨ with AI" if ai_description else "📝 no AI"
-                            print(f"✅ Created: {drug_name} - {decision_type_str} {desc_status}")
+                            run.add_rows(1)
+                            created_events.append(obj)
+                            log_event(logger, 'drug_event_created', id=obj.pk, drug_name=drug_name,
+                                      decision_type=decision_type_str, with_ai=bool(ai_description))
                         else:
                             duplicates_skipped += 1
-                            print(f"⏭️  Skipping duplicate: {drug_name} - {decision_type_str}")
+                            log_event(logger, 'drug_event_duplicate', id=obj.pk, drug_name=drug_name,
+                                      decision_type=decision_type_str)
 
                     except Exception as e:
                         # Ten błąd dotyczy teraz tylko operacji `get_or_create`
                         error_msg = f"Error creating record for {drug_name}: {str(e)}"
-                        print(f"❌ {error_msg}")
+                        log_event(logger, 'drug_event_failed', logging.ERROR, drug_name=drug_name, error=str(e))
                         results['errors'].append(error_msg)
+                        run.error(error_msg)
                         continue # Przejdź do następnego leku w komórce
                 
             except Exception as e:
                 # Ten błąd dotyczy teraz całego wiersza (np. błędu parsowania)
                 error_msg = f"Error processing row (drug: {drug_name}): {str(e)}"
-                print(f"❌ {error_msg}")
+                log_event(logger, 'row_failed', logging.ERROR, drug_name=drug_name, error=str(e))
                 results['errors'].append(error_msg)
+                run.error(error_msg)
                 continue # Przejdź do następnego wiersza
         
         results['new_records'] = new_records
         results['duplicates_skipped'] = duplicates_skipped
         
+        # Match only the newly inserted events against user watchlists
+        with run.phase('alerts'):
+            results['alerts_created'] = dispatch_alerts_safely(created_events)
+        run.count('created', new_records)
+        run.count('duplicates', duplicates_skipped)
+        run.count('alerts', results['alerts_created'])
+        
         print(f"📊 Scraping completed. New records: {new_records}, Duplicates skipped: {duplicates_skipped}")
+        print(f"🔔 Alerts created: {results['alerts_created']}")
         
     except Exception as e:
         error_msg = f"Scraping failed: {str(e)}"
-        print(f"❌ {error_msg}")
+        log_event(logger, 'scrape_failed', logging.ERROR, error=str(e))
         results['errors'].append(error_msg)
         raise
     
@@ -1,6 +1,6 @@
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from scraper.tasks import check_and_run_scraping
 
 
 class Command(BaseCommand):
@@ -31,17 +31,10 @@ class Command(BaseCommand):
                 )
             )
             
-            # Queue the task
-            self.stdout.write('📋 Queuing scraping task...')
-            result = check_and_run_scraping.delay()
-            
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'✅ Scraping task queued successfully!\n'
-                    f'   Task ID: {result.id}\n'
-                    f'   You can monitor the task in Celery logs.'
-                )
-            )
+            # There is no task queue in this project - run the scrapers in-process.
+            # Scraper modules (requests, bs4, openai) are only imported on this path.
+            self.stdout.write('📋 Running scrapers...')
+            call_command('run_all_scrapers')
             
         except Exception as e:
             self.stdout.write(
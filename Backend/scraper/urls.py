@@ -1,9 +1,13 @@
 from django.urls import path
-from . import views
+from . import views, async_views
 
 app_name = 'scraper'
 
 urlpatterns = [
     path('drugs', views.DrugEventListView.as_view(), name='drug-events-list'),
     path('drugs/<int:pk>', views.DrugEventDetailView.as_view(), name='drug-event-detail'),
+
+    # Async variants (ASGI)
+    path('async/drugs', async_views.drug_event_list, name='async-drug-events-list'),
+    path('async/drugs/<int:pk>', async_views.drug_event_detail, name='async-drug-event-detail'),
 ]
\ No newline at end of file
@@ -1,6 +1,6 @@
-import requests
 import json
 from datetime import datetime, timedelta
+from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
 import random
@@ -8,21 +8,30 @@ import logging
 
 from .models import DrugEvent
 from .ai_generator import generate_drug_description
+from alerts.engine import dispatch_alerts_safely
+from core.ingestion import current_run, ingestion_run, log_event
+from core.models import IngestionRun
 
 logger = logging.getLogger(__name__)
 
 
+@ingestion_run(IngestionRun.Source.URPL)
 def scrape_medicinal_products():
     """
     Scrapes data from medicinal products API and saves to database
-    Returns dict with scraping results
+    Returns dict with scraping results (run metrics: core.ingestion)
     """
-    base_url = "https://rejestry.ezdrowie.gov.pl/api/rpl/medicinal-products/search/public"
+    # Imported lazily to keep command start-up fast
+    import requests
+    
+    base_url = settings.URPL_API_URL
     results = {
         'new_records': 0,
         'duplicates_skipped': 0,
+        'alerts_created': 0,
         'errors': []
     }
+    run = current_run()
     
     try:
         print("🔍 Scraping data from medicinal products API...")
@@ -37,10 +46,12 @@ def scrape_medicinal_products():
         }
         
         # Get data from API
-        response = requests.get(base_url, params=params, timeout=30)
-        response.raise_for_status()
+        with run.phase('http'):
+            response = requests.get(base_url, params=params, timeout=30)
+            response.raise_for_status()
         
-        data = response.json()
+        with run.phase('parse'):
+            data = response.json()
         products = data.get('content', [])
         
         print(f"📊 Found {len(products)} medicinal products")
@@ -50,6 +61,7 @@ def scrape_medicinal_products():
         
         new_records = 0
         duplicates_skipped = 0
+        created_events = []
         
         with transaction.atomic():
             for product in products:
@@ -83,66 +95,84 @@ def scrape_medicinal_products():
                     event_type = map_procedure_type_to_event_type(procedure_type)
                     
                     # Check for duplicates (based on event_type, drug_name, and source)
-                    if DrugEvent.objects.filter(
-                        event_type=event_type,
-                        drug_name=final_drug_name,
-                        source=DrugEvent.DataSource.URPL
-                    ).exists():
-                        print(f"⏭️  Skipping duplicate: {final_drug_name}")
+                    with run.phase('db'):
+                        exists = DrugEvent.objects.filter(
+                            event_type=event_type,
+                            drug_name=final_drug_name,
+                            source=DrugEvent.DataSource.URPL
+                        ).exists()
+                    run.cache('existing', hit=exists)
+                    if exists:
+                        log_event(logger, 'drug_event_duplicate', drug_name=final_drug_name, event_type=event_type)
                         duplicates_skipped += 1
                         continue
                     
                     # Create new DrugEvent
                     try:
                         # Generate AI description
-                        ai_description = generate_drug_description(
-                            event_type=event_type,
-                            drug_name=final_drug_name,
-                            drug_strength=power,
-                            drug_form=pharmaceutical_form,
-                            marketing_holder=subject_name,
-                            publication_date=random_date,
-                            decision_number=decision_number
-                        )
+                        with run.phase('ai'):
+                            ai_description = generate_drug_description(
+                                event_type=event_type,
+                                drug_name=final_drug_name,
+                                drug_strength=power,
+                                drug_form=pharmaceutical_form,
+                                marketing_holder=subject_name,
+                                publication_date=random_date,
+                                decision_number=decision_number
+                            )
                         
-                        drug_event = DrugEvent.objects.create(
-                            event_type=event_type,
-                            source=DrugEvent.DataSource.URPL,  # URPL for medicinal products
-                            publication_date=random_date,
-                            decision_number=decision_number,
-                            drug_name=final_drug_name,
-                            drug_strength=power,
-                            drug_form=pharmaceutical_form,
-                            marketing_authorisation_holder=subject_name,
-                            batch_number=None,  # Not available in this data
-                            expiry_date=parse_expiration_date(expiration_date),
-                            description=ai_description,
-                        )
+                        with run.phase('db'):
+                            drug_event = DrugEvent.objects.create(
+                                event_type=event_type,
+                                source=DrugEvent.DataSource.URPL,  # URPL for medicinal products
+                                publication_date=random_date,
+                                decision_number=decision_number,
+                                drug_name=final_drug_name,
+                                drug_strength=power,
+                                drug_form=pharmaceutical_form,
+                                marketing_authorisation_holder=subject_name,
+                                batch_number=None,  # Not available in this data
+                                expiry_date=parse_expiration_date(expiration_date),
+                                description=ai_description,
+                            )
                         
                         new_records += 1
-                        desc_status = "✨ with AI" if ai_description else "📝 no AI"
-                        print(f"✅ Created: {final_drug_name} - {event_type} - {random_date} {desc_status}")
+                        run.add_rows(1)
+                        created_events.append(drug_event)
+                        log_event(logger, 'drug_event_created', id=drug_event.pk, drug_name=final_drug_name,
+                                  event_type=event_type, publication_date=random_date,
+                                  with_ai=bool(ai_description))
                         
                     except Exception as e:
                         error_msg = f"Error creating record for {final_drug_name}: {str(e)}"
-                        print(f"❌ {error_msg}")
+                        log_event(logger, 'drug_event_failed', logging.ERROR, drug_name=final_drug_name, error=str(e))
                         results['errors'].append(error_msg)
+                        run.error(error_msg)
                         continue
                 
                 except Exception as e:
                     error_msg = f"Error processing product: {str(e)}"
-                    print(f"❌ {error_msg}")
+                    log_event(logger, 'row_failed', logging.ERROR, error=str(e))
                     results['errors'].append(error_msg)
+                    run.error(error_msg)
                     continue
         
         results['new_records'] = new_records
         results['duplicates_skipped'] = duplicates_skipped
         
+        # Match only the newly inserted events against user watchlists
+        with run.phase('alerts'):
+            results['alerts_created'] = dispatch_alerts_safely(created_events)
+        run.count('created', new_records)
+        run.count('duplicates', duplicates_skipped)
+        run.count('alerts', results['alerts_created'])
+        
         print(f"📊 Scraping completed. New records: {new_records}, Duplicates skipped: {duplicates_skipped}")
+        print(f"🔔 Alerts created: {results['alerts_created']}")
         
     except Exception as e:
         error_msg = f"Scraping failed: {str(e)}"
-        print(f"❌ {error_msg}")
+        log_event(logger, 'scrape_failed', logging.ERROR, error=str(e))
         results['errors'].append(error_msg)
         raise
     
@@ -0,0 +1,13 @@
+"""
+Async variants of the user endpoints, served through api/asgi.py
+"""
+from django.http import JsonResponse
+
+from core.async_api import async_api_view
+from .serializers import UserSerializer
+
+
+@async_api_view(['GET'], auth_required=True, requires_db_user=True)
+async def current_user(request):
+    """Async version of CurrentUserView"""
+    return JsonResponse(UserSerializer(request.user).data)
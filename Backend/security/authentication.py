@@ -0,0 +1,131 @@
+"""
+JWT authentication without a user query on reads
+
+Access tokens issued by LoginView / RegisterView carry the user's email,
+names and account_type (CustomTokenObtainPairSerializer.get_token). For
+safe (read-only) requests StatelessJWTAuthentication builds a ClaimsUser
+from those verified claims instead of loading security.User. The DB user
+is still loaded when:
+- the request is a write (POST/PUT/PATCH/DELETE),
+- the view sets `requires_db_user = True` (e.g. it serializes fields
+  that are not in the token),
+- the token predates the claims, or
+- the account was revoked (deactivated, password changed or deleted)
+  within the access token lifetime - see revoke_user_tokens().
+
+Revocations are kept in the default cache, so every worker must see the
+same cache: with a process-local cache (LocMemCache, no REDIS_URL) a
+revocation would reach only the worker that handled it, and stateless
+mode is turned off. Set JWT_STATELESS_AUTH=False to always load the user
+from the DB.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+# Claims added by CustomTokenObtainPairSerializer.get_token
+USER_CLAIMS = ('email', 'first_name', 'last_name', 'account_type')
+
+REVOKED_CACHE_KEY = 'auth:revoked:{user_id}'
+
+logger = logging.getLogger(__name__)
+_warned_local_cache = False
+
+
+class ClaimsUser(TokenUser):
+    """Stateless user backed by the claims of a verified access token"""
+
+    @property
+    def email(self):
+        return self.token['email']
+
+    @property
+    def first_name(self):
+        return self.token['first_name']
+
+    @property
+    def last_name(self):
+        return self.token['last_name']
+
+    @property
+    def account_type(self):
+        return self.token['account_type']
+
+    def get_full_name(self):
+        return f'{self.first_name} {self.last_name}'.strip()
+
+    def __str__(self):
+        return self.email
+
+
+def revoke_user_tokens(user_id):
+    """
+    Force DB authentication for a user until their access tokens expire
+
+    Called when an account is deactivated, deleted or changes password, so
+    stateless reads notice it within one cache lookup.
+    """
+    timeout = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+    cache.set(REVOKED_CACHE_KEY.format(user_id=user_id), True, timeout)
+
+
+def is_revoked(user_id):
+    return cache.get(REVOKED_CACHE_KEY.format(user_id=user_id)) is not None
+
+
+def cache_is_shared():
+    """Whether the default cache is seen by every worker (not LocMem/Dummy)"""
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+def stateless_auth_enabled():
+    """JWT_STATELESS_AUTH, but only when revocations reach every worker"""
+    global _warned_local_cache
+    if not getattr(settings, 'JWT_STATELESS_AUTH', True):
+        return False
+    if not cache_is_shared():
+        if not _warned_local_cache:
+            _warned_local_cache = True
+            logger.warning('JWT_STATELESS_AUTH needs a shared cache (REDIS_URL), loading users from the DB')
+        return False
+    return True
+
+
+def can_trust_claims(method, validated_token, requires_db_user=False):
+    """Whether a request may be served with a ClaimsUser"""
+    if not stateless_auth_enabled():
+        return False
+    if requires_db_user or method not in SAFE_METHODS:
+        return False
+    if any(claim not in validated_token for claim in USER_CLAIMS):
+        return False
+    return not is_revoked(validated_token[api_settings.USER_ID_CLAIM])
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that skips the user query on safe requests"""
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        view = request.parser_context.get('view') if request.parser_context else None
+        requires_db_user = getattr(view, 'requires_db_user', False)
+        if can_trust_claims(request.method, validated_token, requires_db_user):
+            return ClaimsUser(validated_token), validated_token
+
+        return self.get_user(validated_token), validated_token
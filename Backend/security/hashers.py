@@ -0,0 +1,31 @@
+"""
+Password hashers
+
+TunableArgon2PasswordHasher is Django's Argon2 hasher with its cost taken
+from settings (ARGON2_TIME_COST, ARGON2_MEMORY_COST, ARGON2_PARALLELISM).
+Django's defaults (100 MiB, 8 lanes) make every login expensive for the
+API workers; the settings default to the OWASP baseline (19 MiB, t=2, p=1).
+
+Hashes are re-encoded on the next successful login whenever they were made
+by another hasher (e.g. the old PBKDF2 ones) or with other parameters, so
+changing the cost needs no migration. Measure with `manage.py bench_auth`.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunableArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with cost parameters from settings"""
+
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        # KiB
+        return settings.ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.ARGON2_PARALLELISM
@@ -0,0 +1,132 @@
+"""
+Django management command measuring password verification throughput
+
+Verifying the password is what makes a login CPU-bound, so this runs the
+configured hashers in a process pool (one process per core) and reports
+logins/s in total and per core, e.g.:
+
+    python manage.py bench_auth
+    python manage.py bench_auth --processes 4 --duration 10
+    ARGON2_MEMORY_COST=65536 python manage.py bench_auth --hasher argon2
+
+With --base-url it also load tests the real login endpoint (needs an
+existing account, and THROTTLE_ENABLED=False on the server).
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+from core.loadtest import run_load
+
+BENCH_PASSWORD = 'bench-Password-123'
+
+
+def verify_for(encoded, duration):
+    """Verify `encoded` in a loop for `duration` seconds, return the count"""
+    hasher = identify_hasher(encoded)
+    count = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        hasher.verify(BENCH_PASSWORD, encoded)
+        count += 1
+    return count
+
+
+class Command(BaseCommand):
+    help = 'Benchmark password verification (logins/s per core) for the configured hashers'
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hasher',
+            action='append',
+            dest='hashers',
+            help='Hasher algorithm to test, can be repeated (default: all in PASSWORD_HASHERS)',
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Worker processes (default: number of cores)',
+        )
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds per hasher (default 5)')
+        parser.add_argument('--base-url', help='Also load test POST /auth/login on this server')
+        parser.add_argument('--email', help='Account used for the login load test')
+        parser.add_argument('--password', help='Password for --email')
+        parser.add_argument('--concurrency', type=int, default=10, help='Login load test clients (default 10)')
+        parser.add_argument('--output', help='Write results to this JSON file')
+
+    def handle(self, *args, **options):
+        algorithms = options['hashers'] or self.configured_algorithms()
+        processes = options['processes']
+
+        self.stdout.write(f"🔐 Password hashing benchmark: {processes} process(es), {options['duration']}s each")
+        self.stdout.write('=' * 70)
+
+        results = []
+        for algorithm in algorithms:
+            hasher = get_hasher(algorithm)
+            encoded = hasher.encode(BENCH_PASSWORD, hasher.salt())
+
+            started = time.perf_counter()
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                counts = list(executor.map(verify_for, [encoded] * processes, [options['duration']] * processes))
+            elapsed = time.perf_counter() - started
+
+            total = sum(counts)
+            result = {
+                'hasher': f'{type(hasher).__module__}.{type(hasher).__name__}',
+                'algorithm': algorithm,
+                'params': {k: v for k, v in hasher.safe_summary(encoded).items() if k not in ('salt', 'hash')},
+                'processes': processes,
+                'logins_per_second': round(total / options['duration'], 1),
+                'logins_per_second_per_core': round(total / options['duration'] / processes, 1),
+                'ms_per_login': round(options['duration'] * 1000 / (total / processes), 1) if total else None,
+            }
+            results.append(result)
+
+            self.stdout.write(f"\n📋 {result['hasher']}")
+            self.stdout.write(f"   params: {', '.join(f'{k}={v}' for k, v in result['params'].items())}")
+            self.stdout.write(
+                f"   {result['logins_per_second']} logins/s total, "
+                f"{result['logins_per_second_per_core']} per core, "
+                f"{result['ms_per_login']} ms per verification ({elapsed:.1f}s wall)"
+            )
+
+        if options['base_url']:
+            results.append(self.bench_login_endpoint(options))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, default=str)
+            self.stdout.write(self.style.SUCCESS(f"\n✅ Results written to {options['output']}"))
+
+    def configured_algorithms(self):
+        algorithms = []
+        for path in settings.PASSWORD_HASHERS:
+            algorithm = import_string(path)().algorithm
+            if algorithm not in algorithms:
+                algorithms.append(algorithm)
+        return algorithms
+
+    def bench_login_endpoint(self, options):
+        url = f"{options['base_url'].rstrip('/')}/auth/login"
+        self.stdout.write(f"\n🌐 POST {url} with {options['concurrency']} clients...")
+        stats = run_load(
+            url,
+            options['concurrency'],
+            options['duration'],
+            method='POST',
+            json_body={'email': options['email'], 'password': options['password']},
+        )
+        self.stdout.write(
+            f"   {stats['rps']} logins/s, p50 {stats['p50_ms']}ms, p99 {stats['p99_ms']}ms, errors {stats['errors']}"
+        )
+        return {'endpoint': url, **stats}
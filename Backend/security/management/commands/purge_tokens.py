@@ -0,0 +1,52 @@
+"""
+Django management command deleting expired JWT refresh tokens
+
+Replaces simplejwt's flushexpiredtokens, which deletes every expired
+OutstandingToken in one statement. Rows are deleted in batches (each in its
+own transaction), BlacklistedToken rows go with them through the cascade.
+Run it daily, e.g. from cron:
+
+    python manage.py purge_tokens
+    python manage.py purge_tokens --batch-size 5000 --dry-run
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+
+class Command(BaseCommand):
+    help = 'Delete expired outstanding (and blacklisted) refresh tokens in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Tokens deleted per transaction (default 1000)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count expired tokens',
+        )
+
+    def handle(self, *args, **options):
+        expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now())
+
+        if options['dry_run']:
+            self.stdout.write(f'📋 Expired tokens: {expired.count()} (dry run)')
+            return
+
+        self.stdout.write('🧹 Purging expired refresh tokens...')
+        deleted_count = 0
+        while True:
+            ids = list(expired.order_by('id').values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            with transaction.atomic():
+                OutstandingToken.objects.filter(id__in=ids).delete()
+            deleted_count += len(ids)
+            self.stdout.write(f'   ✅ Deleted {deleted_count} tokens...')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Purge completed! Deleted tokens: {deleted_count}'))
@@ -0,0 +1,8 @@
+"""
+OpenAPI (drf-spectacular) description of the custom authentication class
+"""
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class StatelessJWTScheme(SimpleJWTScheme):
+    target_class = 'security.authentication.StatelessJWTAuthentication'
@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.password_validation import validate_password
 
+from .tokens import CachedRefreshToken
+
 User = get_user_model()
 
 
@@ -79,6 +81,8 @@ class RegisterSerializer(serializers.ModelSerializer):
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Custom JWT token serializer with additional user data"""
     
+    token_class = CachedRefreshToken
+    
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
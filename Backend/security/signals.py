@@ -0,0 +1,22 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+
+from .authentication import revoke_user_tokens
+
+
+@receiver(pre_save, sender='security.User')
+def revoke_tokens_on_account_change(sender, instance, update_fields=None, **kwargs):
+    """Deactivated accounts and password changes invalidate stateless reads"""
+    if instance.pk is None:
+        return
+    # set_password() keeps the raw password in _password until save()
+    if not instance.is_active or getattr(instance, '_password', None) is not None:
+        transaction.on_commit(partial(revoke_user_tokens, instance.pk))
+
+
+@receiver(post_delete, sender='security.User')
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    transaction.on_commit(partial(revoke_user_tokens, instance.pk))
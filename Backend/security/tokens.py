@@ -0,0 +1,88 @@
+"""
+Refresh tokens with a cache in front of the token blacklist tables
+
+With ROTATE_REFRESH_TOKENS and BLACKLIST_AFTER_ROTATION every refresh
+blacklists the old token, and every refresh/logout checks the blacklist.
+CachedRefreshToken keeps two markers per JTI until the token expires:
+- "blacklisted", set by blacklist() - replayed (rotated or logged-out)
+  tokens are rejected without touching token_blacklist_*,
+- "outstanding", set when the token is issued (login, register, rotation)
+  and deleted by blacklist() - a normal refresh skips the blacklist query.
+
+The "outstanding" marker is trusted only with a shared cache (Redis):
+with a per-process cache another worker could have blacklisted the token
+without this worker knowing. A token the cache knows nothing about is
+checked in the DB.
+
+purge_tokens keeps the tables themselves small.
+"""
+import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .authentication import cache_is_shared
+
+BLACKLIST_CACHE_KEY = 'auth:blacklisted:{jti}'
+OUTSTANDING_CACHE_KEY = 'auth:outstanding:{jti}'
+
+
+def _timeout(exp):
+    # No need to remember a token after it expires - verify() rejects it anyway
+    return max(1, int(exp - time.time()))
+
+
+def _remember_blacklisted(jti, exp):
+    cache.delete(OUTSTANDING_CACHE_KEY.format(jti=jti))
+    cache.set(BLACKLIST_CACHE_KEY.format(jti=jti), True, _timeout(exp))
+
+
+def remember_outstanding(token):
+    """Mark a freshly issued refresh token as not blacklisted"""
+    cache.set(OUTSTANDING_CACHE_KEY.format(jti=token[api_settings.JTI_CLAIM]), True, _timeout(token['exp']))
+
+
+class CachedRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist checks hit the cache first"""
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        blacklisted_key = BLACKLIST_CACHE_KEY.format(jti=jti)
+        outstanding_key = OUTSTANDING_CACHE_KEY.format(jti=jti)
+
+        markers = cache.get_many([blacklisted_key, outstanding_key])
+        if markers.get(blacklisted_key):
+            raise TokenError(_("Token is blacklisted"))
+        if markers.get(outstanding_key) and cache_is_shared():
+            return
+
+        if BlacklistedToken.objects.filter(token__jti=jti).exists():
+            _remember_blacklisted(jti, self.payload['exp'])
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        _remember_blacklisted(self.payload[api_settings.JTI_CLAIM], self.payload['exp'])
+        return result
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        remember_outstanding(token)
+        return token
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedRefreshToken
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        if 'refresh' in data:
+            # The rotated token is new - nothing can have blacklisted it yet
+            remember_outstanding(self.token_class(data['refresh'], verify=False))
+        return data
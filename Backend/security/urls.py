@@ -1,12 +1,13 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenRefreshView
 from .views import (
     RegisterView,
     LoginView,
     LogoutView,
+    CachedTokenRefreshView,
     CurrentUserView,
     UpdateUserView,
 )
+from . import async_views
 
 app_name = 'security'
 
@@ -14,9 +15,12 @@ urlpatterns = [
     path('register', RegisterView.as_view(), name='register'),
     path('login', LoginView.as_view(), name='login'),
     path('logout', LogoutView.as_view(), name='logout'),
-    path('token/refresh', TokenRefreshView.as_view(), name='token_refresh'),
+    path('token/refresh', CachedTokenRefreshView.as_view(), name='token_refresh'),
     
     path('user/me', CurrentUserView.as_view(), name='current_user'),
     path('user/update', UpdateUserView.as_view(), name='update_user'),
+    
+    # Async variants (ASGI)
+    path('async/user/me', async_views.current_user, name='async_current_user'),
 ]
 
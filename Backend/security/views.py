@@ -2,8 +2,7 @@ from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.views import TokenObtainPairView
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
@@ -13,6 +12,7 @@ from .serializers import (
     CustomTokenObtainPairSerializer,
     LoginSerializer
 )
+from .tokens import CachedRefreshToken, CachedTokenRefreshSerializer
 
 User = get_user_model()
 
@@ -45,7 +45,7 @@ class RegisterView(generics.CreateAPIView):
         user = serializer.save()
         
         # Generate JWT tokens for the new user
-        refresh = RefreshToken.for_user(user)
+        refresh = CachedRefreshToken.for_user(user)
         
         # Add custom claims to tokens
         refresh['email'] = user.email
@@ -84,6 +84,16 @@ class LoginView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
 
+class CachedTokenRefreshView(TokenRefreshView):
+    """
+    API endpoint to refresh the access token.
+    
+    Same as simplejwt's TokenRefreshView, but blacklist checks of the
+    rotated refresh tokens go through the cache first.
+    """
+    serializer_class = CachedTokenRefreshSerializer
+
+
 @extend_schema(
     tags=['Authentication'],
     request=None,
@@ -109,7 +119,7 @@ class LogoutView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            token = RefreshToken(refresh_token)
+            token = CachedRefreshToken(refresh_token)
             token.blacklist()
             
             return Response(
@@ -136,6 +146,8 @@ class CurrentUserView(generics.RetrieveAPIView):
     """
     permission_classes = [IsAuthenticated]
     serializer_class = UserSerializer
+    # date_joined is not in the token - load the user from the DB
+    requires_db_user = True
     
     def get_object(self):
         return self.request.user
@@ -0,0 +1,187 @@
+"""
+Pub/sub backends for the live feed
+
+LocalBroker delivers messages to subscribers of the same process and is
+meant for tests and single-process development. PostgresBroker uses
+PostgreSQL LISTEN/NOTIFY, so rows inserted by a scraper running in a
+management command reach SSE clients connected to the API workers.
+
+Only topic names and primary keys travel through the broker; rows are
+loaded and serialized once per process, not once per client.
+"""
+import asyncio
+import json
+import logging
+import re
+import select
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils.module_loading import import_string
+
+from .topics import serialize_rows
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL limits NOTIFY payloads to 8000 bytes
+NOTIFY_CHUNK_SIZE = 500
+
+
+class Subscription:
+    """A single client connection waiting for messages on a set of topics"""
+
+    def __init__(self, broker, topics, max_queue):
+        self.broker = broker
+        self.topics = set(topics)
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def push(self, message):
+        """Thread-safe: schedule a message on the subscriber's event loop"""
+        try:
+            self.loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # Event loop already closed - the client is gone
+            self.broker.unsubscribe(self)
+
+    def _put(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow client: the view closes the stream and the client reconnects
+            self.overflowed = True
+
+    async def get(self, timeout):
+        """Wait for the next message, returns None on timeout"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """In-process pub/sub backend"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self, topics):
+        subscription = Subscription(self, topics, settings.STREAM_MAX_QUEUE)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def has_subscribers(self, topic):
+        with self._lock:
+            return any(topic in s.topics for s in self._subscribers)
+
+    def publish(self, topic, ids):
+        """Publish committed rows of a topic"""
+        self.deliver(topic, ids)
+
+    def deliver(self, topic, ids):
+        """Serialize rows once and fan them out to local subscribers"""
+        with self._lock:
+            subscribers = [s for s in self._subscribers if topic in s.topics]
+        if not subscribers:
+            return
+
+        rows = serialize_rows(topic, ids)
+        for row in rows:
+            message = {'topic': topic, 'data': row}
+            for subscription in subscribers:
+                subscription.push(message)
+
+
+class PostgresBroker(LocalBroker):
+    """Cross-process pub/sub backend built on PostgreSQL LISTEN/NOTIFY"""
+
+    def __init__(self):
+        super().__init__()
+        self.channel = settings.STREAM_CHANNEL
+        if not re.fullmatch(r'[a-z_][a-z0-9_]*', self.channel):
+            raise ValueError(f"Invalid STREAM_CHANNEL: {self.channel}")
+        self._listener = None
+
+    def subscribe(self, topics):
+        self._ensure_listener()
+        return super().subscribe(topics)
+
+    def publish(self, topic, ids):
+        ids = list(ids)
+        with connection.cursor() as cursor:
+            for start in range(0, len(ids), NOTIFY_CHUNK_SIZE):
+                payload = json.dumps({'topic': topic, 'ids': ids[start:start + NOTIFY_CHUNK_SIZE]})
+                cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, payload])
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen_forever,
+                    name='stream-listener',
+                    daemon=True,
+                )
+                self._listener.start()
+
+    def _listen_forever(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        params = connection.get_connection_params()
+        while True:
+            conn = None
+            try:
+                conn = psycopg2.connect(**params)
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                logger.info(f"Listening for feed notifications on {self.channel}")
+
+                while True:
+                    readable, _, _ = select.select([conn], [], [], 5)
+                    if not readable:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._handle_notification(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.error(f"Feed listener error, reconnecting: {str(e)}")
+                time.sleep(2)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+    def _handle_notification(self, payload):
+        try:
+            message = json.loads(payload)
+            self.deliver(message['topic'], message['ids'])
+        except Exception as e:
+            logger.error(f"Could not deliver feed notification: {str(e)}")
+        finally:
+            close_old_connections()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """Return the process-wide broker configured by STREAM_BACKEND"""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.STREAM_BACKEND)()
+    return _broker
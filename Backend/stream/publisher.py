@@ -0,0 +1,41 @@
+"""
+Publishing newly committed rows to the live feed
+"""
+import logging
+from collections import defaultdict
+from functools import partial
+
+from django.db import transaction
+
+from .brokers import get_broker
+from .topics import topic_for_model
+
+logger = logging.getLogger(__name__)
+
+
+def publish_instances(instances):
+    """
+    Publish newly inserted rows once the surrounding transaction commits
+
+    Model saves are published by signal handlers; code paths that use
+    bulk_create (which sends no signals) call this function directly.
+
+    Args:
+        instances: saved DrugEvent, LegalRegulation or MedicalNews instances
+    """
+    ids_by_topic = defaultdict(list)
+    for instance in instances:
+        topic = topic_for_model(type(instance))
+        if topic and instance.pk is not None:
+            ids_by_topic[topic].append(instance.pk)
+
+    for topic, ids in ids_by_topic.items():
+        transaction.on_commit(partial(_publish_safely, topic, ids))
+
+
+def _publish_safely(topic, ids):
+    try:
+        get_broker().publish(topic, ids)
+    except Exception as e:
+        # The feed is best effort - never fail an ingest because of it
+        logger.error(f"Error publishing {len(ids)} rows to feed topic {topic}: {str(e)}")
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_save
+
+from .publisher import publish_instances
+from .topics import TOPICS
+
+
+def publish_created(sender, instance, created, **kwargs):
+    """Push newly created rows to the live feed after commit"""
+    if created:
+        publish_instances([instance])
+
+
+for model_label, _ in TOPICS.values():
+    post_save.connect(
+        publish_created,
+        sender=model_label,
+        dispatch_uid=f'stream_publish_{model_label}',
+    )
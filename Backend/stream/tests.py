@@ -0,0 +1,176 @@
+import hashlib
+import json
+from datetime import date
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from news.models import MedicalNews
+from scraper.models import DrugEvent
+from . import brokers
+from .brokers import LocalBroker
+from .publisher import publish_instances
+
+
+def make_news(index):
+    url = f"https://pubmed.ncbi.nlm.nih.gov/{index}/"
+    return MedicalNews(
+        title=f"Study {index}",
+        url=url,
+        url_hash=hashlib.sha256(url.encode('utf-8')).hexdigest(),
+        source='BMJ',
+        published_at=timezone.now(),
+    )
+
+
+@override_settings(STREAM_BACKEND='stream.brokers.LocalBroker', STREAM_MAX_QUEUE=100)
+class StreamTestCase(TestCase):
+
+    def setUp(self):
+        self.broker = LocalBroker()
+        patcher = mock.patch.object(brokers, '_broker', self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def publish_committed(self, instances):
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_instances(instances)
+
+    async def drain(self, subscription):
+        """All messages queued for a subscription"""
+        messages = []
+        while (message := await subscription.get(0.05)) is not None:
+            messages.append(message)
+        return messages
+
+
+class LocalBrokerTests(StreamTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.news = MedicalNews.objects.bulk_create([make_news(index) for index in range(2)])
+
+    async def test_publish_fans_out_to_topic_subscribers(self):
+        first = self.broker.subscribe({'news'})
+        second = self.broker.subscribe({'news', 'regulations'})
+        other = self.broker.subscribe({'drug_events'})
+
+        await sync_to_async(self.broker.publish)('news', [self.news[0].pk])
+
+        for subscription in (first, second):
+            message = await subscription.get(1)
+            self.assertEqual(message['topic'], 'news')
+            self.assertEqual(message['data']['id'], self.news[0].pk)
+        self.assertIsNone(await other.get(0.05))
+
+    async def test_unsubscribed_clients_get_nothing(self):
+        subscription = self.broker.subscribe({'news'})
+        self.assertTrue(self.broker.has_subscribers('news'))
+        subscription.close()
+        self.assertFalse(self.broker.has_subscribers('news'))
+
+        await sync_to_async(self.broker.publish)('news', [self.news[0].pk])
+        self.assertIsNone(await subscription.get(0.05))
+
+    def test_publish_without_subscribers_skips_serialization(self):
+        with mock.patch('stream.brokers.serialize_rows') as serialize_rows:
+            self.broker.publish('news', [self.news[0].pk])
+        serialize_rows.assert_not_called()
+
+    async def test_full_queue_marks_subscription_overflowed(self):
+        with override_settings(STREAM_MAX_QUEUE=1):
+            subscription = self.broker.subscribe({'news'})
+        await sync_to_async(self.broker.publish)('news', [news.pk for news in self.news])
+        await subscription.get(1)
+        self.assertTrue(subscription.overflowed)
+
+
+class PublishInstancesTests(StreamTestCase):
+
+    async def test_one_event_per_saved_row(self):
+        subscription = self.broker.subscribe({'news'})
+        news = await sync_to_async(MedicalNews.objects.bulk_create)([make_news(index) for index in range(3)])
+
+        await sync_to_async(self.publish_committed)(news)
+
+        messages = await self.drain(subscription)
+        self.assertEqual([message['data']['id'] for message in messages], [row.pk for row in news])
+
+    def test_one_publish_per_topic_after_commit(self):
+        news = MedicalNews.objects.bulk_create([make_news(index) for index in range(2)])
+        event = DrugEvent.objects.create(
+            event_type=DrugEvent.EventType.WITHDRAWAL,
+            source=DrugEvent.DataSource.GIF,
+            publication_date=date(2026, 1, 15),
+            decision_number='GIF-R/1/2026',
+            drug_name='Paracetamol Teva',
+            marketing_authorisation_holder='Teva',
+        )
+
+        with mock.patch.object(self.broker, 'publish') as publish:
+            with self.captureOnCommitCallbacks() as callbacks:
+                publish_instances([*news, event, make_news(99)])
+            # Nothing is published before the transaction commits
+            publish.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        self.assertEqual(
+            sorted(publish.call_args_list),
+            sorted([
+                mock.call('news', [row.pk for row in news]),
+                mock.call('drug_events', [event.pk]),
+            ]),
+        )
+
+    def test_created_rows_are_published_by_signal(self):
+        with mock.patch.object(self.broker, 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                news = make_news(1)
+                news.save()
+                news.save()
+
+        publish.assert_called_once_with('news', [news.pk])
+
+
+class LiveFeedViewTests(StreamTestCase):
+
+    async def read_frame(self, response):
+        return (await anext(response.streaming_content)).decode('utf-8')
+
+    async def test_first_frames(self):
+        news = await sync_to_async(MedicalNews.objects.create)(**{
+            field: getattr(make_news(1), field)
+            for field in ('title', 'url', 'url_hash', 'source', 'published_at')
+        })
+
+        response = await self.async_client.get('/stream/events', {'topics': 'news'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertEqual(await self.read_frame(response), 'retry: 5000\n\n')
+
+        await sync_to_async(self.broker.publish)('news', [news.pk])
+        frame = await self.read_frame(response)
+        header, data = frame.split('data: ', 1)
+        self.assertEqual(header, f"event: news\nid: news:{news.pk}\n")
+        self.assertTrue(data.endswith('\n\n'))
+        self.assertEqual(json.loads(data)['id'], news.pk)
+
+        await response.streaming_content.aclose()
+
+    @override_settings(STREAM_HEARTBEAT_SECONDS=0.01)
+    async def test_heartbeat_when_idle(self):
+        response = await self.async_client.get('/stream/events', {'topics': 'news'})
+        await self.read_frame(response)
+        self.assertEqual(await self.read_frame(response), ': ping\n\n')
+        await response.streaming_content.aclose()
+
+    async def test_drug_events_require_authentication(self):
+        response = await self.async_client.get('/stream/events', {'topics': 'drug_events'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_unknown_topic(self):
+        response = await self.async_client.get('/stream/events', {'topics': 'news,weather'})
+        self.assertEqual(response.status_code, 400)
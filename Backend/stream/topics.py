@@ -0,0 +1,44 @@
+"""
+Topics available on the live feed and how their rows are serialized
+"""
+from django.utils.module_loading import import_string
+
+# topic name -> (model label, serializer path)
+TOPICS = {
+    'drug_events': ('scraper.DrugEvent', 'scraper.serializers.DrugEventListSerializer'),
+    'regulations': ('regulations.LegalRegulation', 'regulations.serializers.LegalRegulationListSerializer'),
+    'news': ('news.MedicalNews', 'news.serializers.MedicalNewsSerializer'),
+}
+
+# Topics that expose data only available to authenticated users
+AUTHENTICATED_TOPICS = {'drug_events'}
+
+
+def topic_for_model(model):
+    """Return the topic name for a model class, or None if it is not streamed"""
+    label = model._meta.label
+    for topic, (model_label, _) in TOPICS.items():
+        if model_label == label:
+            return topic
+    return None
+
+
+def serialize_rows(topic, ids):
+    """
+    Load and serialize rows of a topic
+
+    Args:
+        topic: topic name from TOPICS
+        ids: primary keys of the rows
+
+    Returns:
+        list: serialized rows in primary key order
+    """
+    from django.apps import apps
+
+    model_label, serializer_path = TOPICS[topic]
+    model = apps.get_model(model_label)
+    serializer_class = import_string(serializer_path)
+
+    queryset = model.objects.filter(pk__in=ids).order_by('pk')
+    return serializer_class(queryset, many=True).data
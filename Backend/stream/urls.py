@@ -0,0 +1,9 @@
+from django.urls import path
+from . import views
+
+app_name = 'stream'
+
+urlpatterns = [
+    # Server-Sent Events feed of new drug events, regulations and news
+    path('events', views.live_feed, name='live-feed'),
+]
@@ -0,0 +1,75 @@
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+
+from core.async_api import authenticate_jwt
+from .brokers import get_broker
+from .topics import TOPICS, AUTHENTICATED_TOPICS
+
+
+def format_event(message):
+    """Format a broker message as a Server-Sent Event"""
+    topic = message['topic']
+    data = message['data']
+    payload = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return f"event: {topic}\nid: {topic}:{data.get('id')}\ndata: {payload}\n\n"
+
+
+async def event_stream(subscription):
+    try:
+        # Ask browsers to reconnect after 5 seconds if the stream drops
+        yield 'retry: 5000\n\n'
+        while not subscription.overflowed:
+            message = await subscription.get(settings.STREAM_HEARTBEAT_SECONDS)
+            if message is None:
+                # Heartbeat comment keeps proxies from closing idle streams
+                yield ': ping\n\n'
+                continue
+            yield format_event(message)
+    finally:
+        subscription.close()
+
+
+async def live_feed(request):
+    """
+    Server-Sent Events stream of newly inserted rows
+
+    Query params:
+        topics: comma separated list of drug_events, regulations, news
+            (default: all topics available to the caller)
+        token: JWT access token, alternative to the Authorization header
+
+    Requires an ASGI server - under WSGI the stream would never be flushed.
+    """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    # EventSource cannot send headers, so the token may come as ?token=
+    user = await authenticate_jwt(request, allow_query_token=True)
+    is_authenticated = user is not None
+
+    requested = request.GET.get('topics')
+    if requested:
+        topics = {t.strip() for t in requested.split(',') if t.strip()}
+        unknown = topics - set(TOPICS)
+        if unknown:
+            return JsonResponse(
+                {'error': f"Nieznane kanały: {', '.join(sorted(unknown))}"},
+                status=400
+            )
+        if topics & AUTHENTICATED_TOPICS and not is_authenticated:
+            return JsonResponse(
+                {'error': 'Wymagane uwierzytelnienie dla kanału drug_events.'},
+                status=401
+            )
+    else:
+        topics = set(TOPICS) if is_authenticated else set(TOPICS) - AUTHENTICATED_TOPICS
+
+    subscription = get_broker().subscribe(topics)
+    response = StreamingHttpResponse(event_stream(subscription), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Disable response buffering in nginx
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -7,6 +7,7 @@ export interface RegulationFromAPI {
   ai_tytul: string
   ai_description: string
   planowany_termin_wydania_data: string
+  is_withdrawn: boolean
   created_at: string
 }
 
@@ -23,13 +24,17 @@ export interface RegulationDetailFromAPI extends RegulationFromAPI {
 
 class RegulationService {
   /**
-   * Pobiera listę wszystkich przepisów prawnych z opcjami sortowania i filtrowania
+   * Pobiera listę przepisów prawnych z opcjami sortowania i filtrowania.
+   * Filtry są wykonywane po stronie serwera - pobieramy tylko potrzebny wycinek
+   * (limit jest przycinany przez backend do QUERY_BUDGET['MAX_LIMIT']).
    */
   async getAllRegulations(options?: {
     sortBy?: 'date' | 'created_at'
     sortOrder?: 'asc' | 'desc'
     dateFrom?: string
     dateTo?: string
+    status?: 'active' | 'withdrawn'
+    search?: string
     limit?: number
   }): Promise<RegulationFromAPI[]> {
     try {
@@ -47,6 +52,14 @@ class RegulationService {
         params.append('planowany_termin_wydania_data__lte', options.dateTo)
       }
       
+      if (options?.status) {
+        params.append('status', options.status)
+      }
+      
+      if (options?.search?.trim()) {
+        params.append('q', options.search.trim())
+      }
+      
       if (options?.limit) {
         params.append('limit', options.limit.toString())
       }
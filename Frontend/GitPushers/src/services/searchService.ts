@@ -0,0 +1,69 @@
+import apiClient, { handleApiError } from '../api/api';
+import type { AxiosResponse } from 'axios';
+
+export type SearchSourceName = 'drugs' | 'drug_events' | 'regulations' | 'news';
+
+export interface SearchHit {
+  type: SearchSourceName;
+  id: number;
+  title: string;
+  snippet: string;
+  date: string | null;
+  score: number;
+}
+
+export interface SearchSourceStatus {
+  status: 'ok' | 'timeout' | 'error' | 'unauthorized';
+  count: number;
+  took_ms: number | null;
+}
+
+export interface SearchResponse {
+  query: string;
+  count: number;
+  page: number;
+  page_size: number;
+  next_page: number | null;
+  results: SearchHit[];
+  sources: Partial<Record<SearchSourceName, SearchSourceStatus>>;
+}
+
+class SearchService {
+  // Jedno zapytanie zamiast osobnych wyszukiwań leków, zdarzeń, przepisów i newsów
+  async search(query: string, options?: {
+    types?: SearchSourceName[];
+    page?: number;
+    pageSize?: number;
+  }): Promise<SearchResponse> {
+    try {
+      const params = new URLSearchParams({ q: query.trim() });
+
+      if (options?.types?.length) {
+        params.append('types', options.types.join(','));
+      }
+
+      if (options?.page) {
+        params.append('page', options.page.toString());
+      }
+
+      if (options?.pageSize) {
+        params.append('page_size', options.pageSize.toString());
+      }
+
+      const response: AxiosResponse<SearchResponse> = await apiClient.get(`/search/?${params.toString()}`);
+      return response.data;
+    } catch (error) {
+      const errorMessage = handleApiError(error);
+      throw new Error(errorMessage);
+    }
+  }
+
+  // Źródła, które nie odpowiedziały w swoim limicie czasu
+  getIncompleteSources(response: SearchResponse): SearchSourceName[] {
+    return (Object.keys(response.sources) as SearchSourceName[]).filter(
+      (name) => ['timeout', 'error'].includes(response.sources[name]?.status ?? '')
+    );
+  }
+}
+
+export const searchService = new SearchService();